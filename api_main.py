@@ -2,16 +2,43 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from application.services import (
+    AsyncProgressQueryService,
+    AsyncTaskCommandService,
+    ProgressStreamService,
+)
+from interfaces.api.metrics import RequestLatencyMiddleware, router as metrics_router
 from interfaces.api.routes import router as tasks_router
 from logging_config import configure_logging
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Services, and the Celery app behind them, are built when serving starts
+    # so importing the API stays cheap.
+    task_service = AsyncTaskCommandService()
+    stream_service = ProgressStreamService()
+    app.state.task_service = task_service
+    app.state.progress_stream_service = stream_service
+    app.state.progress_service = AsyncProgressQueryService(
+        task_service, stream_service=stream_service
+    )
+    yield
+    await stream_service.aclose()
+    await task_service.aclose()
+
+
 def create_app() -> FastAPI:
     configure_logging()
-    app = FastAPI(title="Text Processing Backend", version="0.1.0")
+    app = FastAPI(title="Text Processing Backend", version="0.1.0", lifespan=lifespan)
+    app.add_middleware(RequestLatencyMiddleware)
     app.include_router(tasks_router, prefix="/api")
+    app.include_router(metrics_router)
 
     @app.get("/health", tags=["health"])
     def health_check() -> dict[str, str]:
@@ -26,4 +53,5 @@ app = create_app()
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Without a config of its own uvicorn logs through the queued root handler.
+    uvicorn.run(app, host="0.0.0.0", port=8000, log_config=None)
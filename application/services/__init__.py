@@ -2,7 +2,24 @@
 
 from __future__ import annotations
 
-from .progress_service import ProgressQueryService
-from .task_service import TaskCommandService
+from .admission import AdmissionController, SubmissionRejectedError
+from .progress_service import AsyncProgressQueryService
+from .progress_stream import ProgressStreamService
+from .result_cache import ArchiveMissCache, TerminalResultCache
+from .task_service import (
+    AsyncTaskCommandService,
+    TaskCommandService,
+    TaskNotFoundError,
+)
 
-__all__ = ["ProgressQueryService", "TaskCommandService"]
+__all__ = [
+    "AdmissionController",
+    "ArchiveMissCache",
+    "AsyncProgressQueryService",
+    "AsyncTaskCommandService",
+    "ProgressStreamService",
+    "SubmissionRejectedError",
+    "TaskCommandService",
+    "TaskNotFoundError",
+    "TerminalResultCache",
+]
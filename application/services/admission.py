@@ -0,0 +1,175 @@
+"""Admission control shedding submissions before the backlog grows unbounded."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from celery import Celery
+
+from infrastructure.celery.app import get_celery_application, get_celery_config
+from infrastructure.celery.backlog import BACKLOG_READ_ERRORS, queue_depths
+from infrastructure.metrics import count_rejection
+from infrastructure.redis import InFlightTaskCounter
+
+from .config import ServiceConfig
+
+logger = logging.getLogger(__name__)
+
+
+class SubmissionRejectedError(Exception):
+    """Raised when a submission must be retried later."""
+
+    def __init__(self, reason: str, retry_after: float) -> None:
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class BacklogSnapshot:
+    """Work accepted but not finished: waiting in the broker or running."""
+
+    queued: int
+    running: int
+
+    @property
+    def in_flight(self) -> int:
+        return self.queued + self.running
+
+
+class TokenBucketLimiter:
+    """Thread-safe per-client token buckets refilled at ``rate`` per second.
+
+    Only the ``max_clients`` most recently seen clients keep a bucket; an
+    evicted client starts again with a full burst.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        max_clients: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._rate = rate
+        self._burst = max(1, burst)
+        self._max_clients = max_clients
+        self._clock = clock
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._rate > 0
+
+    def acquire(self, client_id: str) -> float:
+        """Take a token; return ``0`` on success, else seconds until one is free."""
+        if not self.enabled:
+            return 0.0
+        now = self._clock()
+        with self._lock:
+            tokens, updated_at = self._buckets.pop(client_id, (self._burst, now))
+            tokens = min(self._burst, tokens + (now - updated_at) * self._rate)
+            wait = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / self._rate
+            self._buckets[client_id] = (tokens, now)
+            while len(self._buckets) > self._max_clients:
+                self._buckets.popitem(last=False)
+        return wait
+
+
+class AdmissionController:
+    """Decide whether a new submission may be enqueued.
+
+    Backlog readings cost a broker round-trip per queue plus one Redis read, so
+    they are cached for ``admission_cache_seconds`` and shared by all callers.
+    When they cannot be read, submissions are admitted and the failure logged.
+    """
+
+    def __init__(
+        self,
+        config: ServiceConfig | None = None,
+        celery_app: Celery | None = None,
+        in_flight: InFlightTaskCounter | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._config = config or ServiceConfig()
+        self._celery_app = celery_app or get_celery_application()
+        self._in_flight = in_flight or InFlightTaskCounter()
+        self._clock = clock
+        self._limiter = TokenBucketLimiter(
+            rate=self._config.client_rate_limit,
+            burst=self._config.client_rate_burst,
+            max_clients=self._config.client_rate_max_clients,
+            clock=clock,
+        )
+        self._lock = threading.Lock()
+        self._snapshot: BacklogSnapshot | None = None
+        self._expires_at = 0.0
+
+    @property
+    def backlog_limited(self) -> bool:
+        return (
+            self._config.admission_max_queue_depth > 0
+            or self._config.admission_max_in_flight > 0
+        )
+
+    def admit(self, client_id: str | None = None) -> None:
+        """Raise :class:`SubmissionRejectedError` if the submission must wait."""
+        self.limit_rate(client_id)
+        snapshot = self.backlog() if self.backlog_limited else None
+        if snapshot is None:
+            return
+        max_queued = self._config.admission_max_queue_depth
+        max_in_flight = self._config.admission_max_in_flight
+        if max_queued > 0 and snapshot.queued >= max_queued:
+            count_rejection("queue_depth")
+            raise SubmissionRejectedError(
+                "Task queue is full", self._config.admission_retry_after
+            )
+        if max_in_flight > 0 and snapshot.in_flight >= max_in_flight:
+            count_rejection("in_flight")
+            raise SubmissionRejectedError(
+                "Too many tasks in flight", self._config.admission_retry_after
+            )
+
+    def limit_rate(self, client_id: str | None = None) -> None:
+        """Take a token from the client's bucket, or raise if it has none.
+
+        Work answered inside the API skips the backlog limits but not this.
+        """
+        if client_id is None:
+            return
+        wait = self._limiter.acquire(client_id)
+        if wait > 0:
+            count_rejection("client_rate")
+            raise SubmissionRejectedError("Client rate limit exceeded", wait)
+
+    def backlog(self) -> BacklogSnapshot | None:
+        """Return the cached backlog, or ``None`` when it could not be read."""
+        with self._lock:
+            now = self._clock()
+            if now < self._expires_at:
+                return self._snapshot
+            # Failed reads are cached too, so an outage is not retried per call.
+            self._expires_at = now + self._config.admission_cache_seconds
+            try:
+                queue_names = [queue.name for queue in get_celery_config().queues]
+                depths = queue_depths(self._celery_app, queue_names)
+                running = self._in_flight.total()
+            except BACKLOG_READ_ERRORS as exc:
+                logger.warning("Failed to read the task backlog: %s", str(exc))
+                self._snapshot = None
+            else:
+                self._snapshot = BacklogSnapshot(
+                    queued=sum(depths.values()), running=running
+                )
+            return self._snapshot
@@ -0,0 +1,43 @@
+"""Service-layer configuration using a class-based approach."""
+
+from __future__ import annotations
+
+import os
+
+from infrastructure.env import float_env, int_env
+
+
+class ServiceConfig:
+    """Configuration class for application services."""
+
+    def __init__(self) -> None:
+        self.batch_max_size = int_env("TASK_BATCH_MAX_SIZE", 10_000)
+        self.lookup_batch_max_size = int_env("TASK_LOOKUP_BATCH_MAX_SIZE", 5_000)
+        self.result_cache_max_bytes = int_env("RESULT_CACHE_MAX_BYTES", 64 * 2**20)
+        self.result_cache_ttl_seconds = float_env("RESULT_CACHE_TTL_SECONDS", 600.0)
+        # Ids missing from the result archive are not looked up again for this
+        # long, so polling a pending task does not query the archive each time.
+        self.archive_miss_ttl_seconds = float_env("RESULT_ARCHIVE_MISS_TTL", 5.0)
+        self.quick_analysis_inline_max_chars = int_env(
+            "QUICK_ANALYSIS_INLINE_MAX_CHARS", 100_000
+        )
+        self.quick_analysis_batch_max_size = int_env(
+            "QUICK_ANALYSIS_BATCH_MAX_SIZE", 50_000
+        )
+        # Submissions are refused with 429 once the backlog passes these limits;
+        # 0 disables a limit. Backlog readings are reused for the cache period.
+        self.admission_max_queue_depth = int_env("ADMISSION_MAX_QUEUE_DEPTH", 10_000)
+        self.admission_max_in_flight = int_env("ADMISSION_MAX_IN_FLIGHT", 0)
+        self.admission_cache_seconds = float_env("ADMISSION_CACHE_SECONDS", 1.0)
+        self.admission_retry_after = float_env("ADMISSION_RETRY_AFTER", 5.0)
+        self.client_rate_limit = float_env("CLIENT_RATE_LIMIT", 0.0)
+        self.client_rate_burst = int_env("CLIENT_RATE_BURST", 20)
+        self.client_rate_max_clients = int_env("CLIENT_RATE_MAX_CLIENTS", 10_000)
+        self.client_id_header = os.getenv("CLIENT_ID_HEADER", "X-Client-Id")
+        # Long-polled status requests are held at most this long; without pushed
+        # progress events the backend is re-read at the poll interval meanwhile.
+        self.status_max_wait_seconds = float_env("STATUS_MAX_WAIT_SECONDS", 30.0)
+        self.status_wait_poll_interval = float_env("STATUS_WAIT_POLL_INTERVAL", 0.5)
+        # Progress WebSockets re-read the backend after this many seconds without
+        # a pushed event, covering events lost while the listener reconnects.
+        self.progress_heartbeat_seconds = float_env("PROGRESS_WS_HEARTBEAT", 15.0)
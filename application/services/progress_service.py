@@ -2,49 +2,269 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Sequence
 from typing import Any
 
-from domain.progress import NOT_FOUND_STATE, build_progress_state
+from domain.progress import (
+    NOT_FOUND_STATE,
+    build_group_progress_state,
+    build_progress_state,
+    is_terminal_state,
+    progress_etag,
+)
+from domain.text_processing import InvalidInputError
+from infrastructure.celery.results import RESULT_READ_ERRORS
+from infrastructure.redis import TaskProfileStore
+from infrastructure.storage import LocalBlobStore, unpack_result
 
-from .task_service import TaskCommandService
+from .config import ServiceConfig
+from .progress_stream import ProgressStreamService
+from .result_cache import TerminalResultCache
+from .task_service import AsyncTaskCommandService
 
 logger = logging.getLogger(__name__)
 
+GROUP_NOT_FOUND_STATE: dict[str, Any] = {
+    **NOT_FOUND_STATE,
+    "status": "Task group not found",
+}
 
-class ProgressQueryService:
-    """Read model exposing task progress and results."""
 
-    def __init__(self, task_service: TaskCommandService | None = None) -> None:
-        self._task_service = task_service or TaskCommandService()
+class AsyncProgressQueryService:
+    """Asyncio read model exposing task progress and results."""
 
-    def get_progress_update(self, task_id: str) -> dict[str, Any]:
+    def __init__(
+        self,
+        task_service: AsyncTaskCommandService | None = None,
+        config: ServiceConfig | None = None,
+        blob_store: LocalBlobStore | None = None,
+        profile_store: TaskProfileStore | None = None,
+        stream_service: ProgressStreamService | None = None,
+    ) -> None:
+        self._task_service = task_service or AsyncTaskCommandService()
+        self._config = config or ServiceConfig()
+        self._result_cache = _build_result_cache(self._config)
+        self._blob_store = blob_store or LocalBlobStore()
+        self._profile_store = profile_store or TaskProfileStore()
+        self._stream_service = stream_service
+
+    async def get_progress_update(self, task_id: str) -> dict[str, Any]:
         """Return the progress payload for the given task."""
-        task_result = self._task_service.get_task_result(task_id)
-        if not task_result:
-            return {**NOT_FOUND_STATE}
-        return build_progress_state(task_result.state, task_result.info)
+        return _without_result((await self._get_outputs([task_id]))[task_id])
 
-    def get_task_output(self, task_id: str) -> dict[str, Any]:
-        """Return task completion payload along with result data if available."""
-        task_result = self._task_service.get_task_result(task_id)
-        if not task_result:
-            return {**NOT_FOUND_STATE}
+    async def wait_for_progress_update(
+        self, task_id: str, known_etag: str | None, timeout: float
+    ) -> dict[str, Any]:
+        """Return the progress payload once it differs from ``known_etag``.
 
-        payload = build_progress_state(task_result.state, task_result.info)
-        if payload["state"] != "SUCCESS":
+        Without ``known_etag`` the payload at the time of the call is the
+        baseline. After ``timeout`` seconds, capped by the configured maximum,
+        the unchanged payload is returned. Pushed progress events wake the wait
+        when they are enabled; otherwise the backend is re-read periodically.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + min(timeout, self._config.status_max_wait_seconds)
+        stream = self._stream_service
+        if stream is None or not stream.enabled:
+            payload = await self.get_progress_update(task_id)
+            known_etag = known_etag or progress_etag(payload)
+            while _unchanged(payload, known_etag):
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                await asyncio.sleep(
+                    min(remaining, self._config.status_wait_poll_interval)
+                )
+                payload = await self.get_progress_update(task_id)
             return payload
 
+        # Subscribe before reading the snapshot so no event can slip in between.
+        async with stream.subscribe(task_id) as updates:
+            payload = await self.get_progress_update(task_id)
+            known_etag = known_etag or progress_etag(payload)
+            while _unchanged(payload, known_etag):
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    payload = await asyncio.wait_for(updates.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+        return payload
+
+    async def get_task_output(
+        self, task_id: str, include_original: bool = False
+    ) -> dict[str, Any]:
+        """Return task completion payload along with result data if available."""
+        try:
+            payload = (await self._get_outputs([task_id]))[task_id]
+        except RESULT_READ_ERRORS as exc:
+            logger.exception("Failed to fetch task result for task_id=%s", task_id)
+            return _load_failure(exc)
+        if include_original:
+            return await asyncio.to_thread(_with_original, payload, self._blob_store)
+        return _without_original(payload)
+
+    async def get_task_view(
+        self, task_id: str, include_original: bool = False
+    ) -> dict[str, Any]:
+        """Return progress, result and polling hints for a task in one payload."""
+        payload = await self.get_task_output(task_id, include_original)
+        return _task_view(task_id, payload)
+
+    async def get_progress_updates(
+        self, task_ids: Sequence[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Return progress payloads for many tasks from one backend read."""
+        unique_ids = _unique_task_ids(task_ids, self._config.lookup_batch_max_size)
+        outputs = await self._get_outputs(unique_ids)
+        return {task_id: _without_result(outputs[task_id]) for task_id in unique_ids}
+
+    async def get_task_outputs(
+        self, task_ids: Sequence[str], include_original: bool = False
+    ) -> dict[str, dict[str, Any]]:
+        """Return completion payloads for many tasks from one backend read."""
+        unique_ids = _unique_task_ids(task_ids, self._config.lookup_batch_max_size)
         try:
-            payload["result"] = task_result.get()
-        except Exception as exc:
-            logger.error(
-                "Failed to fetch task result for task_id=%s: %s",
-                task_id,
-                str(exc),
-                exc_info=True,
+            outputs = await self._get_outputs(unique_ids)
+        except RESULT_READ_ERRORS as exc:
+            logger.exception("Failed to fetch results of %s tasks", len(unique_ids))
+            failure = _load_failure(exc)
+            return {task_id: dict(failure) for task_id in unique_ids}
+        if include_original:
+            return await asyncio.to_thread(
+                lambda: {
+                    task_id: _with_original(payload, self._blob_store)
+                    for task_id, payload in outputs.items()
+                }
             )
-            payload["state"] = "ERROR"
-            payload["progress"] = 0
-            payload["status"] = f"Failed to load result: {exc}"
+        return {
+            task_id: _without_original(payload) for task_id, payload in outputs.items()
+        }
+
+    async def get_group_progress(self, group_id: str) -> dict[str, Any]:
+        """Return aggregate progress over every task of a submitted batch."""
+        group_result = await self._task_service.get_group_result(group_id)
+        if not group_result:
+            return {**GROUP_NOT_FOUND_STATE}
+
+        child_ids = [child.id for child in group_result.results]
+        outputs = await self._get_outputs(child_ids)
+        child_states = [outputs[child_id] for child_id in child_ids]
+        return {"group_id": group_id, **build_group_progress_state(child_states)}
+
+    def cache_stats(self) -> dict[str, int]:
+        """Return counters of the finished-result cache."""
+        return self._result_cache.stats()
+
+    async def get_task_profile(self, task_id: str) -> dict[str, Any] | None:
+        """Return the hot-function summary of a profiled run, if one was captured."""
+        summary = await asyncio.to_thread(self._profile_store.load_summary, task_id)
+        return {"task_id": task_id, **summary} if summary is not None else None
+
+    async def get_task_profile_dump(self, task_id: str) -> bytes | None:
+        """Return the raw ``pstats`` dump of a profiled run."""
+        return await asyncio.to_thread(self._profile_store.load_raw, task_id)
+
+    async def _get_outputs(
+        self, task_ids: Sequence[str]
+    ) -> dict[str, dict[str, Any]]:
+        outputs, missing = self._result_cache.get_many(task_ids)
+        if missing:
+            metas = await self._task_service.get_task_metas(missing)
+            outputs.update(_outputs_from_metas(self._result_cache, missing, metas))
+        return outputs
+
+
+def _build_result_cache(config: ServiceConfig) -> TerminalResultCache:
+    return TerminalResultCache(
+        max_bytes=config.result_cache_max_bytes,
+        ttl_seconds=config.result_cache_ttl_seconds,
+    )
+
+
+def _unique_task_ids(task_ids: Sequence[str], max_size: int) -> list[str]:
+    unique_ids = list(dict.fromkeys(task_ids))
+    if not unique_ids:
+        raise InvalidInputError("Task ids cannot be empty")
+    if len(unique_ids) > max_size:
+        raise InvalidInputError(f"Cannot look up more than {max_size} tasks")
+    return unique_ids
+
+
+def _outputs_from_metas(
+    result_cache: TerminalResultCache,
+    task_ids: Sequence[str],
+    metas: Sequence[dict[str, Any] | None],
+) -> dict[str, dict[str, Any]]:
+    outputs: dict[str, dict[str, Any]] = {}
+    for task_id, meta in zip(task_ids, metas, strict=True):
+        payload = _output_from_meta(meta)
+        result_cache.put(task_id, payload)
+        outputs[task_id] = payload
+    return outputs
+
+
+def _output_from_meta(meta: dict[str, Any] | None) -> dict[str, Any]:
+    if meta is None:
+        return build_progress_state("PENDING", None)
+    payload = build_progress_state(meta.get("status"), meta.get("result"))
+    if payload["state"] == "SUCCESS":
+        result = meta.get("result")
+        if isinstance(result, dict):
+            result = unpack_result(result)
+        payload["result"] = result
+    return payload
+
+
+def _without_original(payload: dict[str, Any]) -> dict[str, Any]:
+    result = payload.get("result")
+    if not isinstance(result, dict) or "original_text" not in result:
+        return payload
+    trimmed = {key: value for key, value in result.items() if key != "original_text"}
+    return {**payload, "result": trimmed}
+
+
+def _with_original(
+    payload: dict[str, Any], blob_store: LocalBlobStore
+) -> dict[str, Any]:
+    result = payload.get("result")
+    if not isinstance(result, dict) or not result.get("original_text_ref"):
+        return payload
+    ref = result["original_text_ref"]
+    try:
+        original_text = blob_store.get_text(ref)
+    except KeyError:
+        logger.warning("Original text %s is missing from the blob store", ref)
         return payload
+    return {**payload, "result": {**result, "original_text": original_text}}
+
+
+def _without_result(payload: dict[str, Any]) -> dict[str, Any]:
+    if "result" not in payload:
+        return payload
+    return {key: value for key, value in payload.items() if key != "result"}
+
+
+def _unchanged(payload: dict[str, Any], known_etag: str) -> bool:
+    return progress_etag(payload) == known_etag and not is_terminal_state(
+        payload.get("state")
+    )
+
+
+def _task_view(task_id: str, payload: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "task_id": task_id,
+        **payload,
+        "terminal": is_terminal_state(payload["state"]),
+    }
+
+
+def _load_failure(exc: Exception) -> dict[str, Any]:
+    return {
+        "state": "ERROR",
+        "progress": 0,
+        "status": f"Failed to load result: {exc}",
+    }
@@ -0,0 +1,103 @@
+"""Fan-out of pushed progress events to per-task subscribers."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncIterator
+from typing import Any
+
+from infrastructure.redis import ProgressEventSubscriber
+
+logger = logging.getLogger(__name__)
+
+_RECONNECT_DELAY_SECONDS = 1.0
+_SUBSCRIBE_TIMEOUT_SECONDS = 5.0
+
+
+class ProgressStreamService:
+    """Share one pub/sub connection between every subscribed client.
+
+    A task's channel is subscribed while at least one client watches it.
+    """
+
+    def __init__(self, subscriber: ProgressEventSubscriber | None = None) -> None:
+        self._subscriber = subscriber or ProgressEventSubscriber()
+        self._queues: dict[str, set[asyncio.Queue[dict[str, Any]]]] = {}
+        self._subscribed: dict[str, asyncio.Event] = {}
+        self._listener: asyncio.Task[None] | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._subscriber.enabled
+
+    @contextlib.asynccontextmanager
+    async def subscribe(
+        self, task_id: str
+    ) -> AsyncIterator[asyncio.Queue[dict[str, Any]]]:
+        """Register a queue receiving every event published for ``task_id``.
+
+        Entering waits until the pub/sub subscription is confirmed, so a
+        snapshot read afterwards cannot miss an event. If Redis does not
+        confirm in time the queue is handed out anyway; callers re-read the
+        backend periodically and catch up once the listener reconnects.
+        """
+        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        subscribers = self._queues.get(task_id)
+        if subscribers is None:
+            subscribers = self._queues[task_id] = {queue}
+            subscribed = self._subscribed[task_id] = asyncio.Event()
+            await self._subscriber.subscribe(task_id)
+        else:
+            subscribers.add(queue)
+            subscribed = self._subscribed[task_id]
+        self._ensure_listener()
+        try:
+            try:
+                await asyncio.wait_for(subscribed.wait(), _SUBSCRIBE_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Progress events not subscribed yet for task_id=%s", task_id
+                )
+            yield queue
+        finally:
+            subscribers.discard(queue)
+            if not subscribers and self._queues.get(task_id) is subscribers:
+                del self._queues[task_id]
+                del self._subscribed[task_id]
+                await self._subscriber.unsubscribe(task_id)
+
+    def _ensure_listener(self) -> None:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen_forever())
+
+    def _confirm(self, task_id: str) -> None:
+        subscribed = self._subscribed.get(task_id)
+        if subscribed is not None:
+            subscribed.set()
+
+    async def _listen_forever(self) -> None:
+        while True:
+            for subscribed in self._subscribed.values():
+                subscribed.clear()
+            try:
+                async for task_id, payload in self._subscriber.listen(
+                    self._queues.keys(), self._confirm
+                ):
+                    for queue in self._queues.get(task_id, ()):
+                        queue.put_nowait(payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Progress event listener failed, reconnecting")
+            await asyncio.sleep(_RECONNECT_DELAY_SECONDS)
+
+    async def aclose(self) -> None:
+        """Stop the listener and release the pub/sub connection."""
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        await self._subscriber.close()
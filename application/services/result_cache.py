@@ -0,0 +1,164 @@
+"""In-process cache of finished task payloads."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from domain.progress import is_terminal_state
+
+
+def estimate_payload_size(value: Any) -> int:
+    """Approximate the memory held by a JSON-like payload in bytes."""
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_payload_size(key) + estimate_payload_size(item)
+            for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_payload_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class TerminalResultCache:
+    """Thread-safe LRU of terminal payloads bounded by total size and age.
+
+    Payloads of finished tasks never change, so they can be served without
+    touching the result backend until they are evicted or expire.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, int, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_bytes > 0
+
+    def get_many(
+        self, task_ids: Iterable[str]
+    ) -> tuple[dict[str, dict[str, Any]], list[str]]:
+        """Split ``task_ids`` into cached payloads and ids that must be fetched."""
+        found: dict[str, dict[str, Any]] = {}
+        missing: list[str] = []
+        if not self.enabled:
+            return found, list(task_ids)
+
+        now = self._clock()
+        with self._lock:
+            for task_id in task_ids:
+                entry = self._entries.get(task_id)
+                if entry is not None and entry[0] <= now:
+                    self._discard(task_id)
+                    entry = None
+                if entry is None:
+                    self._misses += 1
+                    missing.append(task_id)
+                    continue
+                self._hits += 1
+                self._entries.move_to_end(task_id)
+                found[task_id] = dict(entry[2])
+        return found, missing
+
+    def put(self, task_id: str, payload: dict[str, Any]) -> None:
+        """Remember ``payload`` if it describes a finished task and fits the budget."""
+        if not self.enabled or not is_terminal_state(payload.get("state")):
+            return
+        size = estimate_payload_size(payload)
+        if size > self._max_bytes:
+            return
+
+        expires_at = self._clock() + self._ttl_seconds
+        with self._lock:
+            self._discard(task_id)
+            self._entries[task_id] = (expires_at, size, dict(payload))
+            self._size += size
+            while self._size > self._max_bytes:
+                oldest_id = next(iter(self._entries))
+                self._discard(oldest_id)
+                self._evictions += 1
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and current occupancy."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self._max_bytes,
+            }
+
+    def _discard(self, task_id: str) -> None:
+        entry = self._entries.pop(task_id, None)
+        if entry is not None:
+            self._size -= entry[1]
+
+
+class ArchiveMissCache:
+    """Thread-safe, bounded memory of ids the result archive did not have.
+
+    A pending task has neither backend state nor an archived result, so each
+    poll of it would otherwise query the archive. Results are archived long
+    after they were stored in the backend, so an id missing from both cannot
+    appear in the archive within the short ``ttl_seconds``.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._expiry: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl_seconds > 0 and self._max_entries > 0
+
+    def unknown(self, task_ids: Iterable[str]) -> list[str]:
+        """Return the ids without a recent miss, which are worth looking up."""
+        if not self.enabled:
+            return list(task_ids)
+        now = self._clock()
+        with self._lock:
+            return [
+                task_id
+                for task_id in task_ids
+                if self._expiry.get(task_id, now) <= now
+            ]
+
+    def add(self, task_ids: Iterable[str]) -> None:
+        """Remember that the archive has none of ``task_ids``."""
+        if not self.enabled:
+            return
+        expires_at = self._clock() + self._ttl_seconds
+        with self._lock:
+            for task_id in task_ids:
+                self._expiry.pop(task_id, None)
+                self._expiry[task_id] = expires_at
+            while len(self._expiry) > self._max_entries:
+                self._expiry.popitem(last=False)
@@ -2,44 +2,397 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Sequence
+from typing import Any
 
-from celery.result import AsyncResult
+from celery import Celery, group
+from celery.result import AsyncResult, GroupResult
+from celery.utils import uuid
 
-from domain.text_processing import validate_text_input
-from infrastructure.celery.app import get_celery_application
-from infrastructure.celery.tasks import process_text_task, quick_analysis_task
+from domain.progress import is_failed_state, is_terminal_state
+from domain.text_processing import (
+    DEFAULT_PROCESSING_STEPS,
+    analyze_text_quick,
+    submission_fingerprint,
+    validate_batch_size,
+    validate_idempotency_key,
+    validate_text_batch,
+    validate_text_input,
+)
+from infrastructure.celery.app import get_celery_application, get_celery_config
+from infrastructure.celery.publishing import PROFILE_HEADER
+from infrastructure.celery.results import fetch_task_metas, fill_from_archive
+from infrastructure.celery.routing import (
+    PROCESS_TEXT_TASK,
+    QUICK_ANALYSIS_BATCH_TASK,
+    QUICK_ANALYSIS_TASK,
+)
+from infrastructure.redis import (
+    AsyncTaskMetaReader,
+    TaskCancellationFlags,
+    TaskSubmissionRegistry,
+)
+from infrastructure.storage import SQLiteResultArchive
+
+from .admission import AdmissionController
+from .config import ServiceConfig
+from .result_cache import ArchiveMissCache
 
 logger = logging.getLogger(__name__)
 
 
+class TaskNotFoundError(LookupError):
+    """Raised when a task id was never issued or has been forgotten."""
+
+
 class TaskCommandService:
-    """Facade offering task orchestration commands."""
+    """Facade offering task orchestration commands.
+
+    Tasks are published by name, so processes that only submit work never
+    import the worker task module.
+    """
 
-    def __init__(self):
+    def __init__(
+        self,
+        config: ServiceConfig | None = None,
+        submissions: TaskSubmissionRegistry | None = None,
+        cancellations: TaskCancellationFlags | None = None,
+        admission: AdmissionController | None = None,
+        result_archive: SQLiteResultArchive | None = None,
+    ) -> None:
         self._celery_app = get_celery_application()
+        self._config = config or ServiceConfig()
+        self._submissions = submissions or TaskSubmissionRegistry()
+        self._cancellations = cancellations or TaskCancellationFlags()
+        self._admission = admission or AdmissionController(
+            self._config, self._celery_app
+        )
+        self._result_archive = result_archive or SQLiteResultArchive()
 
-    def start_text_processing(self, text: str) -> str:
-        """Submit the long-running text processing workflow."""
+    @property
+    def celery_app(self) -> Celery:
+        return self._celery_app
+
+    def start_text_processing(
+        self,
+        text: str,
+        idempotency_key: str | None = None,
+        profile: bool = False,
+        client_id: str | None = None,
+    ) -> str:
+        """Submit the long-running text processing workflow.
+
+        Identical text submitted under the same processor configuration, or a
+        repeated ``idempotency_key``, returns the id of the task already running
+        or finished for it unless that task failed. ``profile`` runs a fresh
+        task under the profiler instead. Raises :class:`SubmissionRejectedError` when
+        admission control turns new work away; resubmissions are never refused.
+        """
         validated_text = validate_text_input(text)
-        task = process_text_task.delay(validated_text)
-        return task.id
+        if profile:
+            self._admission.admit(client_id)
+            task = self._celery_app.send_task(
+                PROCESS_TEXT_TASK,
+                args=(validated_text,),
+                headers={PROFILE_HEADER: True},
+            )
+            self._submissions.mark_submitted([task.id])
+            return task.id
+        celery_config = get_celery_config()
+        settings = {
+            "steps": DEFAULT_PROCESSING_STEPS,
+            "chunk_size": celery_config.chunk_size,
+            "shard_threshold": celery_config.shard_threshold,
+            "shard_size": celery_config.shard_size,
+        }
+        return self._submit_once(
+            PROCESS_TEXT_TASK, validated_text, settings, idempotency_key, client_id
+        )
 
-    def start_quick_analysis(self, text: str) -> str:
-        """Submit the quick analysis shortcut."""
+    def start_batch_text_processing(
+        self, texts: list[str], client_id: str | None = None
+    ) -> tuple[str, list[str]]:
+        """Submit many texts as one Celery group published over a single producer."""
+        validated_texts = validate_text_batch(texts, self._config.batch_max_size)
+        self._admission.admit(client_id)
+        signatures = (
+            self._celery_app.signature(PROCESS_TEXT_TASK, args=(text,))
+            for text in validated_texts
+        )
+        group_result = group(signatures).apply_async()
+        # Persist membership so progress can be aggregated from the group id alone.
+        group_result.save()
+        child_ids = [child.id for child in group_result.results]
+        self._submissions.mark_submitted(child_ids)
+        return group_result.id, child_ids
+
+    def start_quick_analysis(
+        self,
+        text: str,
+        idempotency_key: str | None = None,
+        client_id: str | None = None,
+    ) -> str:
+        """Submit the quick analysis shortcut, reusing an identical submission."""
+        validated_text = validate_text_input(text)
+        return self._submit_once(
+            QUICK_ANALYSIS_TASK, validated_text, {}, idempotency_key, client_id
+        )
+
+    def run_quick_analysis_inline(
+        self, text: str, client_id: str | None = None
+    ) -> dict[str, Any] | None:
+        """Analyse small texts in-process; ``None`` means the text needs a worker.
+
+        Inline work is charged to the client's rate limit like a submission.
+        """
         validated_text = validate_text_input(text)
-        task = quick_analysis_task.delay(validated_text)
+        if len(validated_text) > self._config.quick_analysis_inline_max_chars:
+            return None
+        self._admission.limit_rate(client_id)
+        return analyze_text_quick(validated_text)
+
+    def start_batch_quick_analysis(
+        self, texts: list[str], client_id: str | None = None
+    ) -> str:
+        """Submit the quick analysis of many texts as one vectorised task.
+
+        Blank texts are answered per item by the task instead of failing the
+        batch.
+        """
+        validated_texts = validate_batch_size(
+            texts, self._config.quick_analysis_batch_max_size
+        )
+        self._admission.admit(client_id)
+        task = self._celery_app.send_task(
+            QUICK_ANALYSIS_BATCH_TASK, args=(validated_texts,)
+        )
+        self._submissions.mark_submitted([task.id])
         return task.id
 
+    def run_batch_quick_analysis_inline(
+        self, texts: list[str], client_id: str | None = None
+    ) -> dict[str, Any] | None:
+        """Analyse small batches in-process; ``None`` means they need a worker.
+
+        Inline work is charged to the client's rate limit like a submission.
+        """
+        validated_texts = validate_batch_size(
+            texts, self._config.quick_analysis_batch_max_size
+        )
+        total_chars = sum(len(text) for text in validated_texts)
+        if total_chars > self._config.quick_analysis_inline_max_chars:
+            return None
+        self._admission.limit_rate(client_id)
+        # NumPy is loaded by the first inline batch rather than at API startup.
+        from domain.batch_analysis import analyze_quick_batch  # noqa: PLC0415
+
+        return analyze_quick_batch(validated_texts)
+
+    def cancel_task(self, task_id: str) -> bool:
+        """Cancel a task; ``False`` means it had already finished.
+
+        Queued tasks are revoked and discarded by the worker that receives
+        them. Running tasks see the cancellation flag between processing steps
+        and stop, freeing their worker slot. Raises :class:`TaskNotFoundError`
+        for an id that is neither stored, archived nor recently submitted.
+        """
+        meta = self.get_task_metas([task_id])[0]
+        if meta is None and not self._submissions.was_submitted(task_id):
+            raise TaskNotFoundError(task_id)
+        if is_terminal_state(meta.get("status") if meta else None):
+            return False
+        self._cancellations.request(task_id)
+        self._celery_app.control.revoke(task_id)
+        logger.info("Cancellation requested for task %s", task_id)
+        return True
+
     def get_task_result(self, task_id: str) -> AsyncResult | None:
         """Access the raw Celery result."""
         try:
             return AsyncResult(task_id, app=self._celery_app)
-        except Exception as exc:
-            logger.error(
-                "Failed to retrieve task result for task_id=%s: %s",
-                task_id,
-                str(exc),
-                exc_info=True,
-            )
+        except Exception:
+            logger.exception("Failed to retrieve task result for task_id=%s", task_id)
+            return None
+
+    def get_task_metas(self, task_ids: Sequence[str]) -> list[dict[str, Any] | None]:
+        """Read stored metadata for many tasks in a single backend round-trip.
+
+        Tasks whose results were moved out of the backend are read back from
+        the result archive.
+        """
+        metas = fetch_task_metas(self._celery_app, task_ids)
+        return self.fill_archived_metas(task_ids, metas)
+
+    def fill_archived_metas(
+        self, task_ids: Sequence[str], metas: Sequence[dict[str, Any] | None]
+    ) -> list[dict[str, Any] | None]:
+        """Complete backend metadata with results found in the archive."""
+        return fill_from_archive(
+            self._celery_app, self._result_archive, task_ids, metas
+        )
+
+    def get_group_result(self, group_id: str) -> GroupResult | None:
+        """Restore a saved Celery group, or ``None`` when it is unknown."""
+        try:
+            return GroupResult.restore(group_id, app=self._celery_app)
+        except Exception:
+            logger.exception("Failed to restore task group for group_id=%s", group_id)
             return None
+
+    def _submit_once(
+        self,
+        task_name: str,
+        text: str,
+        settings: dict[str, Any],
+        idempotency_key: str | None,
+        client_id: str | None,
+    ) -> str:
+        if idempotency_key is not None:
+            key = f"{task_name}:key:{validate_idempotency_key(idempotency_key)}"
+        else:
+            fingerprint = submission_fingerprint(task_name, text, settings)
+            key = f"{task_name}:sha256:{fingerprint}"
+
+        task_id = uuid()
+        existing_id = self._submissions.claim(key, task_id)
+        if existing_id is not None:
+            meta = self.get_task_metas([existing_id])[0]
+            if not is_failed_state(meta.get("status") if meta else None):
+                logger.info("Reusing task %s for submission %s", existing_id, key)
+                return existing_id
+            self._submissions.reassign(key, task_id)
+
+        # Only new work is admitted; resubmissions above cost no token.
+        try:
+            self._admission.admit(client_id)
+            self._celery_app.send_task(task_name, args=(text,), task_id=task_id)
+        except Exception:
+            self._submissions.release(key, task_id)
+            raise
+        self._submissions.mark_submitted([task_id])
+        return task_id
+
+
+class AsyncTaskCommandService:
+    """Asyncio facade over :class:`TaskCommandService` for the API event loop.
+
+    Metadata reads go through a non-blocking Redis client; broker publishes,
+    which have no asyncio client, are handed to worker threads.
+    """
+
+    def __init__(
+        self,
+        task_service: TaskCommandService | None = None,
+        meta_reader: AsyncTaskMetaReader | None = None,
+        archive_misses: ArchiveMissCache | None = None,
+    ) -> None:
+        self._task_service = task_service or TaskCommandService()
+        self._meta_reader = meta_reader or AsyncTaskMetaReader(
+            self._task_service.celery_app
+        )
+        self._archive_misses = archive_misses or ArchiveMissCache(
+            ServiceConfig().archive_miss_ttl_seconds
+        )
+
+    @property
+    def task_service(self) -> TaskCommandService:
+        return self._task_service
+
+    async def start_text_processing(
+        self,
+        text: str,
+        idempotency_key: str | None = None,
+        profile: bool = False,
+        client_id: str | None = None,
+    ) -> str:
+        """Submit the long-running text processing workflow."""
+        return await asyncio.to_thread(
+            self._task_service.start_text_processing,
+            text,
+            idempotency_key,
+            profile,
+            client_id,
+        )
+
+    async def start_batch_text_processing(
+        self, texts: list[str], client_id: str | None = None
+    ) -> tuple[str, list[str]]:
+        """Submit many texts as one Celery group."""
+        return await asyncio.to_thread(
+            self._task_service.start_batch_text_processing, texts, client_id
+        )
+
+    async def start_quick_analysis(
+        self,
+        text: str,
+        idempotency_key: str | None = None,
+        client_id: str | None = None,
+    ) -> str:
+        """Submit the quick analysis shortcut."""
+        return await asyncio.to_thread(
+            self._task_service.start_quick_analysis, text, idempotency_key, client_id
+        )
+
+    def run_quick_analysis_inline(
+        self, text: str, client_id: str | None = None
+    ) -> dict[str, Any] | None:
+        """Analyse small texts on the event loop; the size limit bounds the work."""
+        return self._task_service.run_quick_analysis_inline(text, client_id)
+
+    async def start_batch_quick_analysis(
+        self, texts: list[str], client_id: str | None = None
+    ) -> str:
+        """Submit the quick analysis of many texts as one vectorised task."""
+        return await asyncio.to_thread(
+            self._task_service.start_batch_quick_analysis, texts, client_id
+        )
+
+    def run_batch_quick_analysis_inline(
+        self, texts: list[str], client_id: str | None = None
+    ) -> dict[str, Any] | None:
+        """Analyse small batches on the event loop; the size limit bounds the work."""
+        return self._task_service.run_batch_quick_analysis_inline(texts, client_id)
+
+    async def cancel_task(self, task_id: str) -> bool:
+        """Cancel a task; ``False`` means it had already finished.
+
+        Raises :class:`TaskNotFoundError` for an unknown id.
+        """
+        return await asyncio.to_thread(self._task_service.cancel_task, task_id)
+
+    async def get_task_metas(
+        self, task_ids: Sequence[str]
+    ) -> list[dict[str, Any] | None]:
+        """Read stored metadata for many tasks without blocking the event loop."""
+        if not self._meta_reader.enabled:
+            return await asyncio.to_thread(self._task_service.get_task_metas, task_ids)
+        metas = await self._meta_reader.get_many(task_ids)
+        missing = self._archive_misses.unknown(
+            task_id
+            for task_id, meta in zip(task_ids, metas, strict=True)
+            if meta is None
+        )
+        if not missing:
+            return metas
+        # Results past the hot window live in the on-disk archive.
+        archived = await asyncio.to_thread(
+            self._task_service.fill_archived_metas, missing, [None] * len(missing)
+        )
+        found = dict(zip(missing, archived, strict=True))
+        self._archive_misses.add(
+            task_id for task_id, meta in found.items() if meta is None
+        )
+        return [
+            found.get(task_id) if meta is None else meta
+            for task_id, meta in zip(task_ids, metas, strict=True)
+        ]
+
+    async def get_group_result(self, group_id: str) -> GroupResult | None:
+        """Restore a saved Celery group, or ``None`` when it is unknown."""
+        return await asyncio.to_thread(self._task_service.get_group_result, group_id)
+
+    async def aclose(self) -> None:
+        """Release the shared Redis connection pool."""
+        await self._meta_reader.close()
@@ -0,0 +1,215 @@
+"""Encode/decode cost of task payloads per codec and payload size.
+
+Every kombu serializer available here (``json``, ``orjson`` and, when the
+package is installed, ``msgpack``) round-trips progress metadata, task
+messages and results of growing size. API payloads are also rendered the way
+FastAPI does by default and with the orjson response class. Run from the
+repository root::
+
+    python -m benchmarks.codec --sizes 1024 65536 1048576
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import string
+import time
+from collections.abc import Callable
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from kombu.exceptions import SerializerNotInstalled
+from kombu.serialization import dumps, loads
+
+from domain.progress import build_progress_state
+from infrastructure.celery.serialization import register_serializers
+from interfaces.api.responses import FastJSONResponse
+from models.task_models import ProgressUpdate
+
+CODECS = ("json", "orjson", "msgpack")
+
+
+def best_of(repeat: int, func: Callable[[], Any]) -> float:
+    """Return the fastest wall-clock time of ``repeat`` calls to ``func``."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def per_call_us(repeat: int, number: int, func: Callable[[], Any]) -> float:
+    """Return microseconds per call, from the best of ``repeat`` batches."""
+
+    def batch() -> None:
+        for _ in range(number):
+            func()
+
+    return round(best_of(repeat, batch) / number * 1e6, 3)
+
+
+def random_text(size: int, seed: int) -> str:
+    rng = random.Random(seed)
+    words = ["".join(rng.choices(string.ascii_lowercase, k=7)) for _ in range(500)]
+    text = " ".join(rng.choices(words, k=size // 8 + 1))
+    return text[:size]
+
+
+def progress_meta() -> dict[str, Any]:
+    return {
+        "current": 12,
+        "total": 40,
+        "progress": 30,
+        "status": "Counting words: 30%",
+        "version": 12,
+    }
+
+
+def task_message(text: str) -> tuple[Any, ...]:
+    """Body of a protocol 2 task message carrying ``text``."""
+    embed = {"callbacks": None, "errbacks": None, "chain": None, "chord": None}
+    return ((text,), {}, embed)
+
+
+def result_meta(text: str) -> dict[str, Any]:
+    """Result backend metadata of a finished processing task."""
+    return {
+        "status": "SUCCESS",
+        "result": {
+            "task_id": "0" * 36,
+            "processed_text": text.upper(),
+            "original_text_ref": "sha256:" + "0" * 64,
+            "word_count": text.count(" ") + 1,
+            "char_count": len(text),
+            "steps_completed": 4,
+        },
+        "traceback": None,
+        "children": [],
+        "date_done": "2026-01-01T00:00:00.000000+00:00",
+        "task_id": "0" * 36,
+    }
+
+
+def available_codecs() -> list[str]:
+    register_serializers()
+    codecs = []
+    for name in CODECS:
+        try:
+            dumps({}, serializer=name)
+        except SerializerNotInstalled:
+            continue
+        codecs.append(name)
+    return codecs
+
+
+def measure_codec(
+    name: str, payload: Any, repeat: int, number: int
+) -> dict[str, float | int]:
+    content_type, content_encoding, encoded = dumps(payload, serializer=name)
+    accept = {content_type}
+
+    def decode() -> Any:
+        return loads(encoded, content_type, content_encoding, accept=accept)
+
+    return {
+        "bytes": len(encoded),
+        "encode_us": per_call_us(
+            repeat, number, lambda: dumps(payload, serializer=name)
+        ),
+        "decode_us": per_call_us(repeat, number, decode),
+    }
+
+
+def measure_response(payload: Any, repeat: int, number: int) -> dict[str, float]:
+    return {
+        # FastAPI's path for a returned dict: jsonable_encoder, then json.dumps.
+        "fastapi_default_us": per_call_us(
+            repeat, number, lambda: JSONResponse(jsonable_encoder(payload)).body
+        ),
+        "json_response_us": per_call_us(
+            repeat, number, lambda: JSONResponse(payload).body
+        ),
+        "fast_json_response_us": per_call_us(
+            repeat, number, lambda: FastJSONResponse(payload).body
+        ),
+    }
+
+
+def measure_progress_path(repeat: int, number: int) -> dict[str, float]:
+    """Compare the progress hot path with and without redundant model work."""
+    meta = progress_meta()
+    update = ProgressUpdate(**meta)
+
+    def read_through_model() -> dict[str, Any]:
+        return {"state": "PROGRESS", **ProgressUpdate(**meta).model_dump()}
+
+    return {
+        "status_read_model_us": per_call_us(repeat, number, read_through_model),
+        "status_read_direct_us": per_call_us(
+            repeat, number, lambda: build_progress_state("PROGRESS", meta)
+        ),
+        "progress_write_copy_us": per_call_us(
+            repeat,
+            number,
+            lambda: update.model_copy(update={"version": 12}).model_dump(),
+        ),
+        "progress_write_dump_us": per_call_us(
+            repeat, number, lambda: {**update.model_dump(), "version": 12}
+        ),
+    }
+
+
+def calls_for(size: int) -> int:
+    return max(5, min(2_000, 2_000_000 // max(size, 1)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1024, 64 * 1024, 1024 * 1024]
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    codecs = available_codecs()
+    payloads: list[tuple[str, int, Any]] = [
+        ("progress_meta", 0, {"status": "PROGRESS", "result": progress_meta()})
+    ]
+    for size in args.sizes:
+        text = random_text(size, args.seed)
+        payloads.append(("task_message", size, task_message(text)))
+        payloads.append(("result_meta", size, result_meta(text)))
+
+    report = []
+    for kind, size, payload in payloads:
+        number = calls_for(size)
+        entry: dict[str, Any] = {
+            "payload": kind,
+            "text_chars": size,
+            "codecs": {
+                name: measure_codec(name, payload, args.repeat, number)
+                for name in codecs
+            },
+        }
+        if kind != "task_message":
+            entry["response"] = measure_response(payload, args.repeat, number)
+        report.append(entry)
+
+    output = {
+        "benchmark": "codec",
+        "python": platform.python_version(),
+        "codecs": codecs,
+        "progress_path": measure_progress_path(args.repeat, 20_000),
+        "payloads": report,
+    }
+    print(json.dumps(output, indent=2))
+
+
+if __name__ == "__main__":
+    main()
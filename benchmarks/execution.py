@@ -0,0 +1,207 @@
+"""Tasks in flight and throughput per worker pool.
+
+Each scenario starts ``worker_main.py`` in a subprocess, submits a burst of
+processing tasks and waits until all of them finished. Worker and client talk
+through kombu's filesystem transport and Celery's file result backend, so no
+Redis is needed. Run from the repository root::
+
+    python -m benchmarks.execution --tasks 128 --step-seconds 0.05
+
+The scenarios are the prefork pool, with one task per process, a thread pool
+in a single process, and the asyncio pool, which awaits the steps of many tasks
+on one event loop in a single process. Each short text runs five steps.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+WORKER_ENVIRONMENT = {
+    "LOG_LEVEL": "WARNING",
+    "METRICS_ENABLED": "0",
+    "PROGRESS_EVENTS_ENABLED": "0",
+    "RESULT_ARCHIVE_INTERVAL": "0",
+    "TASK_CANCEL_TTL": "0",
+    "TASK_IN_FLIGHT_TRACKING": "0",
+    # The reporter writes the first step, so running tasks show up as PROGRESS.
+    "CELERY_PROGRESS_MIN_INTERVAL": "60",
+}
+
+POOLS = ("prefork", "threads", "asyncio")
+
+
+def configure_transport(queue_dir: str) -> Any:
+    """Point the Celery application at the filesystem broker in ``queue_dir``."""
+    from infrastructure.celery.app import get_celery_application
+
+    app = get_celery_application()
+    app.conf.broker_transport_options = {
+        "data_folder_in": queue_dir,
+        "data_folder_out": queue_dir,
+        "control_folder": queue_dir,
+        "store_processed": False,
+        "polling_interval": 0.01,
+    }
+    return app
+
+
+def serve(args: argparse.Namespace) -> None:
+    """Run a worker; invoked in the subprocess of each scenario."""
+    import worker_main
+
+    configure_transport(args.queue_dir)
+    # The short benchmark texts are all routed to the interactive queue.
+    worker_main.main(
+        [
+            "--queues=interactive",
+            f"--pool={args.pool}",
+            f"--concurrency={args.concurrency}",
+            "--loglevel=warning",
+        ]
+    )
+
+
+def wait_all(app: Any, task_ids: list[str], timeout: float) -> dict[str, Any]:
+    """Poll until every task finished; return the most tasks seen running."""
+    deadline = time.monotonic() + timeout
+    pending = set(task_ids)
+    max_running = 0
+    while pending:
+        if time.monotonic() > deadline:
+            raise SystemExit(f"{len(pending)} tasks did not finish in {timeout}s")
+        states = {task_id: app.AsyncResult(task_id).state for task_id in pending}
+        max_running = max(
+            max_running, sum(state == "PROGRESS" for state in states.values())
+        )
+        failed = [task_id for task_id, state in states.items() if state == "FAILURE"]
+        if failed:
+            raise SystemExit(f"Task {failed[0]} failed")
+        pending = {
+            task_id for task_id, state in states.items() if state != "SUCCESS"
+        }
+        time.sleep(0.01)
+    return {"max_running_observed": max_running}
+
+
+def prepare_environment(step_seconds: float) -> Path:
+    """Export the settings shared by the client and every worker."""
+    workdir = Path(tempfile.mkdtemp(prefix="bench-execution-"))
+    for name in ("queue", "results", "blobs"):
+        (workdir / name).mkdir()
+    os.environ.update(
+        {
+            **WORKER_ENVIRONMENT,
+            "CELERY_BROKER_URL": "filesystem://",
+            "CELERY_RESULT_BACKEND": f"file://{workdir / 'results'}",
+            "BLOB_STORE_PATH": str(workdir / "blobs"),
+            "TASK_STEP_SECONDS": str(step_seconds),
+        }
+    )
+    return workdir
+
+
+def run_scenario(
+    app: Any, queue_dir: Path, pool: str, concurrency: int, args: argparse.Namespace
+) -> dict[str, Any]:
+    from infrastructure.celery.routing import PROCESS_TEXT_TASK
+
+    worker = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.execution",
+            "--serve",
+            f"--queue-dir={queue_dir}",
+            f"--pool={pool}",
+            f"--concurrency={concurrency}",
+        ],
+    )
+    try:
+        # One task first, so worker start-up is not part of the measurement.
+        warmup = app.send_task(PROCESS_TEXT_TASK, args=("warm up " * 4,))
+        wait_all(app, [warmup.id], args.timeout)
+
+        started = time.perf_counter()
+        task_ids = [
+            app.send_task(PROCESS_TEXT_TASK, args=(f"document {index} " * 8,)).id
+            for index in range(args.tasks)
+        ]
+        observed = wait_all(app, task_ids, args.timeout)
+        wall_seconds = time.perf_counter() - started
+    finally:
+        worker.terminate()
+        worker.wait(timeout=30)
+
+    return {
+        "pool": pool,
+        "concurrency": concurrency,
+        "worker_processes": concurrency + 1 if pool == "prefork" else 1,
+        "tasks": args.tasks,
+        "wall_seconds": round(wall_seconds, 3),
+        "tasks_per_second": round(args.tasks / wall_seconds, 1),
+        **observed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pools", nargs="+", choices=POOLS)
+    parser.add_argument("--tasks", type=int, default=128)
+    parser.add_argument("--step-seconds", type=float, default=0.05)
+    parser.add_argument(
+        "--prefork-concurrency", type=int, default=os.cpu_count() or 1
+    )
+    parser.add_argument(
+        "--thread-concurrency", type=int, default=64, help="Threads per worker"
+    )
+    parser.add_argument(
+        "--asyncio-concurrency",
+        type=int,
+        default=128,
+        help="Tasks the asyncio worker keeps in flight",
+    )
+    parser.add_argument("--timeout", type=float, default=300.0)
+    # Internal: run the worker of a scenario.
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--queue-dir", help=argparse.SUPPRESS)
+    parser.add_argument("--pool", help=argparse.SUPPRESS)
+    parser.add_argument("--concurrency", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args)
+        return
+
+    queue_dir = prepare_environment(args.step_seconds) / "queue"
+    app = configure_transport(str(queue_dir))
+    results = []
+    for pool in args.pools or POOLS:
+        concurrency = {
+            "prefork": args.prefork_concurrency,
+            "threads": args.thread_concurrency,
+            "asyncio": args.asyncio_concurrency,
+        }[pool]
+        results.append(run_scenario(app, queue_dir, pool, concurrency, args))
+
+    report = {
+        "benchmark": "execution",
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "step_seconds": args.step_seconds,
+        "steps_per_task": 5,
+        "scenarios": results,
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""Load test of the task API against an in-process broker, backend and worker.
+
+The FastAPI app from :func:`api_main.create_app` is driven over ASGI while an
+embedded Celery worker consumes Celery's in-memory transport and stores results
+in the in-memory cache backend, so no Redis is needed. Run from the repository
+root::
+
+    python -m benchmarks.load --concurrency 1 8 32 --output load.json
+
+Processing steps follow the synthetic workload model (``TASK_STEP_SECONDS``,
+``TASK_STEP_JITTER``), which defaults to 10 ms steps here instead of 2 s.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import tempfile
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+STANDALONE_ENVIRONMENT = {
+    "CELERY_BROKER_URL": "memory://",
+    "CELERY_RESULT_BACKEND": "cache+memory://",
+    "LOG_LEVEL": "WARNING",
+    "PROGRESS_EVENTS_ENABLED": "0",
+    "TASK_CANCEL_TTL": "0",
+    "TASK_DEDUP_TTL": "0",
+    "TASK_IN_FLIGHT_TRACKING": "0",
+    "TASK_STEP_SECONDS": "0.01",
+    "TASK_SUBMITTED_TTL": "0",
+}
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of ``values`` (``fraction`` in 0..1)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(fraction * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def summarize(latencies: Sequence[float]) -> dict[str, float | int]:
+    """Return request count and latency percentiles in milliseconds."""
+    return {
+        "requests": len(latencies),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "max_ms": round(max(latencies, default=0.0) * 1000, 3),
+    }
+
+
+async def run_concurrently(
+    concurrency: int, jobs: Sequence[Callable[[], Awaitable[float]]]
+) -> list[float]:
+    """Run ``jobs`` with at most ``concurrency`` in flight; return their results."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(job: Callable[[], Awaitable[float]]) -> float:
+        async with semaphore:
+            return await job()
+
+    return await asyncio.gather(*(run(job) for job in jobs))
+
+
+class LoadTest:
+    """Scenarios measured against one ASGI client."""
+
+    def __init__(self, client: Any, poll_interval: float) -> None:
+        self._client = client
+        self._poll_interval = poll_interval
+        self._sequence = 0
+
+    def _next_text(self) -> str:
+        # Distinct texts keep every submission a separate task.
+        self._sequence += 1
+        return f"benchmark document {self._sequence} " + "lorem ipsum " * 20
+
+    async def _timed(self, method: str, url: str, **kwargs: Any) -> tuple[float, Any]:
+        started = time.perf_counter()
+        response = await self._client.request(method, url, **kwargs)
+        elapsed = time.perf_counter() - started
+        response.raise_for_status()
+        return elapsed, response.json()
+
+    async def submit(self) -> str:
+        _, body = await self._timed(
+            "POST", "/api/tasks/process", json={"text": self._next_text()}
+        )
+        return body["task_id"]
+
+    async def measure_submissions(
+        self, concurrency: int, count: int
+    ) -> tuple[dict[str, Any], list[str]]:
+        task_ids: list[str] = []
+
+        async def job() -> float:
+            elapsed, body = await self._timed(
+                "POST", "/api/tasks/process", json={"text": self._next_text()}
+            )
+            task_ids.append(body["task_id"])
+            return elapsed
+
+        started = time.perf_counter()
+        latencies = await run_concurrently(concurrency, [job] * count)
+        wall_seconds = time.perf_counter() - started
+        stats = {
+            **summarize(latencies),
+            "submissions_per_second": round(count / wall_seconds, 1),
+        }
+        return stats, task_ids
+
+    async def measure_reads(
+        self, concurrency: int, path: str, task_ids: Sequence[str], count: int
+    ) -> dict[str, Any]:
+        def job_for(task_id: str) -> Callable[[], Awaitable[float]]:
+            async def job() -> float:
+                elapsed, _ = await self._timed("GET", f"/api/tasks/{task_id}{path}")
+                return elapsed
+
+            return job
+
+        jobs = [job_for(task_ids[index % len(task_ids)]) for index in range(count)]
+        started = time.perf_counter()
+        latencies = await run_concurrently(concurrency, jobs)
+        wall_seconds = time.perf_counter() - started
+        return {
+            **summarize(latencies),
+            "requests_per_second": round(count / wall_seconds, 1),
+        }
+
+    async def wait_finished(self, task_id: str) -> None:
+        while True:
+            _, view = await self._timed("GET", f"/api/tasks/{task_id}")
+            if view["terminal"]:
+                if view["state"] != "SUCCESS":
+                    raise RuntimeError(f"Task {task_id} ended in {view['state']}")
+                return
+            await asyncio.sleep(self._poll_interval)
+
+    async def drain(self, task_ids: Sequence[str]) -> None:
+        """Wait for earlier submissions so they do not queue ahead of new ones."""
+        for task_id in task_ids:
+            await self.wait_finished(task_id)
+
+    async def measure_end_to_end(self, concurrency: int, count: int) -> dict[str, Any]:
+        async def job() -> float:
+            started = time.perf_counter()
+            await self.wait_finished(await self.submit())
+            return time.perf_counter() - started
+
+        started = time.perf_counter()
+        latencies = await run_concurrently(concurrency, [job] * count)
+        wall_seconds = time.perf_counter() - started
+        return {
+            **summarize(latencies),
+            "tasks_per_second": round(count / wall_seconds, 1),
+        }
+
+
+async def run_scenarios(args: argparse.Namespace) -> list[dict[str, Any]]:
+    import httpx
+
+    from api_main import create_app
+
+    app = create_app()
+    client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench"
+    )
+    results = []
+    # ASGITransport sends no lifespan events, so the services are started here.
+    async with app.router.lifespan_context(app), client:
+        load_test = LoadTest(client, args.poll_interval)
+        for concurrency in args.concurrency:
+            submissions, task_ids = await load_test.measure_submissions(
+                concurrency, args.requests
+            )
+            status = await load_test.measure_reads(
+                concurrency, "/status", task_ids, args.requests
+            )
+            result = await load_test.measure_reads(
+                concurrency, "/result", task_ids, args.requests
+            )
+            await load_test.drain(task_ids)
+            end_to_end = await load_test.measure_end_to_end(concurrency, args.tasks)
+            results.append(
+                {
+                    "concurrency": concurrency,
+                    "submit": submissions,
+                    "status": status,
+                    "result": result,
+                    "end_to_end": end_to_end,
+                }
+            )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument(
+        "--requests", type=int, default=500, help="Requests per read/submit scenario"
+    )
+    parser.add_argument(
+        "--tasks", type=int, default=50, help="Tasks tracked end to end per level"
+    )
+    parser.add_argument("--workers", type=int, default=8, help="Worker threads")
+    parser.add_argument("--poll-interval", type=float, default=0.005)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    for name, value in STANDALONE_ENVIRONMENT.items():
+        os.environ.setdefault(name, value)
+    os.environ.setdefault("BLOB_STORE_PATH", tempfile.mkdtemp(prefix="bench-blobs-"))
+
+    # Imported only now so the environment above configures Celery.
+    from celery.contrib.testing.worker import start_worker
+
+    from infrastructure.celery.app import get_celery_application
+
+    celery_app = get_celery_application()
+    # The memory transport polls for messages; Redis would block on BRPOP instead.
+    celery_app.conf.broker_transport_options = {
+        **celery_app.conf.broker_transport_options,
+        "polling_interval": args.poll_interval,
+    }
+    with start_worker(
+        celery_app,
+        pool="threads",
+        concurrency=args.workers,
+        perform_ping_check=False,
+        loglevel="WARNING",
+    ):
+        scenarios = asyncio.run(run_scenarios(args))
+
+    report = {
+        "benchmark": "load",
+        "python": platform.python_version(),
+        "environment": {
+            name: os.environ[name] for name in sorted(STANDALONE_ENVIRONMENT)
+        },
+        "workers": args.workers,
+        "requests_per_scenario": args.requests,
+        "tasks_per_level": args.tasks,
+        "scenarios": scenarios,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
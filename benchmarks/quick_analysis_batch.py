@@ -0,0 +1,98 @@
+"""Compare the per-text quick analysis with the vectorised batch engine.
+
+Run from the repository root::
+
+    python -m benchmarks.quick_analysis_batch --texts 50000 --words 40
+
+``--corpus numeric`` uses texts without letters, where the per-text
+``contains_letters`` scan cannot stop early; ``ascii`` and ``cjk`` show the
+two ends of the character lookup, the latter measured text by text.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import string
+import time
+from collections.abc import Callable
+from typing import Any
+
+from domain.batch_analysis import analyze_text_batch
+from domain.text_processing import analyze_text_quick
+
+CORPUS_ALPHABETS = {
+    "words": string.ascii_letters + string.digits + "éü中",
+    "ascii": string.ascii_letters + string.digits,
+    "cjk": "中文字符测试汉语日本語",
+    "numeric": string.digits + ".,-",
+}
+
+
+def build_corpus(
+    text_count: int, words_per_text: int, seed: int, alphabet: str
+) -> list[str]:
+    """Return ``text_count`` random texts of about ``words_per_text`` words."""
+    rng = random.Random(seed)
+    vocabulary = [
+        "".join(rng.choices(alphabet, k=rng.randint(1, 10))) for _ in range(2_000)
+    ]
+    return [
+        " ".join(rng.choices(vocabulary, k=rng.randint(1, 2 * words_per_text)))
+        for _ in range(text_count)
+    ]
+
+
+def best_of(repeat: int, func: Callable[[], Any]) -> float:
+    """Return the fastest wall-clock time of ``repeat`` calls to ``func``."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--texts", type=int, default=20_000)
+    parser.add_argument("--words", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--corpus", choices=sorted(CORPUS_ALPHABETS), default="words"
+    )
+    args = parser.parse_args()
+
+    corpus = build_corpus(
+        args.texts, args.words, args.seed, CORPUS_ALPHABETS[args.corpus]
+    )
+    per_text, _ = analyze_text_batch(corpus)
+    if per_text != [analyze_text_quick(text) for text in corpus]:
+        raise SystemExit("Batch results differ from the per-text analysis")
+
+    per_text_seconds = best_of(
+        args.repeat, lambda: [analyze_text_quick(text) for text in corpus]
+    )
+    batch_seconds = best_of(args.repeat, lambda: analyze_text_batch(corpus))
+    total_chars = sum(len(text) for text in corpus)
+    print(
+        json.dumps(
+            {
+                "corpus": args.corpus,
+                "texts": args.texts,
+                "chars": total_chars,
+                "per_text_seconds": round(per_text_seconds, 6),
+                "batch_seconds": round(batch_seconds, 6),
+                "per_text_texts_per_second": round(args.texts / per_text_seconds),
+                "batch_texts_per_second": round(args.texts / batch_seconds),
+                "speedup": round(per_text_seconds / batch_seconds, 2),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
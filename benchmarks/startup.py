@@ -0,0 +1,137 @@
+"""Measure, and guard, the import cost of each entry point.
+
+Every entry point is imported in a fresh interpreter several times; the report
+gives the fastest import time, the whole process time and the number of loaded
+modules. Run from the repository root::
+
+    python -m benchmarks.startup --repeat 5 --check
+
+With ``--check`` the script exits non-zero when an entry point loads a module
+it has no use for (see ``ENTRY_POINTS``) or exceeds its import time or module
+budget. ``--budget api_main=0.8`` replaces the default time budget.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Any
+
+# Entry point -> modules it has no use for and must never load.
+ENTRY_POINTS: dict[str, tuple[str, ...]] = {
+    "api_main": ("infrastructure.celery.tasks", "dash"),
+    "main": ("celery", "fastapi"),
+    "app": ("celery", "fastapi"),
+    "worker_main": ("infrastructure.celery.tasks", "numpy", "dash", "fastapi"),
+    "infrastructure.celery.tasks": ("dash", "fastapi"),
+}
+
+# Before progress streaming and admission control the API imported in about
+# 0.42s with 608 modules. The budgets leave room for timing noise and for the
+# Redis client and Prometheus, which the API now uses on every request.
+DEFAULT_TIME_BUDGETS: dict[str, float] = {"api_main": 0.75}
+MODULE_BUDGETS: dict[str, int] = {"api_main": 750}
+
+_RESULT_MARKER = "STARTUP_RESULT "
+
+_PROBE = f"""
+import importlib, json, sys, time
+started = time.perf_counter()
+importlib.import_module(sys.argv[1])
+seconds = time.perf_counter() - started
+watched = sys.argv[2:]
+print({_RESULT_MARKER!r} + json.dumps({{
+    "seconds": seconds,
+    "modules": len(sys.modules),
+    "loaded": [name for name in watched if name in sys.modules],
+}}))
+"""
+
+
+def probe(entry_point: str, watched: tuple[str, ...]) -> dict[str, Any]:
+    """Import ``entry_point`` in a new interpreter and return its measurements."""
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE, entry_point, *watched],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    process_seconds = time.perf_counter() - started
+    for line in reversed(completed.stdout.splitlines()):
+        if line.startswith(_RESULT_MARKER):
+            result = json.loads(line[len(_RESULT_MARKER) :])
+            return {**result, "process_seconds": process_seconds}
+    raise RuntimeError(f"No measurement printed while importing {entry_point}")
+
+
+def measure(entry_point: str, watched: tuple[str, ...], repeat: int) -> dict[str, Any]:
+    runs = [probe(entry_point, watched) for _ in range(repeat)]
+    best = min(runs, key=lambda run: run["seconds"])
+    return {
+        "import_seconds": round(best["seconds"], 4),
+        "process_seconds": round(min(run["process_seconds"] for run in runs), 4),
+        "modules": best["modules"],
+        "unexpected_modules": best["loaded"],
+    }
+
+
+def parse_budgets(values: list[str]) -> dict[str, float]:
+    budgets = dict(DEFAULT_TIME_BUDGETS)
+    for value in values:
+        name, _, seconds = value.partition("=")
+        if name not in ENTRY_POINTS or not seconds:
+            raise SystemExit(f"Invalid budget {value!r}; use <entry point>=<seconds>")
+        budgets[name] = float(seconds)
+    return budgets
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--entry-points", nargs="+", choices=sorted(ENTRY_POINTS), default=None
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--budget", action="append", default=[], help="Import budget, name=seconds"
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="Exit 1 when a guard is violated"
+    )
+    args = parser.parse_args()
+    budgets = parse_budgets(args.budget)
+
+    report: dict[str, Any] = {}
+    violations = []
+    for entry_point in args.entry_points or ENTRY_POINTS:
+        result = measure(entry_point, ENTRY_POINTS[entry_point], args.repeat)
+        report[entry_point] = result
+        if result["unexpected_modules"]:
+            violations.append(
+                f"{entry_point} imports {', '.join(result['unexpected_modules'])}"
+            )
+        budget = budgets.get(entry_point)
+        if budget is not None and result["import_seconds"] > budget:
+            violations.append(
+                f"{entry_point} took {result['import_seconds']}s (budget {budget}s)"
+            )
+        module_budget = MODULE_BUDGETS.get(entry_point)
+        if module_budget is not None and result["modules"] > module_budget:
+            violations.append(
+                f"{entry_point} loaded {result['modules']} modules"
+                f" (budget {module_budget})"
+            )
+
+    output = {"python": sys.version.split()[0], "entry_points": report}
+    print(json.dumps(output, indent=2))
+    if args.check and violations:
+        raise SystemExit("Startup guard failed: " + "; ".join(violations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Vectorised quick analysis over many texts at once."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from domain.text_processing import EMPTY_TEXT_ERROR
+
+_ASCII_LIMIT = 0x80
+# Above this share of non-ASCII characters, looking every one of them up costs
+# more than the per-text loop it replaces.
+_MAX_NON_ASCII_SHARE = 0.25
+
+
+def _ascii_flags(
+    codes: npt.NDArray[np.uint8],
+) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_]]:
+    """Return ``isspace``/``isalpha`` of ASCII code points by byte comparisons."""
+    # ASCII whitespace per ``str.isspace``: the space, \t \n \v \f \r and the
+    # separators \x1c-\x1f. Unsigned wrap-around makes each range one compare.
+    is_space = codes == np.uint8(0x20)
+    is_space |= codes - np.uint8(0x09) <= np.uint8(0x0D - 0x09)
+    is_space |= codes - np.uint8(0x1C) <= np.uint8(0x1F - 0x1C)
+    # Setting bit 5 folds A-Z onto a-z.
+    is_alpha = (codes | np.uint8(0x20)) - np.uint8(ord("a")) < np.uint8(26)
+    return is_space, is_alpha
+
+
+def _classify(
+    joined: str,
+) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_]] | None:
+    """Return ``isspace`` and ``isalpha`` of every character of ``joined``.
+
+    ASCII is classified by array comparisons. Other code points are looked up
+    once per distinct code point with Python's own ``str`` methods, so results
+    match ``str.split`` and ``str.isalpha`` for every code point. ``None`` means
+    too many characters are outside ASCII for the lookup to pay off.
+    """
+    if joined.isascii():
+        return _ascii_flags(np.frombuffer(joined.encode("ascii"), dtype=np.uint8))
+
+    # UTF-32 keeps one array element per character, so offsets stay str indexes.
+    buffer = joined.encode("utf-32-le", errors="surrogatepass")
+    codes = np.frombuffer(buffer, dtype=np.uint32)
+    is_other = codes >= _ASCII_LIMIT
+    if np.count_nonzero(is_other) > _MAX_NON_ASCII_SHARE * codes.size:
+        return None
+    # Truncated to a byte, non-ASCII code points alias ASCII ones; they are
+    # overwritten below.
+    is_space, is_alpha = _ascii_flags(codes.astype(np.uint8))
+    other = np.flatnonzero(is_other)
+    distinct, inverse = np.unique(codes[other], return_inverse=True)
+    characters = [chr(code) for code in distinct.tolist()]
+    is_space[other] = np.array([char.isspace() for char in characters])[inverse]
+    is_alpha[other] = np.array([char.isalpha() for char in characters])[inverse]
+    return is_space, is_alpha
+
+
+def _measure_per_text(
+    texts: Sequence[str],
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.bool_]]:
+    count = len(texts)
+    return (
+        np.fromiter((len(text.split()) for text in texts), np.int64, count=count),
+        np.fromiter(map(len, texts), np.int64, count=count),
+        np.fromiter((any(map(str.isalpha, text)) for text in texts), bool, count=count),
+    )
+
+
+def _measure(
+    texts: Sequence[str],
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.bool_]]:
+    """Return word counts, character counts and letter presence per text.
+
+    The texts are packed into one character buffer and split back through an
+    offsets array, so every metric is computed by array operations over the
+    whole batch. Batches with many non-ASCII characters are measured text by
+    text instead.
+    """
+    flags = _classify("".join(texts))
+    if flags is None:
+        return _measure_per_text(texts)
+    is_space, is_alpha = flags
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+    starts = np.zeros(len(texts), dtype=np.int64)
+    np.cumsum(lengths[:-1], out=starts[1:])
+
+    # A word starts at a non-space character preceded by a space or a text start.
+    word_starts = ~is_space
+    word_starts[1:] &= is_space[:-1]
+    non_empty = lengths > 0
+    segment_starts = starts[non_empty]
+    word_starts[segment_starts] = ~is_space[segment_starts]
+
+    # Words per text are the word starts between consecutive text offsets.
+    word_positions = np.flatnonzero(word_starts)
+    bounds = np.searchsorted(word_positions, starts)
+    word_counts = np.diff(bounds, append=word_positions.size)
+
+    # Empty texts are skipped so every reduceat segment ends where the next
+    # non-empty text begins.
+    contains_letters = np.zeros(len(texts), dtype=bool)
+    if segment_starts.size:
+        contains_letters[non_empty] = np.logical_or.reduceat(
+            is_alpha, segment_starts
+        )
+    return word_counts, lengths, contains_letters
+
+
+def _results(
+    word_counts: npt.NDArray[np.int64],
+    char_counts: npt.NDArray[np.int64],
+    contains_letters: npt.NDArray[np.bool_],
+) -> list[dict[str, Any]]:
+    return [
+        {
+            "word_count": word_count,
+            "char_count": char_count,
+            "contains_letters": has_letters,
+            "analysis_type": "quick",
+        }
+        for word_count, char_count, has_letters in zip(
+            word_counts.tolist(),
+            char_counts.tolist(),
+            contains_letters.tolist(),
+            strict=True,
+        )
+    ]
+
+
+def _aggregates(
+    word_counts: npt.NDArray[np.int64],
+    char_counts: npt.NDArray[np.int64],
+    contains_letters: npt.NDArray[np.bool_],
+) -> dict[str, int]:
+    return {
+        "text_count": len(word_counts),
+        "word_count": int(word_counts.sum()),
+        "char_count": int(char_counts.sum()),
+        "texts_with_letters": int(np.count_nonzero(contains_letters)),
+    }
+
+
+def analyze_text_batch(
+    texts: Sequence[str],
+) -> tuple[list[dict[str, Any]], dict[str, int]]:
+    """Return per-text quick analyses and batch aggregates.
+
+    Results match :func:`domain.text_processing.analyze_text_quick`.
+    """
+    columns = _measure(texts)
+    return _results(*columns), _aggregates(*columns)
+
+
+def analyze_quick_batch(texts: Sequence[str]) -> dict[str, Any]:
+    """Return the quick analysis of a batch, answering blank texts per item.
+
+    A blank text does not fail the batch: its entry in ``results`` is an
+    ``error`` and it is left out of the aggregates, which count it under
+    ``error_count`` instead.
+    """
+    word_counts, char_counts, contains_letters = _measure(texts)
+    # Only whitespace separates words, so a text without words is blank.
+    analysed = word_counts > 0
+    columns = (word_counts[analysed], char_counts[analysed], contains_letters[analysed])
+    analysed_results = iter(_results(*columns))
+    results = [
+        next(analysed_results) if is_analysed else {"error": EMPTY_TEXT_ERROR}
+        for is_analysed in analysed.tolist()
+    ]
+    aggregates = _aggregates(*columns)
+    return {
+        "results": results,
+        "aggregates": {**aggregates, "error_count": len(texts) - len(columns[0])},
+    }
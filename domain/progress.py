@@ -2,32 +2,51 @@
 
 from __future__ import annotations
 
+from collections import Counter
+from collections.abc import Sequence
 from typing import Any
 
-from models.task_models import ProgressUpdate
-
 NOT_FOUND_STATE: dict[str, Any] = {
     "state": "NOT_FOUND",
     "progress": 0,
     "status": "Task not found",
 }
 
+TERMINAL_STATES: frozenset[str] = frozenset({"SUCCESS", "FAILURE", "REVOKED"})
+
+FAILED_STATES: frozenset[str] = frozenset({"FAILURE", "REVOKED"})
+
+
+def is_terminal_state(state: str | None) -> bool:
+    """Return whether a task in the given state will never change again."""
+    return state in TERMINAL_STATES
+
+
+def is_failed_state(state: str | None) -> bool:
+    """Return whether a task in the given state ended without a usable result."""
+    return state in FAILED_STATES
+
+
+def progress_etag(payload: dict[str, Any]) -> str:
+    """Return an entity tag that changes whenever the progress payload does."""
+    return f'"{payload.get("state", "PENDING")}-{payload.get("version", 0)}"'
+
 
 def build_progress_state(state: str, info: Any) -> dict[str, Any]:
     """Return a normalized progress payload for the given task state."""
     normalized_state = state or "PENDING"
 
     if normalized_state == "PROGRESS":
+        # Same fields and coercions as ProgressUpdate, without building a model
+        # for every status read.
         progress_meta = info or {}
-        progress_update = ProgressUpdate(
-            current=int(progress_meta.get("current", 0)),
-            total=int(progress_meta.get("total", 1)),
-            progress=int(progress_meta.get("progress", 0)),
-            status=str(progress_meta.get("status", "Processing...")),
-        )
         return {
             "state": normalized_state,
-            **progress_update.model_dump(),
+            "current": int(progress_meta.get("current", 0)),
+            "total": int(progress_meta.get("total", 1)),
+            "progress": int(progress_meta.get("progress", 0)),
+            "status": str(progress_meta.get("status", "Processing...")),
+            "version": int(progress_meta.get("version", 0)),
         }
 
     if normalized_state == "PENDING":
@@ -52,8 +71,44 @@ def build_progress_state(state: str, info: Any) -> dict[str, Any]:
             "status": f"Task failed: {failure_info}",
         }
 
+    if normalized_state == "REVOKED":
+        return {
+            "state": normalized_state,
+            "progress": 0,
+            "status": "Task was cancelled",
+        }
+
     return {
         "state": normalized_state,
         "progress": 0,
         "status": f"State: {normalized_state}",
     }
+
+
+def build_group_progress_state(
+    child_states: Sequence[dict[str, Any]],
+) -> dict[str, Any]:
+    """Aggregate normalized child payloads into a single group progress payload."""
+    total = len(child_states)
+    counts = Counter(child["state"] for child in child_states)
+    finished = sum(counts[state] for state in TERMINAL_STATES)
+    progress_sum = sum(
+        100 if is_terminal_state(child["state"]) else int(child.get("progress", 0))
+        for child in child_states
+    )
+
+    if total and finished == total:
+        state = "SUCCESS" if counts["SUCCESS"] == total else "FAILURE"
+    elif finished or counts["PROGRESS"]:
+        state = "PROGRESS"
+    else:
+        state = "PENDING"
+
+    return {
+        "state": state,
+        "progress": progress_sum // total if total else 0,
+        "status": f"{finished}/{total} tasks finished",
+        "total": total,
+        "finished": finished,
+        "states": dict(counts),
+    }
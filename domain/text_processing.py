@@ -2,8 +2,28 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 from dataclasses import dataclass
-from typing import Iterable, Iterator, Sequence
+from itertools import islice
+from typing import Any, Iterable, Iterator, Mapping, Sequence
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+
+EMPTY_TEXT_ERROR = "Text cannot be empty"
+
+# Offending indexes listed in a batch validation error.
+_MAX_REPORTED_INDEXES = 10
+
+_CHUNK_BOUNDARIES: tuple[str, ...] = (" ", "\n", "\t", "\r")
+
+
+
+class InvalidInputError(ValueError):
+    """Raised when client-supplied input fails validation."""
 
 
 DEFAULT_PROCESSING_STEPS: tuple[str, ...] = (
@@ -18,10 +38,73 @@ DEFAULT_PROCESSING_STEPS: tuple[str, ...] = (
 def validate_text_input(text: str) -> str:
     """Ensure that text input is non-empty before submitting a task."""
     if not text or not text.strip():
-        raise ValueError("Text cannot be empty")
+        raise InvalidInputError(EMPTY_TEXT_ERROR)
     return text
 
 
+def validate_text_batch(texts: Sequence[str], max_size: int) -> list[str]:
+    """Validate a batch of texts in one pass, reporting every offending index."""
+    validate_batch_size(texts, max_size)
+    empty_indexes = [
+        index for index, text in enumerate(texts) if not text or not text.strip()
+    ]
+    if empty_indexes:
+        shown = ", ".join(
+            str(index) for index in empty_indexes[:_MAX_REPORTED_INDEXES]
+        )
+        suffix = ", ..." if len(empty_indexes) > _MAX_REPORTED_INDEXES else ""
+        raise InvalidInputError(f"{EMPTY_TEXT_ERROR} (indexes: {shown}{suffix})")
+    return list(texts)
+
+
+def validate_batch_size(texts: Sequence[str], max_size: int) -> list[str]:
+    """Ensure a batch holds between one and ``max_size`` texts."""
+    if not texts:
+        raise InvalidInputError("Batch cannot be empty")
+    if len(texts) > max_size:
+        raise InvalidInputError(f"Batch cannot contain more than {max_size} texts")
+    return list(texts)
+
+
+def validate_idempotency_key(key: str) -> str:
+    """Ensure a client-supplied idempotency key is usable as a registry key."""
+    if not key or not key.strip():
+        raise InvalidInputError("Idempotency key cannot be empty")
+    if len(key) > MAX_IDEMPOTENCY_KEY_LENGTH:
+        raise InvalidInputError(
+            "Idempotency key cannot be longer than "
+            f"{MAX_IDEMPOTENCY_KEY_LENGTH} characters"
+        )
+    return key
+
+
+def submission_fingerprint(
+    task_name: str, text: str, settings: Mapping[str, Any] | None = None
+) -> str:
+    """Hash a task submission so identical work maps to the same digest.
+
+    ``settings`` holds every option that changes the task output; submitting the
+    same text under different settings yields a different fingerprint.
+    """
+    digest = hashlib.sha256()
+    digest.update(task_name.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(json.dumps(settings or {}, sort_keys=True).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def analyze_text_quick(text: str) -> dict[str, Any]:
+    """Return the cheap word/character summary behind the quick analysis."""
+    return {
+        "word_count": len(text.split()),
+        "char_count": len(text),
+        "contains_letters": any(c.isalpha() for c in text),
+        "analysis_type": "quick",
+    }
+
+
 def compute_progress(step: int, total: int) -> int:
     """Compute the integer percentage for a given step."""
     if total <= 0:
@@ -29,6 +112,91 @@ def compute_progress(step: int, total: int) -> int:
     return int(100 * step / total)
 
 
+def iter_chunk_bounds(text: str, chunk_size: int) -> Iterator[tuple[int, int]]:
+    """Yield ``(start, end)`` offsets of chunks of at most ``chunk_size`` characters.
+
+    Chunks end right after whitespace so tokens are never split, unless a single
+    token is longer than ``chunk_size``. Concatenating the chunks restores ``text``.
+    """
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+    length = len(text)
+    if not length:
+        yield 0, 0
+        return
+
+    start = 0
+    while start < length:
+        end = min(start + chunk_size, length)
+        if end < length:
+            boundary = max(text.rfind(char, start, end) for char in _CHUNK_BOUNDARIES)
+            if boundary > start:
+                end = boundary + 1
+        yield start, end
+        start = end
+
+
+@dataclass
+class TextStatistics:
+    """Running counters accumulated while a text streams through the pipeline."""
+
+    word_count: int = 0
+    char_count: int = 0
+    chunk_count: int = 0
+    ends_inside_word: bool = False
+
+    def add(self, chunk: str) -> None:
+        """Account for the next chunk, merging words split across chunks."""
+        if not chunk:
+            return
+        words = len(chunk.split())
+        if self.ends_inside_word and not chunk[0].isspace():
+            words -= 1
+        self.word_count += words
+        self.char_count += len(chunk)
+        self.chunk_count += 1
+        self.ends_inside_word = not chunk[-1].isspace()
+
+
+@dataclass(frozen=True)
+class TextShard:
+    """Contiguous run of chunks processed independently of the rest of a text."""
+
+    index: int
+    start: int
+    end: int
+    chunk_count: int
+    continues_word: bool
+
+
+def plan_shards(text: str, chunk_size: int, shard_size: int) -> list[TextShard]:
+    """Group chunk bounds into shards of roughly ``shard_size`` characters.
+
+    Shards start on chunk bounds, so re-chunking a shard on its own yields the
+    same chunks the whole text would have produced.
+    """
+    shards: list[TextShard] = []
+    shard_start = 0
+    chunk_count = 0
+    for _start, end in iter_chunk_bounds(text, chunk_size):
+        chunk_count += 1
+        if end - shard_start >= shard_size or end == len(text):
+            shards.append(
+                TextShard(
+                    index=len(shards),
+                    start=shard_start,
+                    end=end,
+                    chunk_count=chunk_count,
+                    continues_word=shard_start > 0
+                    and not text[shard_start - 1].isspace()
+                    and not text[shard_start].isspace(),
+                )
+            )
+            shard_start = end
+            chunk_count = 0
+    return shards
+
+
 @dataclass(frozen=True)
 class ProcessingStep:
     """Immutable representation of a single processing step."""
@@ -36,6 +204,8 @@ class ProcessingStep:
     index: int
     description: str
     total_steps: int
+    chunk_index: int = 1
+    chunk_count: int = 1
 
     @property
     def progress(self) -> int:
@@ -45,14 +215,40 @@ class ProcessingStep:
 class TextProcessor:
     """Domain component responsible for chunk processing semantics."""
 
-    def __init__(self, steps: Sequence[str] | None = None) -> None:
+    def __init__(
+        self,
+        steps: Sequence[str] | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
         self._steps: tuple[str, ...] = tuple(steps or DEFAULT_PROCESSING_STEPS)
+        self._chunk_size = chunk_size
+
+    @property
+    def steps(self) -> tuple[str, ...]:
+        return self._steps
+
+    @property
+    def chunk_size(self) -> int:
+        return self._chunk_size
 
-    def processing_plan(self) -> Iterable[ProcessingStep]:
-        """Iterate over configured processing steps."""
-        total_steps = len(self._steps)
-        for index, description in enumerate(self._steps, start=1):
-            yield ProcessingStep(index=index, description=description, total_steps=total_steps)
+    def chunk_bounds(self, text: str) -> list[tuple[int, int]]:
+        """Return chunk offsets; only offsets are held, never chunk copies."""
+        return list(iter_chunk_bounds(text, self._chunk_size))
+
+    def processing_plan(self, chunk_count: int = 1) -> Iterable[ProcessingStep]:
+        """Iterate over configured processing steps, repeated for every chunk."""
+        total_steps = len(self._steps) * chunk_count
+        index = 0
+        for chunk_index in range(1, chunk_count + 1):
+            for description in self._steps:
+                index += 1
+                yield ProcessingStep(
+                    index=index,
+                    description=description,
+                    total_steps=total_steps,
+                    chunk_index=chunk_index,
+                    chunk_count=chunk_count,
+                )
 
     @staticmethod
     def process_text_chunk(text: str, step: ProcessingStep) -> str:
@@ -61,8 +257,22 @@ class TextProcessor:
         return f"Step {step.index}: {step.description} - '{preview}...'"
 
 
-def iterate_processing_chunks(text: str, processor: TextProcessor | None = None) -> Iterator[tuple[ProcessingStep, str]]:
-    """Yield text processing chunks along with their step metadata."""
+def iterate_processing_chunks(
+    text: str,
+    processor: TextProcessor | None = None,
+    statistics: TextStatistics | None = None,
+) -> Iterator[tuple[ProcessingStep, str]]:
+    """Stream text chunk by chunk through every processing step.
+
+    Only one chunk is materialised at a time, so peak memory follows the chunk
+    size rather than the document size.
+    """
     processor = processor or TextProcessor()
-    for step in processor.processing_plan():
-        yield step, processor.process_text_chunk(text, step)
+    bounds = processor.chunk_bounds(text)
+    plan = iter(processor.processing_plan(len(bounds)))
+    for start, end in bounds:
+        chunk = text[start:end]
+        if statistics is not None:
+            statistics.add(chunk)
+        for step in islice(plan, len(processor.steps)):
+            yield step, processor.process_text_chunk(chunk, step)
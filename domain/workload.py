@@ -0,0 +1,44 @@
+"""Synthetic cost model standing in for real per-step processing work."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class SyntheticWorkload:
+    """Duration of each simulated processing step.
+
+    Every step costs ``step_seconds`` scaled by a uniform factor within
+    ``±jitter``, so load tests can model both the default two-second steps and
+    fast, noisy ones.
+    """
+
+    step_seconds: float = 2.0
+    jitter: float = 0.0
+    _rng: random.Random = field(
+        default_factory=random.Random, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.step_seconds < 0:
+            raise ValueError("Workload step duration cannot be negative")
+        if not 0 <= self.jitter <= 1:
+            raise ValueError("Workload jitter must be between 0 and 1")
+
+    def step_duration(self) -> float:
+        """Return the seconds the next simulated step takes."""
+        if not self.jitter:
+            return self.step_seconds
+        return self.step_seconds * self._rng.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def run_step(self) -> None:
+        """Block the calling thread for one step."""
+        time.sleep(self.step_duration())
+
+    async def run_step_async(self) -> None:
+        """Wait for one step without blocking the event loop."""
+        await asyncio.sleep(self.step_duration())
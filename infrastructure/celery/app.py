@@ -4,7 +4,10 @@ from __future__ import annotations
 
 from celery import Celery
 
+# Connects the signal handlers every process that sends tasks needs.
+from infrastructure.celery import publishing  # noqa: F401
 from infrastructure.celery.config import CeleryConfig
+from infrastructure.celery.serialization import register_serializers
 from logging_config import configure_logging
 
 
@@ -22,8 +25,10 @@ class CeleryApplication:
     def _initialize(self) -> None:
         """Initialize Celery application."""
         configure_logging()
+        register_serializers()
 
         config = CeleryConfig()
+        self.config = config
 
         self.app = Celery(
             "text_processor",
@@ -38,7 +43,16 @@ class CeleryApplication:
         """Get a Celery application instance."""
         return self.app
 
+    def get_config(self) -> CeleryConfig:
+        """Get the configuration the application was built from."""
+        return self.config
+
 
 def get_celery_application() -> Celery:
     """Module-level accessor."""
     return CeleryApplication().get_app()
+
+
+def get_celery_config() -> CeleryConfig:
+    """Module-level accessor for the active configuration."""
+    return CeleryApplication().get_config()
@@ -0,0 +1,265 @@
+"""Worker pool awaiting coroutine task bodies on one event loop per process."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Coroutine, Generator, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+from billiard.einfo import ExceptionInfo
+from celery import Task, signals, states
+from celery.app.task import Context
+from celery.app.trace import TraceInfo, get_actual_ignore_result
+from celery.concurrency.base import BasePool, apply_target
+from celery.concurrency.thread import ApplyResult
+from celery.exceptions import Ignore
+from celery.utils.saferepr import saferepr
+from kombu.serialization import loads as loads_message, prepare_accept_content
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Name accepted by ``worker_main.py --pool`` and the class Celery loads for it.
+ASYNCIO_POOL_NAME = "asyncio"
+ASYNCIO_POOL = "infrastructure.celery.asyncio_pool:AsyncioTaskPool"
+
+
+class AwaitableTask(Task):
+    """Task whose body is a coroutine function.
+
+    Called by the prefork or threads pool, or directly, the body runs to
+    completion on an event loop of the calling thread, so each pool slot still
+    holds one task. :class:`AsyncioTaskPool` awaits the body instead and
+    interleaves many tasks on one loop.
+    """
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        # Task.__call__ would push a request of its own and pop it before the
+        # coroutine ran; the request the tracer pushed is kept instead.
+        return run_blocking(self, self.run(*args, **kwargs))
+
+
+def run_blocking(
+    task: Task, coroutine: Coroutine[Any, Any, T], request: Context | None = None
+) -> T:
+    """Run ``coroutine`` to completion in the calling thread.
+
+    ``request``, by default the task's current one, is ``task.request`` for
+    the coroutine wherever it resumes.
+    """
+    return asyncio.run(_in_request(task, request or task.request, coroutine))
+
+
+async def _in_request(
+    task: Task, request: Context, coroutine: Coroutine[Any, Any, T]
+) -> T:
+    return await _RequestScope(task, request, coroutine)
+
+
+class _RequestScope:
+    """Await a coroutine with ``request`` pushed whenever the coroutine runs.
+
+    Celery keeps the current request on a thread-local stack, which tasks
+    interleaved on one loop share; every resumption of the coroutine is
+    wrapped in a push and pop, so ``task.request`` is always its own.
+    """
+
+    def __init__(
+        self, task: Task, request: Context, coroutine: Coroutine[Any, Any, T]
+    ) -> None:
+        self._task = task
+        self._request = request
+        self._coroutine = coroutine
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        value: Any = None
+        error: BaseException | None = None
+        while True:
+            with _pushed(self._task, self._request):
+                try:
+                    if error is None:
+                        waiting_on = self._coroutine.send(value)
+                    else:
+                        waiting_on = self._coroutine.throw(error)
+                except StopIteration as stop:
+                    return stop.value
+            try:
+                value, error = (yield waiting_on), None
+            except BaseException as exc:  # noqa: BLE001 - thrown into the coroutine
+                value, error = None, exc
+
+
+@contextmanager
+def _pushed(task: Task, request: Context) -> Iterator[None]:
+    task.request_stack.push(request)
+    try:
+        yield
+    finally:
+        task.request_stack.pop()
+
+
+class AsyncioTaskPool(BasePool):
+    """Await :class:`AwaitableTask` bodies on one event loop of the worker.
+
+    The loop runs in a thread of its own and holds up to ``limit`` tasks at
+    once; while a step waits, the others progress. Results, failures and the
+    task signals are handled here the way Celery's tracer handles them, except
+    that link callbacks and chains are not dispatched. Redis writes made
+    between awaits, such as progress and cancellation checks, stay
+    synchronous: each is one short round trip, and no other task runs in the
+    middle of one. Tasks with plain bodies run through Celery's tracer on a
+    thread per CPU.
+    """
+
+    body_can_be_buffer = True
+    signal_safe = False
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        _app, self._hostname = self.options.get("initargs", (None, None))
+        self._accept = prepare_accept_content(self.app.conf.accept_content)
+        self._loop = asyncio.new_event_loop()
+        self._slots = asyncio.Semaphore(self.limit)
+        self._executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1, thread_name_prefix="asyncio-pool-sync"
+        )
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="asyncio-pool", daemon=True
+        )
+        self._running: set[Future[Any]] = set()
+
+    def on_start(self) -> None:
+        self._thread.start()
+
+    def on_stop(self) -> None:
+        wait(list(self._running))
+        self._close()
+        super().on_stop()
+
+    def on_terminate(self) -> None:
+        for future in list(self._running):
+            future.cancel()
+        self._close()
+
+    def _close(self) -> None:
+        self._executor.shutdown()
+        if self._thread.is_alive():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+
+    def on_apply(
+        self,
+        target: Callable[..., Any],
+        args: tuple[Any, ...] | None = None,
+        kwargs: dict[str, Any] | None = None,
+        callback: Callable[..., Any] | None = None,
+        accept_callback: Callable[..., Any] | None = None,
+        **_: Any,
+    ) -> ApplyResult:
+        args = args or ()
+        task = self.app.tasks.get(args[0]) if args else None
+        if not isinstance(task, AwaitableTask):
+            return ApplyResult(
+                self._executor.submit(
+                    apply_target, target, args, kwargs, callback, accept_callback
+                )
+            )
+        future = asyncio.run_coroutine_threadsafe(
+            self._apply(task, args, callback, accept_callback), self._loop
+        )
+        self._running.add(future)
+        future.add_done_callback(self._running.discard)
+        return ApplyResult(future)
+
+    async def _apply(
+        self,
+        task: AwaitableTask,
+        args: tuple[Any, ...],
+        callback: Callable[..., Any] | None,
+        accept_callback: Callable[..., Any] | None,
+    ) -> None:
+        async with self._slots:
+            if accept_callback:
+                accept_callback(os.getpid(), time.monotonic())
+            outcome = await self._trace(task, args)
+        if callback:
+            callback(outcome)
+
+    async def _trace(
+        self, task: AwaitableTask, message: tuple[Any, ...]
+    ) -> tuple[int, Any, float | None]:
+        """Run one task; return what the worker expects from Celery's tracer.
+
+        ``message`` holds the arguments the worker passes to the tracer.
+        """
+        _name, task_id, request, body, content_type, content_encoding = message[:6]
+        if content_type:
+            args, kwargs, embed = loads_message(
+                body, content_type, content_encoding, accept=self._accept
+            )
+        else:
+            args, kwargs, embed = body
+        request.update(
+            {
+                "args": args,
+                "kwargs": kwargs,
+                "hostname": self._hostname,
+                "is_eager": False,
+            },
+            **embed or {},
+        )
+        task_request = Context(request, args=args, called_directly=False, kwargs=kwargs)
+        started = time.monotonic()
+        state, retval = None, None
+        with _pushed(task, task_request):
+            signals.task_prerun.send(
+                sender=task, task_id=task_id, task=task, args=args, kwargs=kwargs
+            )
+        try:
+            retval = await _RequestScope(task, task_request, task.run(*args, **kwargs))
+        except Ignore as exc:
+            state = states.IGNORED
+            with _pushed(task, task_request):
+                TraceInfo(state, exc).handle_ignore(task, task_request)
+            return 1, ExceptionInfo(internal=True), None
+        except Exception as exc:  # noqa: BLE001 - stored as the failure
+            state = states.FAILURE
+            with _pushed(task, task_request):
+                einfo = TraceInfo(state, exc).handle_error_state(task, task_request)
+            return 1, einfo, None
+        else:
+            state = states.SUCCESS
+            runtime = time.monotonic() - started
+            with _pushed(task, task_request):
+                task.backend.mark_as_done(
+                    task_id,
+                    retval,
+                    task_request,
+                    not get_actual_ignore_result(task, task_request),
+                )
+                signals.task_success.send(sender=task, result=retval)
+            logger.info("Task %s[%s] succeeded in %.3fs", task.name, task_id, runtime)
+            return 0, saferepr(retval, task.resultrepr_maxsize), runtime
+        finally:
+            with _pushed(task, task_request):
+                signals.task_postrun.send(
+                    sender=task,
+                    task_id=task_id,
+                    task=task,
+                    args=args,
+                    kwargs=kwargs,
+                    retval=retval,
+                    state=state,
+                )
+
+    def _get_info(self) -> dict[str, Any]:
+        info = super()._get_info()
+        info.update({"max-concurrency": self.limit, "running": len(self._running)})
+        return info
@@ -0,0 +1,32 @@
+"""Broker queue depth readings used to throttle submissions."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from celery import Celery
+from kombu.exceptions import ChannelError, KombuError
+from redis.exceptions import RedisError
+
+# Broker and in-flight counter failures; OSError covers refused connections.
+BACKLOG_READ_ERRORS: tuple[type[Exception], ...] = (KombuError, RedisError, OSError)
+
+
+def queue_depths(app: Celery, queue_names: Sequence[str]) -> dict[str, int]:
+    """Return the number of messages waiting in each queue.
+
+    A passive declare reads the depth without creating anything; on Redis it
+    is one ``LLEN`` per queue. Queues the broker does not know, such as the
+    empty lists Redis drops, count as empty.
+    """
+    depths: dict[str, int] = {}
+    with app.pool.acquire(block=True) as connection:
+        channel = connection.default_channel
+        for name in queue_names:
+            try:
+                declared = channel.queue_declare(queue=name, passive=True)
+            except ChannelError:
+                depths[name] = 0
+            else:
+                depths[name] = declared.message_count
+    return depths
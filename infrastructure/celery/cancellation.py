@@ -0,0 +1,47 @@
+"""Cooperative cancellation checks for long-running Celery tasks."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+from infrastructure.redis import TaskCancellationFlags
+
+
+class TaskCancelledError(Exception):
+    """Raised inside a task whose cancellation was requested."""
+
+
+class CancellationCheck:
+    """Poll the cancellation flag of a task at most every ``min_interval`` seconds.
+
+    The first call always reads the flag, so a task cancelled while queued stops
+    before doing any work; later calls between steps cost a clock read until the
+    interval elapses.
+    """
+
+    def __init__(
+        self,
+        flags: TaskCancellationFlags,
+        task_id: str,
+        *,
+        min_interval: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._flags = flags
+        self._task_id = task_id
+        self._min_interval = min_interval
+        self._clock = clock
+        self._last_checked_at: float | None = None
+
+    def raise_if_requested(self) -> None:
+        """Raise :class:`TaskCancelledError` if the task was asked to stop."""
+        now = self._clock()
+        if (
+            self._last_checked_at is not None
+            and now - self._last_checked_at < self._min_interval
+        ):
+            return
+        self._last_checked_at = now
+        if self._flags.is_requested(self._task_id):
+            raise TaskCancelledError(self._task_id)
@@ -5,22 +5,15 @@ from __future__ import annotations
 import os
 from typing import Any
 
+from kombu import Queue
 
-def _bool_env(name: str, default: bool) -> bool:
-    value = os.getenv(name)
-    if value is None:
-        return default
-    return value.lower() in {"1", "true", "yes", "on"}
-
-
-def _int_env(name: str, default: int) -> int:
-    value = os.getenv(name)
-    if value is None:
-        return default
-    try:
-        return int(value)
-    except ValueError:
-        return default
+from domain.text_processing import DEFAULT_CHUNK_SIZE
+from infrastructure.celery.routing import (
+    ARCHIVE_RESULTS_TASK,
+    QueueSettings,
+    TaskRouter,
+)
+from infrastructure.env import bool_env, float_env, int_env
 
 
 class CeleryConfig:
@@ -31,26 +24,112 @@ class CeleryConfig:
         self.result_backend = os.getenv(
             "CELERY_RESULT_BACKEND", "redis://localhost:6379/0"
         )
+        # Task messages and stored results; "orjson" is plain JSON written by a
+        # faster codec, "msgpack" is binary and needs the msgpack package.
+        self.task_serializer = os.getenv("CELERY_TASK_SERIALIZER", "orjson")
+        self.result_serializer = os.getenv(
+            "CELERY_RESULT_SERIALIZER", self.task_serializer
+        )
         default_include = "infrastructure.celery.tasks"
         self.include_modules = [
             module.strip()
             for module in os.getenv("CELERY_INCLUDE", default_include).split(",")
             if module.strip()
         ]
+        self.chunk_size = int_env("TEXT_CHUNK_SIZE", DEFAULT_CHUNK_SIZE)
+        # Texts above the threshold are split into shards processed in parallel.
+        self.shard_threshold = int_env("TEXT_SHARD_THRESHOLD", 1024 * 1024)
+        self.shard_size = int_env("TEXT_SHARD_SIZE", 256 * 1024)
+        # Progress writes are coalesced so per-chunk steps cannot flood the backend.
+        self.progress_min_interval = float_env("CELERY_PROGRESS_MIN_INTERVAL", 1.0)
+        self.progress_min_delta = int_env("CELERY_PROGRESS_MIN_DELTA", 5)
+        # Simulated cost of each processing step; see domain.workload.
+        self.step_seconds = float_env("TASK_STEP_SECONDS", 2.0)
+        self.step_jitter = float_env("TASK_STEP_JITTER", 0.0)
+        # Tasks one ``--pool asyncio`` worker keeps in flight unless
+        # ``--concurrency`` is given; they wait on steps, not on a CPU.
+        self.asyncio_concurrency = int_env("CELERY_ASYNCIO_CONCURRENCY", 100)
+        # Share of processing runs captured under cProfile, on top of explicit
+        # per-submission requests; 0 keeps the profiler entirely out of the path.
+        self.profile_sample_rate = float_env("TASK_PROFILE_SAMPLE_RATE", 0.0)
+        self.profile_top_functions = int_env("TASK_PROFILE_TOP_FUNCTIONS", 30)
+        # Running tasks look for a cancellation request at most this often.
+        self.cancel_check_interval = float_env("TASK_CANCEL_CHECK_INTERVAL", 0.5)
+        # Short work is kept away from long bulk runs on a queue of its own.
+        self.bulk_text_threshold = int_env("TASK_BULK_TEXT_THRESHOLD", 64 * 1024)
+        self.interactive_queue = QueueSettings(
+            name=os.getenv("CELERY_INTERACTIVE_QUEUE", "interactive"),
+            prefetch_multiplier=int_env("CELERY_INTERACTIVE_PREFETCH", 4),
+            acks_late=bool_env("CELERY_INTERACTIVE_ACKS_LATE", False),
+        )
+        # One long task per worker process at a time, redelivered if it dies.
+        self.bulk_queue = QueueSettings(
+            name=os.getenv("CELERY_BULK_QUEUE", "bulk"),
+            prefetch_multiplier=int_env("CELERY_BULK_PREFETCH", 1),
+            acks_late=bool_env("CELERY_BULK_ACKS_LATE", True),
+        )
+
+        # Results stay in Redis for RESULT_ARCHIVE_AFTER seconds before a
+        # periodic task moves them to the SQLite archive; CELERY_RESULT_EXPIRES
+        # caps their lifetime in Redis should archiving fall behind.
+        self.result_expires = int_env("CELERY_RESULT_EXPIRES", 24 * 3600)
+        self.result_archive_after = int_env("RESULT_ARCHIVE_AFTER", 3600)
+        self.result_archive_interval = float_env("RESULT_ARCHIVE_INTERVAL", 300.0)
+        self.result_archive_batch_size = int_env("RESULT_ARCHIVE_BATCH_SIZE", 500)
+
+    @property
+    def queues(self) -> tuple[QueueSettings, ...]:
+        return (self.interactive_queue, self.bulk_queue)
+
+    def queue_settings(self, name: str) -> QueueSettings:
+        """Return the settings of a configured queue, by name."""
+        for queue in self.queues:
+            if queue.name == name:
+                return queue
+        raise ValueError(f"Unknown queue: {name}")
 
     @property
     def config_dict(self) -> dict[str, Any]:
         """Return configuration as a dictionary."""
         return {
-            "task_serializer": "json",
-            "accept_content": ["json"],
-            "result_serializer": "json",
+            "task_serializer": self.task_serializer,
+            # Either JSON flavour is accepted so mixed deployments interoperate.
+            "accept_content": sorted(
+                {"json", "orjson", self.task_serializer, self.result_serializer}
+            ),
+            "result_serializer": self.result_serializer,
             "timezone": os.getenv("CELERY_TIMEZONE", "UTC"),
-            "enable_utc": _bool_env("CELERY_ENABLE_UTC", True),
+            "enable_utc": bool_env("CELERY_ENABLE_UTC", True),
             "broker_transport_options": {
-                "visibility_timeout": _int_env("CELERY_BROKER_VISIBILITY_TIMEOUT", 3600)
+                "visibility_timeout": int_env("CELERY_BROKER_VISIBILITY_TIMEOUT", 3600)
             },
             "result_backend_transport_options": {
-                "visibility_timeout": _int_env("CELERY_RESULT_VISIBILITY_TIMEOUT", 3600)
+                "visibility_timeout": int_env("CELERY_RESULT_VISIBILITY_TIMEOUT", 3600)
             },
+            "result_expires": self.result_expires,
+            "beat_schedule": self._beat_schedule(),
+            # Workers started without -Q consume every queue declared here.
+            "task_queues": tuple(
+                Queue(queue.name, routing_key=queue.name) for queue in self.queues
+            ),
+            "task_default_queue": self.interactive_queue.name,
+            "task_routes": (
+                TaskRouter(
+                    self.interactive_queue.name,
+                    self.bulk_queue.name,
+                    self.bulk_text_threshold,
+                ),
+            ),
+        }
+
+    def _beat_schedule(self) -> dict[str, dict[str, Any]]:
+        if self.result_archive_interval <= 0:
+            return {}
+        return {
+            "archive-results": {
+                "task": ARCHIVE_RESULTS_TASK,
+                "schedule": self.result_archive_interval,
+                # A run that could not start before the next one is skipped.
+                "options": {"expires": self.result_archive_interval},
+            }
         }
@@ -0,0 +1,59 @@
+"""Opt-in cProfile capture of individual task runs."""
+
+from __future__ import annotations
+
+import cProfile
+import marshal
+import pstats
+import random
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from infrastructure.celery.publishing import PROFILE_HEADER
+from infrastructure.redis import TaskProfileStore
+
+ResultT = TypeVar("ResultT")
+
+
+def should_profile(request: Any, sample_rate: float) -> bool:
+    """Return whether this run was flagged on submission or drawn by sampling."""
+    if request.get(PROFILE_HEADER):
+        return True
+    return sample_rate > 0 and random.random() < sample_rate
+
+
+def run_profiled(
+    task_id: str,
+    func: Callable[[], ResultT],
+    store: TaskProfileStore,
+    top: int,
+) -> ResultT:
+    """Run ``func`` under cProfile and store the profile, even if it raises."""
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func)
+    finally:
+        stats = pstats.Stats(profiler)
+        store.save(task_id, summarize_profile(stats, top), marshal.dumps(stats.stats))
+
+
+def summarize_profile(stats: pstats.Stats, top: int) -> dict[str, Any]:
+    """Return the ``top`` functions by cumulative time."""
+    entries = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+    functions = [
+        {
+            "function": pstats.func_std_string(function),
+            "calls": calls,
+            "primitive_calls": primitive_calls,
+            "total_seconds": round(total_time, 6),
+            "cumulative_seconds": round(cumulative_time, 6),
+        }
+        for function, (primitive_calls, calls, total_time, cumulative_time, _) in (
+            entries[:top]
+        )
+    ]
+    return {
+        "total_seconds": round(stats.total_tt, 6),
+        "function_count": len(entries),
+        "functions": functions,
+    }
@@ -0,0 +1,251 @@
+"""Throttled progress reporting for long-running Celery tasks."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from celery import Task
+from celery.backends.base import Backend
+from celery.backends.redis import RedisBackend
+from redis.client import Pipeline
+
+from domain.progress import is_terminal_state
+from domain.text_processing import compute_progress
+from infrastructure.redis import ProgressEventPublisher
+from models.task_models import ProgressUpdate
+
+PROGRESS_STATE = "PROGRESS"
+SHARD_PROGRESS_PREFIX = "task-shard-progress:"
+
+
+def store_progress(backend: Backend, task_id: str, progress: dict[str, Any]) -> bool:
+    """Store ``progress`` as the task's state unless a newer state is stored.
+
+    On Redis the write is a compare-and-set: the stored state is read under
+    ``WATCH`` and replaced only when it is not final and its ``version`` is
+    lower than the new one, so concurrent writers can never take a task
+    backwards. Returns whether the state was written. Other backends have no
+    such primitive and are written unconditionally.
+    """
+    if not isinstance(backend, RedisBackend):
+        backend.store_result(task_id, progress, PROGRESS_STATE)
+        return True
+
+    key = backend.get_key_for_task(task_id)
+    value = _encode_progress(backend, task_id, progress)
+
+    def write_if_newer(pipe: Pipeline) -> bool:
+        if not _accepts_version(pipe, backend, key, progress["version"]):
+            return False
+        pipe.multi()
+        _set_progress(pipe, backend, key, value)
+        return True
+
+    return backend.client.transaction(write_if_newer, key, value_from_callable=True)
+
+
+def clear_shard_progress(backend: RedisBackend, parent_id: str) -> None:
+    """Drop the step counter of a parent task once its shards are merged."""
+    backend.client.delete(f"{SHARD_PROGRESS_PREFIX}{parent_id}")
+
+
+class ProgressThrottle:
+    """Decide which progress updates are worth writing.
+
+    An update is due when nothing was written yet, when ``min_interval``
+    seconds passed since the last write, when progress advanced by at least
+    ``min_delta`` percent, or when it is the final step.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_interval: float,
+        min_delta: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._min_interval = min_interval
+        self._min_delta = min_delta
+        self._clock = clock
+        self._last_written_at: float | None = None
+        self._last_progress = 0
+
+    def is_due(self, update: ProgressUpdate) -> bool:
+        return (
+            self._last_written_at is None
+            or self._clock() - self._last_written_at >= self._min_interval
+            or update.progress - self._last_progress >= self._min_delta
+            or update.current >= update.total
+        )
+
+    def written(self, progress: int) -> None:
+        """Record that an update at ``progress`` percent was written."""
+        self._last_written_at = self._clock()
+        self._last_progress = progress
+
+
+class ProgressReporter:
+    """Coalesce progress updates of a task before they reach the result backend.
+
+    Updates are written when ``throttle`` finds them due; anything skipped is
+    written by :meth:`flush`. Each write is versioned by its step count, which
+    only grows as the task advances, and is stored only if no newer state is;
+    see :func:`store_progress`.
+    """
+
+    def __init__(
+        self,
+        task: Task,
+        throttle: ProgressThrottle,
+        *,
+        publisher: ProgressEventPublisher | None = None,
+    ) -> None:
+        self._task = task
+        self._task_id = task.request.id or ""
+        self._throttle = throttle
+        self._publisher = publisher
+        self._pending: ProgressUpdate | None = None
+
+    def report(self, update: ProgressUpdate) -> bool:
+        """Record ``update`` and write it if a threshold is crossed."""
+        self._pending = update
+        if self._throttle.is_due(update):
+            self._write(update)
+            return True
+        return False
+
+    def flush(self) -> None:
+        """Write the latest coalesced update, if any is outstanding."""
+        if self._pending is not None:
+            self._write(self._pending)
+
+    def _write(self, update: ProgressUpdate) -> None:
+        # Dumping once and overriding the version avoids copying the model.
+        meta = {**update.model_dump(), "version": update.current}
+        stored = store_progress(self._task.backend, self._task_id, meta)
+        if stored and self._publisher is not None:
+            self._publisher.publish(self._task_id, {"state": PROGRESS_STATE, **meta})
+        self._pending = None
+        self._throttle.written(update.progress)
+
+
+class ShardProgressReporter:
+    """Report the steps of one shard as progress of its parent task.
+
+    Every shard of a parent adds its steps to one counter. The parent's
+    progress, and its version, are the counter's value; they are computed and
+    written in the same Redis transaction that advances the counter, which
+    watches the counter and the parent's state. A write is skipped when the
+    stored state is final or newer, so the parent only moves forward whatever
+    order shards finish their steps in. A shard's own progress is never
+    written to the parent. Requires the Redis result backend.
+    """
+
+    def __init__(
+        self,
+        task: Task,
+        throttle: ProgressThrottle,
+        *,
+        parent_id: str,
+        total_steps: int,
+        publisher: ProgressEventPublisher | None = None,
+    ) -> None:
+        self._backend: RedisBackend = task.backend
+        self._throttle = throttle
+        self._parent_id = parent_id
+        self._total_steps = total_steps
+        self._publisher = publisher
+        self._counter_key = f"{SHARD_PROGRESS_PREFIX}{parent_id}"
+        self._state_key = self._backend.get_key_for_task(parent_id)
+
+    def advance(self, description: str) -> bool:
+        """Count one finished step; write the parent's progress if it is due."""
+        backend = self._backend
+
+        def advance_counter(pipe: Pipeline) -> dict[str, Any] | None:
+            completed = int(pipe.get(self._counter_key) or 0) + 1
+            progress = compute_progress(completed, self._total_steps)
+            update = ProgressUpdate(
+                current=completed,
+                total=self._total_steps,
+                progress=progress,
+                status=f"{description}: {progress}%",
+                version=completed,
+            )
+            write = self._throttle.is_due(update) and _accepts_version(
+                pipe, backend, self._state_key, completed
+            )
+            pipe.multi()
+            _set_with_expiry(pipe, backend, self._counter_key, completed)
+            if not write:
+                return None
+            meta = update.model_dump()
+            value = _encode_progress(backend, self._parent_id, meta)
+            _set_progress(pipe, backend, self._state_key, value)
+            return meta
+
+        meta = backend.client.transaction(
+            advance_counter,
+            self._counter_key,
+            self._state_key,
+            value_from_callable=True,
+        )
+        if meta is None:
+            return False
+        self._throttle.written(meta["progress"])
+        if self._publisher is not None:
+            self._publisher.publish(self._parent_id, {"state": PROGRESS_STATE, **meta})
+        return True
+
+
+def _encode_progress(
+    backend: RedisBackend, task_id: str, progress: dict[str, Any]
+) -> bytes | str:
+    # Same layout as the backend's own writes of a state that is not final.
+    return backend.encode(
+        {
+            "status": PROGRESS_STATE,
+            "result": progress,
+            "traceback": None,
+            "children": [],
+            "date_done": None,
+            "task_id": task_id,
+        }
+    )
+
+
+def _accepts_version(
+    pipe: Pipeline, backend: RedisBackend, key: str, version: int
+) -> bool:
+    """Return whether the state under ``key`` may be replaced at ``version``."""
+    stored = pipe.get(key)
+    if stored is None:
+        return True
+    meta = backend.decode_result(stored)
+    state = meta.get("status")
+    if is_terminal_state(state):
+        return False
+    if state != PROGRESS_STATE:
+        return True
+    result = meta.get("result")
+    stored_version = result.get("version", 0) if isinstance(result, dict) else 0
+    return int(stored_version) < version
+
+
+def _set_with_expiry(
+    pipe: Pipeline, backend: RedisBackend, key: str, value: Any
+) -> None:
+    if backend.expires:
+        pipe.setex(key, int(backend.expires), value)
+    else:
+        pipe.set(key, value)
+
+
+def _set_progress(
+    pipe: Pipeline, backend: RedisBackend, key: str, value: bytes | str
+) -> None:
+    _set_with_expiry(pipe, backend, key, value)
+    # The backend announces every state it stores on the key's channel.
+    pipe.publish(key, value)
@@ -0,0 +1,21 @@
+"""Celery signal handlers run by every process that publishes tasks."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from celery.signals import before_task_publish
+
+from infrastructure.metrics import metrics_config
+
+ENQUEUED_AT_HEADER = "enqueued_at"
+# Set on submission to ask the worker for a profile of that run.
+PROFILE_HEADER = "profile"
+
+
+@before_task_publish.connect
+def stamp_enqueue_time(headers: dict[str, Any] | None = None, **_kwargs: Any) -> None:
+    """Record the publish time so workers can measure how long tasks queued."""
+    if headers is not None and metrics_config.enabled:
+        headers.setdefault(ENQUEUED_AT_HEADER, time.time())
@@ -0,0 +1,77 @@
+"""Bulk access to task metadata in the result backend and its archive."""
+
+from __future__ import annotations
+
+import sqlite3
+import zlib
+from collections.abc import Sequence
+from typing import Any
+
+from celery import Celery
+from celery.backends.base import BaseKeyValueStoreBackend
+from kombu.exceptions import KombuError
+from redis.exceptions import RedisError
+
+from infrastructure.storage import SQLiteResultArchive
+
+# What reading a stored result can raise: the backend connection, payloads the
+# codec cannot decode (KombuError), the archive, and compacted result text.
+RESULT_READ_ERRORS: tuple[type[Exception], ...] = (
+    RedisError,
+    KombuError,
+    sqlite3.Error,
+    OSError,
+    zlib.error,
+    ValueError,
+)
+
+
+def fetch_task_metas(
+    app: Celery, task_ids: Sequence[str]
+) -> list[dict[str, Any] | None]:
+    """Return decoded result metadata per task id, ``None`` when nothing is stored.
+
+    Key/value backends such as Redis answer the whole batch with one MGET; other
+    backends fall back to one lookup per task.
+    """
+    backend = app.backend
+    if not isinstance(backend, BaseKeyValueStoreBackend):
+        return [backend.get_task_meta(task_id) for task_id in task_ids]
+    if not task_ids:
+        return []
+
+    keys = [backend.get_key_for_task(task_id) for task_id in task_ids]
+    values = backend.mget(keys)
+    if hasattr(values, "get"):
+        # Some clients (e.g. memcached) answer with a mapping keyed by cache key.
+        values = [values.get(key) for key in keys]
+    return [backend.decode_result(value) if value else None for value in values]
+
+
+def fill_from_archive(
+    app: Celery,
+    archive: SQLiteResultArchive,
+    task_ids: Sequence[str],
+    metas: Sequence[dict[str, Any] | None],
+) -> list[dict[str, Any] | None]:
+    """Replace metadata missing from the backend with archived payloads.
+
+    Archived payloads are decoded by the backend that wrote them, so callers
+    cannot tell an archived result from a live one.
+    """
+    missing = [
+        task_id
+        for task_id, meta in zip(task_ids, metas, strict=True)
+        if meta is None
+    ]
+    if not missing or not archive.enabled:
+        return list(metas)
+    payloads = archive.get_many(missing)
+    if not payloads:
+        return list(metas)
+    return [
+        app.backend.decode_result(payloads[task_id])
+        if meta is None and task_id in payloads
+        else meta
+        for task_id, meta in zip(task_ids, metas, strict=True)
+    ]
@@ -0,0 +1,73 @@
+"""Migration of old task results from the Redis hot tier to the cold archive."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Any
+
+from celery import Celery, states
+from celery.backends.redis import RedisBackend
+from kombu.utils.encoding import bytes_to_str
+
+from infrastructure.storage import SQLiteResultArchive
+
+logger = logging.getLogger(__name__)
+
+
+def archive_finished_results(
+    app: Celery,
+    archive: SQLiteResultArchive,
+    *,
+    older_than: float,
+    batch_size: int,
+) -> int:
+    """Move results finished more than ``older_than`` seconds ago to ``archive``.
+
+    Result keys are scanned, read and deleted ``batch_size`` at a time, and
+    each batch is committed to the archive before its keys leave Redis. Only
+    the Redis backend has a hot tier to drain; other backends are left alone.
+    Returns the number of results moved.
+    """
+    backend = app.backend
+    if not isinstance(backend, RedisBackend) or not archive.enabled:
+        return 0
+    client = backend.client
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=older_than)
+    pattern = f"{bytes_to_str(backend.task_keyprefix)}*"
+    keys = client.scan_iter(match=pattern, count=batch_size)
+
+    moved_total = 0
+    for batch in _batched(keys, batch_size):
+        moved: dict[str, bytes] = {}
+        for value in client.mget(batch):
+            meta = backend.decode(value) if value else None
+            if meta and _finished_before(meta, cutoff):
+                moved[meta["task_id"]] = value
+        if not moved:
+            continue
+        archive.put_many(moved)
+        client.delete(*(backend.get_key_for_task(task_id) for task_id in moved))
+        moved_total += len(moved)
+    logger.info("Archived %s finished task results", moved_total)
+    return moved_total
+
+
+def _finished_before(meta: dict[str, Any], cutoff: datetime) -> bool:
+    if meta.get("status") not in states.READY_STATES or not meta.get("date_done"):
+        return False
+    try:
+        date_done = datetime.fromisoformat(meta["date_done"])
+    except (TypeError, ValueError):
+        return False
+    if date_done.tzinfo is None:
+        date_done = date_done.replace(tzinfo=timezone.utc)
+    return date_done < cutoff
+
+
+def _batched(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
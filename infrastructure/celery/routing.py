@@ -0,0 +1,81 @@
+"""Routing of tasks to interactive and bulk queues by kind and input size."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+TASKS_MODULE = "infrastructure.celery.tasks"
+
+PROCESS_TEXT_TASK = f"{TASKS_MODULE}.process_text_task"
+PROCESS_TEXT_SHARD_TASK = f"{TASKS_MODULE}.process_text_shard_task"
+MERGE_TEXT_SHARDS_TASK = f"{TASKS_MODULE}.merge_text_shards_task"
+QUICK_ANALYSIS_TASK = f"{TASKS_MODULE}.quick_analysis_task"
+QUICK_ANALYSIS_BATCH_TASK = f"{TASKS_MODULE}.quick_analysis_batch_task"
+ARCHIVE_RESULTS_TASK = f"{TASKS_MODULE}.archive_results_task"
+
+_BULK_TASKS = frozenset(
+    {PROCESS_TEXT_SHARD_TASK, MERGE_TEXT_SHARDS_TASK, ARCHIVE_RESULTS_TASK}
+)
+
+
+@dataclass(frozen=True)
+class QueueSettings:
+    """Consumer settings applied by workers dedicated to one queue."""
+
+    name: str
+    prefetch_multiplier: int
+    acks_late: bool
+
+
+class TaskRouter:
+    """Celery router sending short work to the interactive queue.
+
+    Quick analyses and texts up to ``bulk_text_threshold`` characters stay on
+    the interactive queue; larger inputs, every shard of a split document and
+    housekeeping go to the bulk queue, so bulk bursts never sit in front of
+    interactive work.
+    """
+
+    def __init__(
+        self, interactive_queue: str, bulk_queue: str, bulk_text_threshold: int
+    ) -> None:
+        self._interactive_queue = interactive_queue
+        self._bulk_queue = bulk_queue
+        self._bulk_text_threshold = bulk_text_threshold
+
+    def __call__(
+        self,
+        name: str,
+        args: Sequence[Any] | None,
+        kwargs: dict[str, Any] | None,
+        options: dict[str, Any],
+        task: Any = None,
+        **_kw: Any,
+    ) -> dict[str, str] | None:
+        if name in _BULK_TASKS:
+            return {"queue": self._bulk_queue}
+        if name == QUICK_ANALYSIS_TASK:
+            return {"queue": self._interactive_queue}
+        if name in (PROCESS_TEXT_TASK, QUICK_ANALYSIS_BATCH_TASK):
+            return {"queue": self._queue_for_size(_input_size(args, kwargs))}
+        return None
+
+    def _queue_for_size(self, size: int) -> str:
+        if size > self._bulk_text_threshold:
+            return self._bulk_queue
+        return self._interactive_queue
+
+
+def _input_size(args: Sequence[Any] | None, kwargs: dict[str, Any] | None) -> int:
+    """Return the characters of a task's first argument (text or list of texts)."""
+    if args:
+        value = args[0]
+    else:
+        value = (kwargs or {}).get("text", (kwargs or {}).get("texts", ""))
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, (list, tuple)):
+        return sum(len(item) for item in value if isinstance(item, str))
+    return 0
@@ -0,0 +1,26 @@
+"""Kombu serializers available to task messages and stored results."""
+
+from __future__ import annotations
+
+from kombu.serialization import register
+
+from infrastructure.codec import dumps_json, loads_json
+
+ORJSON_SERIALIZER = "orjson"
+ORJSON_CONTENT_TYPE = "application/x-orjson"
+
+
+def register_serializers() -> None:
+    """Register the ``orjson`` serializer with kombu; safe to call repeatedly.
+
+    The encoding is ``binary`` so kombu hands the raw bytes to the decoder
+    instead of decoding them to text first. ``msgpack`` needs no registration:
+    kombu provides it whenever the ``msgpack`` package is installed.
+    """
+    register(
+        ORJSON_SERIALIZER,
+        dumps_json,
+        loads_json,
+        content_type=ORJSON_CONTENT_TYPE,
+        content_encoding="binary",
+    )
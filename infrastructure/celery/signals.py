@@ -0,0 +1,135 @@
+"""Worker-side Celery signal handlers broadcasting task states, load and metrics.
+
+Only worker processes load this module; handlers every publisher needs live in
+:mod:`infrastructure.celery.publishing`.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from celery.signals import (
+    setup_logging,
+    task_failure,
+    task_postrun,
+    task_prerun,
+    task_retry,
+    task_revoked,
+    task_success,
+    worker_init,
+    worker_ready,
+    worker_shutdown,
+)
+
+from domain.progress import build_progress_state
+from infrastructure.celery.publishing import ENQUEUED_AT_HEADER
+from infrastructure.metrics import (
+    count_task,
+    metrics_config,
+    observe_queue_wait,
+    start_metrics_server,
+)
+from infrastructure.redis import InFlightTaskCounter, ProgressEventPublisher
+from logging_config import configure_logging
+
+logger = logging.getLogger(__name__)
+
+progress_publisher = ProgressEventPublisher()
+in_flight_counter = InFlightTaskCounter()
+
+
+@task_success.connect
+def publish_task_success(sender: Any = None, **_kwargs: Any) -> None:
+    """Announce completion once the result has been stored."""
+    task_id = getattr(sender.request, "id", None) if sender else None
+    if task_id:
+        progress_publisher.publish(task_id, build_progress_state("SUCCESS", None))
+    if sender:
+        count_task(sender.name, "SUCCESS")
+
+
+@task_failure.connect
+def publish_task_failure(
+    sender: Any = None,
+    task_id: str | None = None,
+    exception: BaseException | None = None,
+    **_kwargs: Any,
+) -> None:
+    """Announce failures once the exception has been stored."""
+    if task_id:
+        progress_publisher.publish(task_id, build_progress_state("FAILURE", exception))
+    if sender:
+        count_task(sender.name, "FAILURE")
+
+
+@task_revoked.connect
+def publish_task_revoked(
+    sender: Any = None, request: Any = None, **_kwargs: Any
+) -> None:
+    """Announce revocations so subscribers can stop waiting."""
+    task_id = getattr(request, "id", None)
+    if task_id:
+        progress_publisher.publish(task_id, build_progress_state("REVOKED", None))
+    if sender:
+        count_task(sender.name, "REVOKED")
+
+
+@task_retry.connect
+def count_task_retry(sender: Any = None, **_kwargs: Any) -> None:
+    if sender:
+        count_task(sender.name, "RETRY")
+
+
+@task_prerun.connect
+def record_queue_wait(sender: Any = None, task: Any = None, **_kwargs: Any) -> None:
+    task = task or sender
+    if task is not None:
+        observe_queue_wait(task.name, task.request.get(ENQUEUED_AT_HEADER))
+
+
+@task_prerun.connect
+def track_task_start(sender: Any = None, task: Any = None, **_kwargs: Any) -> None:
+    """Count the task as in flight so the API can shed load when workers lag."""
+    task = task or sender
+    hostname = getattr(task.request, "hostname", None) if task else None
+    if hostname:
+        in_flight_counter.started(hostname)
+
+
+@task_postrun.connect
+def track_task_end(sender: Any = None, task: Any = None, **_kwargs: Any) -> None:
+    task = task or sender
+    hostname = getattr(task.request, "hostname", None) if task else None
+    if hostname:
+        in_flight_counter.finished(hostname)
+
+
+@worker_ready.connect
+@worker_shutdown.connect
+def reset_in_flight(sender: Any = None, **_kwargs: Any) -> None:
+    """Drop counts a previous run of this worker could not decrement."""
+    hostname = getattr(sender, "hostname", None)
+    if hostname:
+        in_flight_counter.reset(hostname)
+
+
+@setup_logging.connect
+def configure_worker_logging(loglevel: int | None = None, **_kwargs: Any) -> None:
+    """Keep the queued pipeline instead of Celery's synchronous root handler."""
+    configure_logging(level=loglevel)
+
+
+@worker_init.connect
+def start_worker_metrics(**_kwargs: Any) -> None:
+    """Expose worker metrics, which live outside the API process."""
+    if not metrics_config.enabled or metrics_config.worker_port <= 0:
+        return
+    try:
+        start_metrics_server(metrics_config.worker_port)
+    except OSError as exc:
+        logger.warning(
+            "Failed to start worker metrics server on port %s: %s",
+            metrics_config.worker_port,
+            str(exc),
+        )
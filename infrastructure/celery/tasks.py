@@ -2,34 +2,142 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import time
-from typing import Any
+from dataclasses import asdict
+from functools import partial
+from typing import Any, NoReturn
 
-from domain.text_processing import TextProcessor, iterate_processing_chunks
-from infrastructure.celery.app import get_celery_application
-from models.task_models import ProgressUpdate, TextProcessingResult
+from celery import Task, chord
+from celery.exceptions import Ignore
+
+from domain.batch_analysis import analyze_quick_batch
+from domain.progress import build_progress_state
+from domain.text_processing import (
+    TextProcessor,
+    TextShard,
+    TextStatistics,
+    analyze_text_quick,
+    iterate_processing_chunks,
+    plan_shards,
+)
+from domain.workload import SyntheticWorkload
+from infrastructure.celery.app import get_celery_application, get_celery_config
+from infrastructure.celery.asyncio_pool import AwaitableTask, run_blocking
+from infrastructure.celery.cancellation import CancellationCheck, TaskCancelledError
+from infrastructure.celery.profiling import run_profiled, should_profile
+from infrastructure.celery.progress import (
+    ProgressReporter,
+    ProgressThrottle,
+    ShardProgressReporter,
+    clear_shard_progress,
+)
+from infrastructure.celery.retention import archive_finished_results
+from infrastructure.celery.signals import progress_publisher
+from infrastructure.metrics import count_task, timed_steps
+from infrastructure.redis import TaskCancellationFlags, TaskProfileStore
+from infrastructure.storage import (
+    LocalBlobStore,
+    SQLiteResultArchive,
+    StorageConfig,
+    pack_result,
+)
+from logging_config import LoggingConfig, SampledDebugLog
+from models.task_models import ProgressUpdate, TextProcessingResult, TextShardResult
 
 logger = logging.getLogger(__name__)
 
 celery_app = get_celery_application()
+celery_config = get_celery_config()
+logging_config = LoggingConfig()
+cancellation_flags = TaskCancellationFlags()
+profile_store = TaskProfileStore()
+storage_config = StorageConfig()
+blob_store = LocalBlobStore(storage_config)
+result_archive = SQLiteResultArchive(storage_config)
+workload = SyntheticWorkload(
+    step_seconds=celery_config.step_seconds, jitter=celery_config.step_jitter
+)
 
 
-@celery_app.task(bind=True)
-def process_text_task(self, text: str) -> dict[str, Any]:
+def _new_throttle() -> ProgressThrottle:
+    return ProgressThrottle(
+        min_interval=celery_config.progress_min_interval,
+        min_delta=celery_config.progress_min_delta,
+    )
+
+
+def _new_reporter(task: Task) -> ProgressReporter:
+    return ProgressReporter(task, _new_throttle(), publisher=progress_publisher)
+
+
+def _new_cancellation_check(task_id: str) -> CancellationCheck:
+    return CancellationCheck(
+        cancellation_flags,
+        task_id,
+        min_interval=celery_config.cancel_check_interval,
+    )
+
+
+def _stop_cancelled(task: Task, task_id: str) -> NoReturn:
+    """Store ``task_id`` as revoked and end the run without a result.
+
+    ``task_id`` is the id the client holds, which for a shard is its parent;
+    the shard itself is marked revoked too. Neither is reported as a chord
+    part, so the merge step never runs and cannot overwrite the parent state.
+    """
+    logger.info("Task %s stopped after a cancellation request", task_id)
+    for revoked_id in dict.fromkeys((task.request.id, task_id)):
+        if revoked_id:
+            task.backend.mark_as_revoked(revoked_id, reason="Cancelled by request")
+    progress_publisher.publish(task_id, build_progress_state("REVOKED", None))
+    count_task(task.name, "REVOKED")
+    raise Ignore()
+
+
+@celery_app.task(bind=True, base=AwaitableTask)
+async def process_text_task(self, text: str) -> dict[str, Any]:
     """Main text processing task."""
+    task_id = self.request.id or ""
+    try:
+        if should_profile(self.request, celery_config.profile_sample_rate):
+            # cProfile would also record every other task sharing the loop, so
+            # a profiled run gets a thread and an event loop of its own.
+            return await asyncio.to_thread(
+                run_profiled,
+                task_id,
+                partial(run_blocking, self, _process_text(self, text), self.request),
+                profile_store,
+                celery_config.profile_top_functions,
+            )
+        return await _process_text(self, text)
+    except TaskCancelledError:
+        _stop_cancelled(self, task_id)
+
+
+async def _process_text(task: Task, text: str) -> dict[str, Any]:
     logger.debug("Starting text processing task with text length: %s", len(text))
-    processor = TextProcessor()
+    if len(text) > celery_config.shard_threshold:
+        return _replace_with_shards(task, text)
+
+    processor = TextProcessor(chunk_size=celery_config.chunk_size)
+    statistics = TextStatistics()
+    reporter = _new_reporter(task)
+    cancellation = _new_cancellation_check(task.request.id or "")
+    log_step = SampledDebugLog(logger, logging_config.step_sample_every)
     results: list[str] = []
 
-    for step, processed_chunk in iterate_processing_chunks(text, processor):
-        time.sleep(2)  # Simulate processing
+    steps = iterate_processing_chunks(text, processor, statistics)
+    for step, processed_chunk in timed_steps(steps):
+        cancellation.raise_if_requested()
+        await workload.run_step_async()  # Simulate processing
 
-        logger.debug(
+        log_step(
             "Processing step %s/%s: %s",
             step.index,
             step.total_steps,
             step.description,
+            last=step.index == step.total_steps,
         )
         progress_update = ProgressUpdate(
             current=step.index,
@@ -37,32 +145,144 @@ def process_text_task(self, text: str) -> dict[str, Any]:
             progress=step.progress,
             status=f"{step.description}: {step.progress}%",
         )
-        self.update_state(
-            state="PROGRESS",
-            meta=progress_update.model_dump(),
-        )
+        reporter.report(progress_update)
 
         results.append(processed_chunk)
 
+    reporter.flush()
+
     logger.debug("Text processing task completed successfully")
     result = TextProcessingResult(
-        task_id=self.request.id or "",
-        status="SUCCESS",
+        task_id=task.request.id or "",
         processed_text="\n".join(results),
-        original_text=text,
-        word_count=len(text.split()),
-        char_count=len(text),
+        original_text_ref=blob_store.put_text(text),
+        word_count=statistics.word_count,
+        char_count=statistics.char_count,
         steps_completed=len(results),
     )
-    return result.model_dump()
+    return _compact(result)
+
+
+def _compact(result: TextProcessingResult) -> dict[str, Any]:
+    payload = result.model_dump(exclude={"original_text", "processed_text_encoding"})
+    return pack_result(payload, storage_config.compression_threshold)
+
+
+def _replace_with_shards(task: Task, text: str) -> dict[str, Any]:
+    """Fan the text out as a chord of shards merged under the parent task id."""
+    parent_id = task.request.id or ""
+    shards = plan_shards(text, celery_config.chunk_size, celery_config.shard_size)
+    steps_per_chunk = len(TextProcessor().steps)
+    total_steps = steps_per_chunk * sum(shard.chunk_count for shard in shards)
+    logger.debug(
+        "Splitting task %s into %s shards (%s steps)",
+        parent_id,
+        len(shards),
+        total_steps,
+    )
+
+    header = [
+        process_text_shard_task.s(
+            text[shard.start : shard.end],
+            asdict(shard),
+            parent_id=parent_id,
+            total_steps=total_steps,
+        )
+        for shard in shards
+    ]
+    # The chord body inherits the parent id, so it stores the merged result there.
+    merge = merge_text_shards_task.s(original_text_ref=blob_store.put_text(text))
+    return task.replace(chord(header, merge))
+
+
+@celery_app.task(bind=True, base=AwaitableTask)
+async def process_text_shard_task(
+    self,
+    text: str,
+    shard: dict[str, Any],
+    *,
+    parent_id: str,
+    total_steps: int,
+) -> dict[str, Any]:
+    """Process one shard, reporting aggregate progress under the parent task.
+
+    ``shard`` holds the fields of the :class:`TextShard` that ``text`` covers.
+    """
+    text_shard = TextShard(**shard)
+    processor = TextProcessor(chunk_size=celery_config.chunk_size)
+    statistics = TextStatistics(ends_inside_word=text_shard.continues_word)
+    reporter = ShardProgressReporter(
+        self,
+        _new_throttle(),
+        parent_id=parent_id,
+        total_steps=total_steps,
+        publisher=progress_publisher,
+    )
+    # Clients cancel the id they were given, which is the parent's.
+    cancellation = _new_cancellation_check(parent_id)
+    results: list[str] = []
+
+    steps = iterate_processing_chunks(text, processor, statistics)
+    for step, processed_chunk in timed_steps(steps):
+        try:
+            cancellation.raise_if_requested()
+        except TaskCancelledError:
+            _stop_cancelled(self, parent_id)
+        await workload.run_step_async()  # Simulate processing
+
+        reporter.advance(step.description)
+        results.append(processed_chunk)
+
+    shard_result = TextShardResult(
+        shard_index=text_shard.index,
+        processed_text="\n".join(results),
+        word_count=statistics.word_count,
+        char_count=statistics.char_count,
+        steps_completed=len(results),
+    )
+    return shard_result.model_dump()
+
+
+@celery_app.task(bind=True)
+def merge_text_shards_task(
+    self, shard_results: list[dict[str, Any]], *, original_text_ref: str
+) -> dict[str, Any]:
+    """Merge shard outputs, in document order, into the parent's result."""
+    task_id = self.request.id or ""
+    shards = sorted(
+        (TextShardResult(**shard) for shard in shard_results),
+        key=lambda shard: shard.shard_index,
+    )
+    clear_shard_progress(self.backend, task_id)
+    result = TextProcessingResult(
+        task_id=task_id,
+        processed_text="\n".join(shard.processed_text for shard in shards),
+        original_text_ref=original_text_ref,
+        word_count=sum(shard.word_count for shard in shards),
+        char_count=sum(shard.char_count for shard in shards),
+        steps_completed=sum(shard.steps_completed for shard in shards),
+    )
+    return _compact(result)
 
 
 @celery_app.task
 def quick_analysis_task(text: str) -> dict[str, Any]:
     """Quick analysis task."""
-    return {
-        "word_count": len(text.split()),
-        "char_count": len(text),
-        "contains_letters": any(c.isalpha() for c in text),
-        "analysis_type": "quick",
-    }
+    return analyze_text_quick(text)
+
+
+@celery_app.task
+def quick_analysis_batch_task(texts: list[str]) -> dict[str, Any]:
+    """Quick analysis of many texts in one vectorised pass."""
+    return analyze_quick_batch(texts)
+
+
+@celery_app.task(ignore_result=True)
+def archive_results_task() -> int:
+    """Move results past the hot window from Redis to the SQLite archive."""
+    return archive_finished_results(
+        celery_app,
+        result_archive,
+        older_than=celery_config.result_archive_after,
+        batch_size=celery_config.result_archive_batch_size,
+    )
@@ -0,0 +1,27 @@
+"""Prometheus instrumentation of task processing and API latency."""
+
+from __future__ import annotations
+
+from .config import MetricsConfig
+from .instruments import (
+    count_rejection,
+    count_task,
+    metrics_config,
+    observe_queue_wait,
+    observe_request,
+    render_metrics,
+    start_metrics_server,
+    timed_steps,
+)
+
+__all__ = [
+    "MetricsConfig",
+    "count_rejection",
+    "count_task",
+    "metrics_config",
+    "observe_queue_wait",
+    "observe_request",
+    "render_metrics",
+    "start_metrics_server",
+    "timed_steps",
+]
@@ -0,0 +1,19 @@
+"""Metrics configuration using a class-based approach."""
+
+from __future__ import annotations
+
+import os
+
+from infrastructure.env import bool_env, int_env
+
+
+class MetricsConfig:
+    """Configuration class for Prometheus instrumentation."""
+
+    def __init__(self) -> None:
+        self.enabled = bool_env("METRICS_ENABLED", True)
+        # Workers have no HTTP server of their own; 0 disables the exporter.
+        self.worker_port = int_env("WORKER_METRICS_PORT", 9808)
+        # Set for prefork workers or multi-process API servers so every process
+        # writes to shared files that one exporter aggregates.
+        self.multiprocess_dir = os.getenv("PROMETHEUS_MULTIPROC_DIR")
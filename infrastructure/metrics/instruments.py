@@ -0,0 +1,128 @@
+"""Prometheus instruments shared by the API and the workers."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable, Iterator
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+    start_http_server,
+)
+
+from domain.text_processing import ProcessingStep
+
+from .config import MetricsConfig
+
+metrics_config = MetricsConfig()
+
+# Steps default to seconds-long simulated work, queue waits range from
+# milliseconds to minutes, and API calls should stay well under a second.
+_WAIT_BUCKETS = (0.005, 0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+_STEP_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 3, 5, 10)
+_REQUEST_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5)
+
+TASK_QUEUE_WAIT = Histogram(
+    "task_queue_wait_seconds",
+    "Time between publishing a task and a worker starting it.",
+    ["task"],
+    buckets=_WAIT_BUCKETS,
+)
+TASK_STEP_DURATION = Histogram(
+    "task_step_duration_seconds",
+    "Duration of one processing step, including its share of chunk handling.",
+    ["step"],
+    buckets=_STEP_BUCKETS,
+)
+TASKS_TOTAL = Counter(
+    "tasks_total",
+    "Tasks that reached a final or retry state.",
+    ["task", "state"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "API request latency by route template.",
+    ["method", "route", "status"],
+    buckets=_REQUEST_BUCKETS,
+)
+SUBMISSIONS_REJECTED = Counter(
+    "task_submissions_rejected_total",
+    "Submissions refused by admission control.",
+    ["reason"],
+)
+
+
+def observe_queue_wait(task_name: str, enqueued_at: float | None) -> None:
+    """Record how long a task sat in the broker; clock skew is clamped to zero."""
+    if not metrics_config.enabled or enqueued_at is None:
+        return
+    TASK_QUEUE_WAIT.labels(task=task_name).observe(max(0.0, time.time() - enqueued_at))
+
+
+def count_task(task_name: str, state: str) -> None:
+    if metrics_config.enabled:
+        TASKS_TOTAL.labels(task=task_name, state=state).inc()
+
+
+def count_rejection(reason: str) -> None:
+    if metrics_config.enabled:
+        SUBMISSIONS_REJECTED.labels(reason=reason).inc()
+
+
+def observe_request(method: str, route: str, status: int, seconds: float) -> None:
+    if metrics_config.enabled:
+        HTTP_REQUEST_DURATION.labels(
+            method=method, route=route, status=str(status)
+        ).observe(seconds)
+
+
+def timed_steps(
+    steps: Iterable[tuple[ProcessingStep, str]],
+) -> Iterator[tuple[ProcessingStep, str]]:
+    """Yield ``steps`` unchanged, timing each from its production until the next.
+
+    The measured span covers both producing the step and the caller's loop body
+    for it, which is where the task does the step's work.
+    """
+    iterator = iter(steps)
+    while True:
+        started = time.perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        yield item
+        if metrics_config.enabled:
+            TASK_STEP_DURATION.labels(step=item[0].description).observe(
+                time.perf_counter() - started
+            )
+
+
+def _collecting_registry() -> CollectorRegistry | None:
+    if not metrics_config.multiprocess_dir:
+        return None
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Return the exposition payload and its content type."""
+    registry = _collecting_registry()
+    if registry is None:
+        return generate_latest(), CONTENT_TYPE_LATEST
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def start_metrics_server(port: int) -> None:
+    """Serve worker metrics over HTTP from a background thread."""
+    registry = _collecting_registry()
+    if registry is None:
+        start_http_server(port)
+    else:
+        start_http_server(port, registry=registry)
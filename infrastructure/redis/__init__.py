@@ -0,0 +1,30 @@
+"""Redis integrations that complement the Celery result backend."""
+
+from __future__ import annotations
+
+from .cancellation import TaskCancellationFlags
+from .clients import RedisClientFactory, redis_clients
+from .config import RedisConfig
+from .in_flight import InFlightTaskCounter
+from .profiles import TaskProfileStore
+from .progress_events import (
+    ProgressEventPublisher,
+    ProgressEventSubscriber,
+    progress_channel,
+)
+from .submissions import TaskSubmissionRegistry
+from .task_meta import AsyncTaskMetaReader
+
+__all__ = [
+    "AsyncTaskMetaReader",
+    "InFlightTaskCounter",
+    "ProgressEventPublisher",
+    "ProgressEventSubscriber",
+    "RedisClientFactory",
+    "RedisConfig",
+    "TaskCancellationFlags",
+    "TaskProfileStore",
+    "TaskSubmissionRegistry",
+    "progress_channel",
+    "redis_clients",
+]
@@ -0,0 +1,59 @@
+"""Flags asking running tasks to stop at their next step."""
+
+from __future__ import annotations
+
+import logging
+
+import redis
+
+from .clients import RedisClientFactory, redis_clients
+from .config import RedisConfig
+
+logger = logging.getLogger(__name__)
+
+CANCELLATION_PREFIX = "task-cancel:"
+
+
+class TaskCancellationFlags:
+    """Set and read per-task cancellation requests.
+
+    Revoking a Celery task only discards it before it starts, so running tasks
+    poll these flags between steps. Read failures are logged and reported as
+    "not cancelled" so that a Redis outage never aborts work.
+    """
+
+    def __init__(
+        self,
+        config: RedisConfig | None = None,
+        clients: RedisClientFactory | None = None,
+    ) -> None:
+        self._config = config or RedisConfig()
+        self._clients = clients or redis_clients
+
+    @property
+    def _client(self) -> redis.Redis:
+        return self._clients.client(self._config.url)
+
+    @property
+    def enabled(self) -> bool:
+        return self._config.cancellation_ttl > 0
+
+    def request(self, task_id: str) -> None:
+        """Ask ``task_id`` to stop; the flag outlives any queueing of the task."""
+        if not self.enabled:
+            return
+        self._client.set(
+            f"{CANCELLATION_PREFIX}{task_id}", 1, ex=self._config.cancellation_ttl
+        )
+
+    def is_requested(self, task_id: str) -> bool:
+        """Return whether cancellation of ``task_id`` was requested."""
+        if not self.enabled or not task_id:
+            return False
+        try:
+            return bool(self._client.exists(f"{CANCELLATION_PREFIX}{task_id}"))
+        except redis.RedisError as exc:
+            logger.warning(
+                "Failed to read cancellation flag for task_id=%s: %s", task_id, exc
+            )
+            return False
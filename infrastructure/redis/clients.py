@@ -0,0 +1,61 @@
+"""Redis clients shared by every integration of a process."""
+
+from __future__ import annotations
+
+import threading
+
+import redis
+import redis.asyncio as aioredis
+
+from .config import RedisConfig
+
+
+class RedisClientFactory:
+    """Hand out one client, and so one connection pool, per Redis URL.
+
+    Synchronous clients can be shared by threads and survive a fork, since
+    their pools reconnect in the child. Asyncio clients are bound to the event
+    loop that first uses them and are released by :meth:`aclose`.
+
+    Integrations look their client up when they use it, so a process whose
+    URLs do not point at Redis only fails if it actually needs Redis.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._clients: dict[str, redis.Redis] = {}
+        self._async_clients: dict[str, aioredis.Redis] = {}
+
+    def client(self, url: str) -> redis.Redis:
+        """Return the synchronous client for ``url``, creating it on first use."""
+        with self._lock:
+            client = self._clients.get(url)
+            if client is None:
+                client = self._clients[url] = redis.Redis.from_url(url)
+            return client
+
+    def async_client(self, url: str, config: RedisConfig) -> aioredis.Redis:
+        """Return the asyncio client for ``url``, pooled as ``config`` says."""
+        with self._lock:
+            client = self._async_clients.get(url)
+            if client is None:
+                pool = aioredis.BlockingConnectionPool.from_url(
+                    url,
+                    max_connections=config.max_connections,
+                    timeout=config.pool_timeout,
+                )
+                client = self._async_clients[url] = aioredis.Redis(
+                    connection_pool=pool
+                )
+            return client
+
+    async def aclose(self) -> None:
+        """Close the asyncio clients; later calls create fresh ones."""
+        with self._lock:
+            clients = list(self._async_clients.values())
+            self._async_clients.clear()
+        for client in clients:
+            await client.aclose(close_connection_pool=True)
+
+
+redis_clients = RedisClientFactory()
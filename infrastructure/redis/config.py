@@ -0,0 +1,25 @@
+"""Redis configuration using a class-based approach."""
+
+from __future__ import annotations
+
+import os
+
+from infrastructure.env import bool_env, float_env, int_env
+
+
+class RedisConfig:
+    """Configuration class for auxiliary Redis usage outside Celery."""
+
+    def __init__(self) -> None:
+        self.result_backend_url = os.getenv(
+            "CELERY_RESULT_BACKEND", "redis://localhost:6379/0"
+        )
+        self.url = os.getenv("REDIS_URL", self.result_backend_url)
+        self.progress_events_enabled = bool_env("PROGRESS_EVENTS_ENABLED", True)
+        self.max_connections = int_env("REDIS_MAX_CONNECTIONS", 64)
+        self.pool_timeout = float_env("REDIS_POOL_TIMEOUT", 5.0)
+        self.submission_ttl = int_env("TASK_DEDUP_TTL", 3600)
+        self.submitted_ttl = int_env("TASK_SUBMITTED_TTL", 24 * 3600)
+        self.profile_ttl = int_env("TASK_PROFILE_TTL", 24 * 3600)
+        self.cancellation_ttl = int_env("TASK_CANCEL_TTL", 24 * 3600)
+        self.in_flight_tracking = bool_env("TASK_IN_FLIGHT_TRACKING", True)
@@ -0,0 +1,69 @@
+"""Count of tasks currently executing, kept per worker."""
+
+from __future__ import annotations
+
+import logging
+
+import redis
+
+from .clients import RedisClientFactory, redis_clients
+from .config import RedisConfig
+
+logger = logging.getLogger(__name__)
+
+IN_FLIGHT_KEY = "task-in-flight"
+
+
+class InFlightTaskCounter:
+    """Track running tasks in one Redis hash with a field per worker hostname.
+
+    A worker resets its own field when it starts, so a worker that died with
+    tasks running does not leave the total inflated once it is back. Write
+    failures are logged and never interrupt a task.
+    """
+
+    def __init__(
+        self,
+        config: RedisConfig | None = None,
+        clients: RedisClientFactory | None = None,
+    ) -> None:
+        self._config = config or RedisConfig()
+        self._clients = clients or redis_clients
+
+    @property
+    def _client(self) -> redis.Redis:
+        return self._clients.client(self._config.url)
+
+    @property
+    def enabled(self) -> bool:
+        return self._config.in_flight_tracking
+
+    def started(self, worker: str) -> None:
+        self._increment(worker, 1)
+
+    def finished(self, worker: str) -> None:
+        self._increment(worker, -1)
+
+    def reset(self, worker: str) -> None:
+        """Forget the tasks recorded for ``worker``."""
+        if not self.enabled:
+            return
+        try:
+            self._client.hdel(IN_FLIGHT_KEY, worker)
+        except redis.RedisError as exc:
+            logger.warning("Failed to reset in-flight count of %s: %s", worker, exc)
+
+    def total(self) -> int:
+        """Return the number of tasks running across all workers."""
+        if not self.enabled:
+            return 0
+        counts = self._client.hvals(IN_FLIGHT_KEY)
+        return max(0, sum(int(count) for count in counts))
+
+    def _increment(self, worker: str, amount: int) -> None:
+        if not self.enabled:
+            return
+        try:
+            self._client.hincrby(IN_FLIGHT_KEY, worker, amount)
+        except redis.RedisError as exc:
+            logger.warning("Failed to update in-flight count of %s: %s", worker, exc)
@@ -0,0 +1,57 @@
+"""Storage of task profiles captured by workers."""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any
+
+import redis
+
+from .clients import RedisClientFactory, redis_clients
+from .config import RedisConfig
+
+logger = logging.getLogger(__name__)
+
+PROFILE_PREFIX = "task-profile:"
+
+_SUMMARY_FIELD = "summary"
+_RAW_FIELD = "raw"
+
+
+class TaskProfileStore:
+    """Keep a summary and the raw ``pstats`` dump of profiled tasks."""
+
+    def __init__(
+        self,
+        config: RedisConfig | None = None,
+        clients: RedisClientFactory | None = None,
+    ) -> None:
+        self._config = config or RedisConfig()
+        self._clients = clients or redis_clients
+
+    @property
+    def _client(self) -> redis.Redis:
+        return self._clients.client(self._config.url)
+
+    def save(self, task_id: str, summary: dict[str, Any], raw: bytes) -> None:
+        """Store a profile; failures are logged so the task result is unaffected."""
+        key = f"{PROFILE_PREFIX}{task_id}"
+        try:
+            pipeline = self._client.pipeline()
+            pipeline.hset(
+                key, mapping={_SUMMARY_FIELD: json.dumps(summary), _RAW_FIELD: raw}
+            )
+            pipeline.expire(key, self._config.profile_ttl)
+            pipeline.execute()
+        except (redis.RedisError, ValueError) as exc:
+            logger.warning("Failed to store profile for task_id=%s: %s", task_id, exc)
+
+    def load_summary(self, task_id: str) -> dict[str, Any] | None:
+        """Return the hot-function summary, or ``None`` if none was captured."""
+        summary = self._client.hget(f"{PROFILE_PREFIX}{task_id}", _SUMMARY_FIELD)
+        return json.loads(summary) if summary is not None else None
+
+    def load_raw(self, task_id: str) -> bytes | None:
+        """Return the marshalled ``pstats`` data, loadable with ``pstats.Stats``."""
+        return self._client.hget(f"{PROFILE_PREFIX}{task_id}", _RAW_FIELD)
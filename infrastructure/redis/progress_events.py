@@ -0,0 +1,151 @@
+"""Redis pub/sub channel carrying task progress events."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import AsyncIterator, Callable, Iterable
+from typing import Any
+
+import redis
+from redis.asyncio.client import PubSub
+
+from infrastructure.codec import dumps_json, loads_json
+
+from .clients import RedisClientFactory, redis_clients
+from .config import RedisConfig
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_CHANNEL_PREFIX = "task-progress:"
+
+
+def progress_channel(task_id: str) -> str:
+    """Return the pub/sub channel name for the given task."""
+    return f"{PROGRESS_CHANNEL_PREFIX}{task_id}"
+
+
+class ProgressEventPublisher:
+    """Publish progress payloads from worker processes."""
+
+    def __init__(
+        self,
+        config: RedisConfig | None = None,
+        clients: RedisClientFactory | None = None,
+    ) -> None:
+        self._config = config or RedisConfig()
+        self._clients = clients or redis_clients
+
+    @property
+    def _client(self) -> redis.Redis:
+        return self._clients.client(self._config.url)
+
+    @property
+    def enabled(self) -> bool:
+        return self._config.progress_events_enabled
+
+    def publish(self, task_id: str, payload: dict[str, Any]) -> None:
+        """Publish a progress payload; failures never interrupt the task."""
+        if not self.enabled or not task_id:
+            return
+        try:
+            self._client.publish(progress_channel(task_id), dumps_json(payload))
+        except redis.RedisError as exc:
+            logger.warning(
+                "Failed to publish progress event for task_id=%s: %s",
+                task_id,
+                str(exc),
+            )
+
+
+class ProgressEventSubscriber:
+    """Listen to progress events of watched tasks over a single connection.
+
+    Only the channels of tasks with a subscriber are subscribed, so each API
+    replica receives the events its own clients wait for rather than all of
+    them.
+    """
+
+    def __init__(
+        self,
+        config: RedisConfig | None = None,
+        clients: RedisClientFactory | None = None,
+    ) -> None:
+        self._config = config or RedisConfig()
+        self._clients = clients or redis_clients
+        self._pubsub: PubSub | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._config.progress_events_enabled
+
+    async def subscribe(self, task_id: str) -> None:
+        """Receive events of ``task_id`` on the open connection, if there is one."""
+        await self._send(task_id, subscribe=True)
+
+    async def unsubscribe(self, task_id: str) -> None:
+        """Stop receiving events of ``task_id``."""
+        await self._send(task_id, subscribe=False)
+
+    async def listen(
+        self,
+        task_ids: Iterable[str],
+        on_subscribed: Callable[[str], None] | None = None,
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Yield ``(task_id, payload)`` pairs as events are published.
+
+        ``task_ids`` is read once the connection is open and every id in it is
+        subscribed; :meth:`subscribe` adds more later. ``on_subscribed`` is
+        called with each task id once Redis confirmed its subscription; events
+        published earlier are not delivered.
+        """
+        client = self._clients.async_client(self._config.url, self._config)
+        pubsub = client.pubsub()
+        try:
+            await pubsub.connect()
+            self._pubsub = pubsub
+            channels = [progress_channel(task_id) for task_id in task_ids]
+            if channels:
+                await pubsub.subscribe(*channels)
+            while True:
+                message = await pubsub.get_message(timeout=None)
+                if message is None or message["type"] not in {"subscribe", "message"}:
+                    continue
+                task_id = message["channel"].decode()[len(PROGRESS_CHANNEL_PREFIX) :]
+                if message["type"] == "subscribe":
+                    if on_subscribed is not None:
+                        on_subscribed(task_id)
+                    continue
+                try:
+                    payload = loads_json(message["data"])
+                except (TypeError, ValueError):
+                    logger.warning(
+                        "Discarding malformed progress event for task_id=%s", task_id
+                    )
+                    continue
+                yield task_id, payload
+        finally:
+            if self._pubsub is pubsub:
+                self._pubsub = None
+            await pubsub.aclose()
+
+    async def close(self) -> None:
+        """Release the shared asyncio connection pools."""
+        await self._clients.aclose()
+
+    async def _send(self, task_id: str, subscribe: bool) -> None:
+        pubsub = self._pubsub
+        if pubsub is None:
+            return
+        channel = progress_channel(task_id)
+        try:
+            if subscribe:
+                await pubsub.subscribe(channel)
+            else:
+                await pubsub.unsubscribe(channel)
+        except redis.RedisError as exc:
+            # The listener fails on the same connection and resubscribes.
+            logger.warning(
+                "Failed to update progress subscription for task_id=%s: %s",
+                task_id,
+                str(exc),
+            )
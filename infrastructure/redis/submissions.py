@@ -0,0 +1,115 @@
+"""Registry mapping submission keys to the task that handles them."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+
+import redis
+
+from .clients import RedisClientFactory, redis_clients
+from .config import RedisConfig
+
+logger = logging.getLogger(__name__)
+
+SUBMISSION_PREFIX = "task-submission:"
+SUBMITTED_PREFIX = "task-submitted:"
+
+
+class TaskSubmissionRegistry:
+    """Remember which task id was issued for a content hash or idempotency key.
+
+    Registry failures are logged and reported as "no known task" so that
+    submissions keep working, without deduplication, while Redis is unavailable.
+
+    Every id handed out is also marked as submitted, which tells a queued task
+    the backend knows nothing about yet apart from an id that was never issued.
+    """
+
+    def __init__(
+        self,
+        config: RedisConfig | None = None,
+        clients: RedisClientFactory | None = None,
+    ) -> None:
+        self._config = config or RedisConfig()
+        self._clients = clients or redis_clients
+
+    @property
+    def _client(self) -> redis.Redis:
+        return self._clients.client(self._config.url)
+
+    @property
+    def enabled(self) -> bool:
+        return self._config.submission_ttl > 0
+
+    def claim(self, key: str, task_id: str) -> str | None:
+        """Map ``key`` to ``task_id`` unless it is taken; return the existing id."""
+        if not self.enabled:
+            return None
+        redis_key = f"{SUBMISSION_PREFIX}{key}"
+        try:
+            client = self._client
+            ttl = self._config.submission_ttl
+            if client.set(redis_key, task_id, nx=True, ex=ttl):
+                return None
+            existing = client.get(redis_key)
+            if existing is None:
+                # The previous mapping expired between the two calls.
+                client.set(redis_key, task_id, ex=ttl)
+                return None
+        except (redis.RedisError, ValueError) as exc:
+            logger.warning("Failed to claim submission key %s: %s", key, str(exc))
+            return None
+        return existing.decode()
+
+    def reassign(self, key: str, task_id: str) -> None:
+        """Point ``key`` at ``task_id`` after its previous task failed."""
+        if not self.enabled:
+            return
+        try:
+            self._client.set(
+                f"{SUBMISSION_PREFIX}{key}", task_id, ex=self._config.submission_ttl
+            )
+        except (redis.RedisError, ValueError) as exc:
+            logger.warning("Failed to reassign submission key %s: %s", key, str(exc))
+
+    def release(self, key: str, task_id: str) -> None:
+        """Forget ``key`` if it still points at ``task_id``."""
+        if not self.enabled:
+            return
+        redis_key = f"{SUBMISSION_PREFIX}{key}"
+        try:
+            if self._client.get(redis_key) == task_id.encode():
+                self._client.delete(redis_key)
+        except (redis.RedisError, ValueError) as exc:
+            logger.warning("Failed to release submission key %s: %s", key, str(exc))
+
+    def mark_submitted(self, task_ids: Sequence[str]) -> None:
+        """Remember that ``task_ids`` were handed out to clients."""
+        if self._config.submitted_ttl <= 0 or not task_ids:
+            return
+        try:
+            pipeline = self._client.pipeline(transaction=False)
+            for task_id in task_ids:
+                pipeline.set(
+                    f"{SUBMITTED_PREFIX}{task_id}", 1, ex=self._config.submitted_ttl
+                )
+            pipeline.execute()
+        except (redis.RedisError, ValueError) as exc:
+            logger.warning(
+                "Failed to mark %s tasks as submitted: %s", len(task_ids), exc
+            )
+
+    def was_submitted(self, task_id: str) -> bool:
+        """Return whether ``task_id`` was handed out recently.
+
+        Without markers, or when Redis cannot be read, every id counts as
+        submitted.
+        """
+        if self._config.submitted_ttl <= 0:
+            return True
+        try:
+            return bool(self._client.exists(f"{SUBMITTED_PREFIX}{task_id}"))
+        except (redis.RedisError, ValueError) as exc:
+            logger.warning("Failed to read submission of task_id=%s: %s", task_id, exc)
+            return True
@@ -0,0 +1,50 @@
+"""Non-blocking reads of Celery task metadata stored in Redis."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from celery import Celery
+from celery.backends.redis import RedisBackend
+
+from .clients import RedisClientFactory, redis_clients
+from .config import RedisConfig
+
+
+class AsyncTaskMetaReader:
+    """Read ``celery-task-meta-*`` keys over a shared asyncio connection pool.
+
+    Keys and payload decoding are delegated to the Celery backend so the reader
+    always agrees with whatever the workers wrote.
+    """
+
+    def __init__(
+        self,
+        app: Celery,
+        config: RedisConfig | None = None,
+        clients: RedisClientFactory | None = None,
+    ) -> None:
+        self._app = app
+        self._config = config or RedisConfig()
+        self._clients = clients or redis_clients
+
+    @property
+    def enabled(self) -> bool:
+        return isinstance(self._app.backend, RedisBackend)
+
+    async def get_many(self, task_ids: Sequence[str]) -> list[dict[str, Any] | None]:
+        """Return decoded metadata per task id using a single MGET."""
+        if not task_ids:
+            return []
+        backend = self._app.backend
+        keys = [backend.get_key_for_task(task_id) for task_id in task_ids]
+        client = self._clients.async_client(
+            self._config.result_backend_url, self._config
+        )
+        values = await client.mget(keys)
+        return [backend.decode_result(value) if value else None for value in values]
+
+    async def close(self) -> None:
+        """Release the shared asyncio connection pools."""
+        await self._clients.aclose()
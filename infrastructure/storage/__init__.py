@@ -0,0 +1,16 @@
+"""Storage integrations for task payloads kept outside the result backend."""
+
+from __future__ import annotations
+
+from .blob_store import LocalBlobStore
+from .config import StorageConfig
+from .result_archive import SQLiteResultArchive
+from .result_codec import pack_result, unpack_result
+
+__all__ = [
+    "LocalBlobStore",
+    "SQLiteResultArchive",
+    "StorageConfig",
+    "pack_result",
+    "unpack_result",
+]
@@ -0,0 +1,68 @@
+"""Content-addressed blob store on the local filesystem."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import zlib
+
+from .config import StorageConfig
+
+_HASH_PREFIX = "sha256:"
+_WRITE_CHUNK_CHARS = 1024 * 1024
+_DIGEST_LENGTH = 64
+
+
+class LocalBlobStore:
+    """Store texts once under their SHA-256 digest, zlib-compressed on disk.
+
+    Texts are encoded, hashed and compressed in bounded slices, so storing a
+    document never needs a second full copy of it in memory.
+    """
+
+    def __init__(self, config: StorageConfig | None = None) -> None:
+        self._root = (config or StorageConfig()).blob_store_path
+
+    def put_text(self, text: str) -> str:
+        """Store ``text`` and return its content reference."""
+        os.makedirs(self._root, exist_ok=True)
+        digest = hashlib.sha256()
+        compressor = zlib.compressobj()
+        fd, tmp_path = tempfile.mkstemp(dir=self._root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                for start in range(0, len(text), _WRITE_CHUNK_CHARS):
+                    data = text[start : start + _WRITE_CHUNK_CHARS].encode("utf-8")
+                    digest.update(data)
+                    tmp_file.write(compressor.compress(data))
+                tmp_file.write(compressor.flush())
+
+            ref = f"{_HASH_PREFIX}{digest.hexdigest()}"
+            path = self._path_for(ref)
+            if os.path.exists(path):
+                os.remove(tmp_path)
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return ref
+
+    def get_text(self, ref: str) -> str:
+        """Return the text stored under ``ref``; raises ``KeyError`` if unknown."""
+        try:
+            with open(self._path_for(ref), "rb") as blob_file:
+                return zlib.decompress(blob_file.read()).decode("utf-8")
+        except FileNotFoundError as exc:
+            raise KeyError(ref) from exc
+
+    def _path_for(self, ref: str) -> str:
+        if not ref.startswith(_HASH_PREFIX):
+            raise KeyError(ref)
+        digest = ref[len(_HASH_PREFIX) :]
+        if len(digest) != _DIGEST_LENGTH or not all(char in "0123456789abcdef" for char in digest):
+            raise KeyError(ref)
+        return os.path.join(self._root, digest[:2], digest[2:4], digest)
@@ -0,0 +1,21 @@
+"""Storage configuration using a class-based approach."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+
+from infrastructure.env import int_env
+
+
+class StorageConfig:
+    """Configuration class for blob storage, result compaction and archiving."""
+
+    def __init__(self) -> None:
+        default_blob_path = os.path.join(tempfile.gettempdir(), "text-processing-blobs")
+        self.blob_store_path = os.getenv("BLOB_STORE_PATH", default_blob_path)
+        self.compression_threshold = int_env("RESULT_COMPRESSION_THRESHOLD", 8 * 1024)
+        # Cold tier for old results; shared with the blobs by default, "" disables.
+        self.result_archive_path = os.getenv(
+            "RESULT_ARCHIVE_PATH", os.path.join(self.blob_store_path, "results.sqlite3")
+        )
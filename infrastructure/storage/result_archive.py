@@ -0,0 +1,93 @@
+"""Cold tier of finished task results in a local SQLite database."""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping, Sequence
+
+from .config import StorageConfig
+
+logger = logging.getLogger(__name__)
+
+# Stays under SQLITE_MAX_VARIABLE_NUMBER of older SQLite builds.
+_LOOKUP_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS task_results (
+    task_id TEXT PRIMARY KEY,
+    payload BLOB NOT NULL,
+    archived_at REAL NOT NULL
+)
+"""
+
+
+class SQLiteResultArchive:
+    """Keep result backend payloads of old tasks on disk, keyed by task id.
+
+    Payloads are stored exactly as the result backend holds them, so readers
+    decode them with the backend like any live result. Each thread opens its
+    own connection; WAL mode lets the API read while a worker archives.
+    """
+
+    def __init__(self, config: StorageConfig | None = None) -> None:
+        self._path = (config or StorageConfig()).result_archive_path
+        self._local = threading.local()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._path)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            directory = os.path.dirname(self._path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self._path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(_SCHEMA)
+            self._local.connection = connection
+        return connection
+
+    def put_many(self, payloads: Mapping[str, bytes]) -> None:
+        """Store ``payloads`` by task id in one transaction."""
+        if not self.enabled or not payloads:
+            return
+        archived_at = time.time()
+        connection = self._connection()
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO task_results VALUES (?, ?, ?)",
+                (
+                    (task_id, payload, archived_at)
+                    for task_id, payload in payloads.items()
+                ),
+            )
+
+    def get_many(self, task_ids: Sequence[str]) -> dict[str, bytes]:
+        """Return the archived payloads among ``task_ids``.
+
+        Read failures are logged and reported as "not archived", like results
+        that were never stored.
+        """
+        if not self.enabled or not task_ids:
+            return {}
+        found: dict[str, bytes] = {}
+        try:
+            connection = self._connection()
+            for start in range(0, len(task_ids), _LOOKUP_CHUNK):
+                chunk = list(task_ids[start : start + _LOOKUP_CHUNK])
+                placeholders = ",".join("?" * len(chunk))
+                rows = connection.execute(
+                    "SELECT task_id, payload FROM task_results "
+                    f"WHERE task_id IN ({placeholders})",
+                    chunk,
+                )
+                found.update(rows)
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning("Failed to read archived results: %s", str(exc))
+        return found
@@ -0,0 +1,39 @@
+"""Compaction of task result payloads before they reach the result backend."""
+
+from __future__ import annotations
+
+import base64
+import zlib
+from typing import Any
+
+PROCESSED_TEXT_ENCODING = "zlib+base64"
+
+
+def pack_result(payload: dict[str, Any], threshold: int) -> dict[str, Any]:
+    """Compress ``processed_text`` when it is at least ``threshold`` characters.
+
+    A non-positive ``threshold`` disables compression.
+    """
+    processed_text = payload.get("processed_text")
+    if threshold <= 0 or not isinstance(processed_text, str):
+        return payload
+    if len(processed_text) < threshold:
+        return payload
+    compressed = zlib.compress(processed_text.encode("utf-8"))
+    return {
+        **payload,
+        "processed_text": base64.b64encode(compressed).decode("ascii"),
+        "processed_text_encoding": PROCESSED_TEXT_ENCODING,
+    }
+
+
+def unpack_result(payload: dict[str, Any]) -> dict[str, Any]:
+    """Reverse :func:`pack_result`; payloads that were not packed pass through."""
+    if payload.get("processed_text_encoding") != PROCESSED_TEXT_ENCODING:
+        return payload
+    compressed = base64.b64decode(payload["processed_text"])
+    return {
+        **payload,
+        "processed_text": zlib.decompress(compressed).decode("utf-8"),
+        "processed_text_encoding": None,
+    }
@@ -0,0 +1,72 @@
+"""Prometheus exposition and request latency instrumentation for the API."""
+
+from __future__ import annotations
+
+import time
+
+from fastapi import APIRouter, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.metrics import observe_request, render_metrics
+
+router = APIRouter(tags=["metrics"])
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+@router.get("/metrics", include_in_schema=False)
+def get_metrics() -> Response:
+    """Expose API metrics in the Prometheus text format."""
+    payload, content_type = render_metrics()
+    return Response(content=payload, media_type=content_type)
+
+
+class RequestLatencyMiddleware:
+    """Time every HTTP request, labelled by route template to bound cardinality.
+
+    Written as plain ASGI rather than ``BaseHTTPMiddleware`` so the hot path
+    adds no extra task or response copy.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            observe_request(
+                scope["method"],
+                _route_template(scope),
+                status_code,
+                time.perf_counter() - started,
+            )
+
+
+def _route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if template is None:
+        return UNMATCHED_ROUTE
+    path = scope["path"]
+    if route.path_regex.match(path):
+        return template
+    # Some FastAPI versions match included routers as sub-routers whose routes
+    # omit the include prefix; recover it from the request path.
+    for index, char in enumerate(path):
+        if char == "/" and index and route.path_regex.match(path[index:]):
+            return f"{path[:index]}{template}"
+    return template
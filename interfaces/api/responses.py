@@ -0,0 +1,20 @@
+"""Response classes for the task API."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from infrastructure.codec import dumps_json
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with the shared orjson codec.
+
+    Routes that return it directly also skip FastAPI's response validation
+    and ``jsonable_encoder`` pass, which dominate the cost of large payloads.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
@@ -1,73 +1,399 @@
-"""REST API endpoints exposing task orchestration."""
+"""REST and WebSocket API endpoints exposing task orchestration."""
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+import math
+from typing import Any, Literal
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+from fastapi.requests import HTTPConnection
 from pydantic import BaseModel
 
-from application.services import ProgressQueryService, TaskCommandService
+from application.services import (
+    AsyncProgressQueryService,
+    AsyncTaskCommandService,
+    ProgressStreamService,
+    SubmissionRejectedError,
+    TaskNotFoundError,
+)
+from application.services.config import ServiceConfig
+from domain.progress import build_progress_state, is_terminal_state, progress_etag
+from domain.text_processing import InvalidInputError
+from infrastructure.codec import dumps_json
+
+from .responses import FastJSONResponse
+
+router = APIRouter(
+    prefix="/tasks", tags=["tasks"], default_response_class=FastJSONResponse
+)
+
+_client_id_header = ServiceConfig().client_id_header
+_progress_heartbeat = ServiceConfig().progress_heartbeat_seconds
+
+
+# Services are built by the ``api_main`` lifespan and kept on the app state.
+def get_task_service(connection: HTTPConnection) -> AsyncTaskCommandService:
+    return connection.app.state.task_service
+
+
+def get_progress_service(connection: HTTPConnection) -> AsyncProgressQueryService:
+    return connection.app.state.progress_service
 
-router = APIRouter(prefix="/tasks", tags=["tasks"])
 
-_task_service = TaskCommandService()
-_progress_service = ProgressQueryService(_task_service)
+def get_progress_stream_service(connection: HTTPConnection) -> ProgressStreamService:
+    return connection.app.state.progress_stream_service
 
 
-def get_task_service() -> TaskCommandService:
-    return _task_service
+def get_client_id(request: Request) -> str | None:
+    """Identify the caller for rate limiting: the client header, else its IP."""
+    client_id = request.headers.get(_client_id_header)
+    if client_id:
+        return client_id
+    return request.client.host if request.client else None
 
 
-def get_progress_service() -> ProgressQueryService:
-    return _progress_service
+def _entity_tags(header: str | None) -> set[str]:
+    if not header:
+        return set()
+    return {tag.strip().removeprefix("W/") for tag in header.split(",")}
+
+
+def _too_many_requests(exc: SubmissionRejectedError) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=exc.reason,
+        headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))},
+    )
+
+
+def _inline_analysis(analysis: dict[str, Any]) -> Response:
+    """Answer a quick analysis run in-process as a finished task."""
+    return FastJSONResponse(
+        {**build_progress_state("SUCCESS", analysis), "result": analysis}
+    )
 
 
 class TaskRequest(BaseModel):
     text: str
 
 
+class BatchTaskRequest(BaseModel):
+    texts: list[str]
+
+
+class TaskLookupRequest(BaseModel):
+    task_ids: list[str]
+
+
+class ResultLookupRequest(TaskLookupRequest):
+    include_original: bool = False
+
+
 @router.post("/process", status_code=status.HTTP_202_ACCEPTED)
-def start_process_task(
+async def start_process_task(
     payload: TaskRequest,
-    task_service: TaskCommandService = Depends(get_task_service),
+    profile: bool = False,
+    idempotency_key: str | None = Header(default=None),
+    client_id: str | None = Depends(get_client_id),
+    task_service: AsyncTaskCommandService = Depends(get_task_service),
 ) -> dict[str, str]:
-    """Start the long-running text processing workflow."""
+    """Start the long-running text processing workflow.
+
+    Resubmitting identical text, or repeating an ``Idempotency-Key`` header,
+    returns the id of the existing task instead of enqueuing new work.
+    ``profile=true`` always starts a new run under the profiler; read the
+    profile from ``/{task_id}/profile`` once it finishes. Submissions over the
+    backlog or per-client limits are answered with ``429`` and ``Retry-After``.
+    """
     try:
-        task_id = task_service.start_text_processing(payload.text)
-    except ValueError as exc:
+        task_id = await task_service.start_text_processing(
+            payload.text, idempotency_key, profile, client_id
+        )
+    except SubmissionRejectedError as exc:
+        raise _too_many_requests(exc) from exc
+    except InvalidInputError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     return {"task_id": task_id}
 
 
-@router.post("/quick-analysis", status_code=status.HTTP_202_ACCEPTED)
-def start_quick_analysis(
+@router.post("/process:batch", status_code=status.HTTP_202_ACCEPTED)
+async def start_batch_process_task(
+    payload: BatchTaskRequest,
+    client_id: str | None = Depends(get_client_id),
+    task_service: AsyncTaskCommandService = Depends(get_task_service),
+) -> dict[str, str | list[str]]:
+    """Start the text processing workflow for many texts as one task group."""
+    try:
+        group_id, task_ids = await task_service.start_batch_text_processing(
+            payload.texts, client_id
+        )
+    except SubmissionRejectedError as exc:
+        raise _too_many_requests(exc) from exc
+    except InvalidInputError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return {"group_id": group_id, "task_ids": task_ids}
+
+
+@router.post(
+    "/quick-analysis", status_code=status.HTTP_202_ACCEPTED, response_model=None
+)
+async def start_quick_analysis(
     payload: TaskRequest,
-    task_service: TaskCommandService = Depends(get_task_service),
-) -> dict[str, str]:
-    """Start the quick analysis workflow."""
+    sync: bool = True,
+    idempotency_key: str | None = Header(default=None),
+    client_id: str | None = Depends(get_client_id),
+    task_service: AsyncTaskCommandService = Depends(get_task_service),
+) -> Response:
+    """Run the quick analysis.
+
+    Texts under the inline size limit are analysed in-process and answered with
+    ``200`` and the finished result; larger texts, or ``sync=false``, are
+    queued and answered with ``202`` and a task id.
+    """
     try:
-        task_id = task_service.start_quick_analysis(payload.text)
-    except ValueError as exc:
+        analysis = None
+        if sync:
+            analysis = task_service.run_quick_analysis_inline(
+                payload.text, client_id
+            )
+        if analysis is not None:
+            return _inline_analysis(analysis)
+        task_id = await task_service.start_quick_analysis(
+            payload.text, idempotency_key, client_id
+        )
+    except SubmissionRejectedError as exc:
+        raise _too_many_requests(exc) from exc
+    except InvalidInputError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
-    return {"task_id": task_id}
+    return FastJSONResponse(
+        {"task_id": task_id}, status_code=status.HTTP_202_ACCEPTED
+    )
+
+
+@router.post(
+    "/quick-analysis:batch", status_code=status.HTTP_202_ACCEPTED, response_model=None
+)
+async def start_batch_quick_analysis(
+    payload: BatchTaskRequest,
+    sync: bool = True,
+    client_id: str | None = Depends(get_client_id),
+    task_service: AsyncTaskCommandService = Depends(get_task_service),
+) -> Response:
+    """Run the quick analysis over many texts in one vectorised pass.
+
+    Small batches are answered inline with ``200`` like ``/quick-analysis``;
+    larger ones are queued as a single task and answered with ``202``. A blank
+    text gets an ``error`` entry in the results rather than failing the batch.
+    """
+    try:
+        analysis = None
+        if sync:
+            analysis = task_service.run_batch_quick_analysis_inline(
+                payload.texts, client_id
+            )
+        if analysis is not None:
+            return _inline_analysis(analysis)
+        task_id = await task_service.start_batch_quick_analysis(
+            payload.texts, client_id
+        )
+    except SubmissionRejectedError as exc:
+        raise _too_many_requests(exc) from exc
+    except InvalidInputError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return FastJSONResponse(
+        {"task_id": task_id}, status_code=status.HTTP_202_ACCEPTED
+    )
 
 
-@router.get("/{task_id}/status")
-def get_task_status(
+@router.post("/status:batch", response_model=None)
+async def get_task_statuses(
+    payload: TaskLookupRequest,
+    progress_service: AsyncProgressQueryService = Depends(get_progress_service),
+) -> Response:
+    """Retrieve progress for many tasks with a single backend read."""
+    try:
+        tasks = await progress_service.get_progress_updates(payload.task_ids)
+    except InvalidInputError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return FastJSONResponse({"tasks": tasks})
+
+
+@router.post("/result:batch", response_model=None)
+async def get_task_results(
+    payload: ResultLookupRequest,
+    progress_service: AsyncProgressQueryService = Depends(get_progress_service),
+) -> Response:
+    """Retrieve result details for many tasks with a single backend read."""
+    try:
+        tasks = await progress_service.get_task_outputs(
+            payload.task_ids, include_original=payload.include_original
+        )
+    except InvalidInputError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return FastJSONResponse({"tasks": tasks})
+
+
+@router.get("/cache/stats")
+async def get_result_cache_stats(
+    progress_service: AsyncProgressQueryService = Depends(get_progress_service),
+) -> dict[str, int]:
+    """Expose hit/miss counters of the finished-result cache."""
+    return progress_service.cache_stats()
+
+
+@router.get("/groups/{group_id}/status", response_model=None)
+async def get_group_status(
+    group_id: str,
+    progress_service: AsyncProgressQueryService = Depends(get_progress_service),
+) -> Response:
+    """Retrieve aggregate progress for a task group."""
+    return FastJSONResponse(await progress_service.get_group_progress(group_id))
+
+
+@router.get("/{task_id}", response_model=None)
+async def get_task_view(
+    task_id: str,
+    include_original: bool = False,
+    progress_service: AsyncProgressQueryService = Depends(get_progress_service),
+) -> Response:
+    """Retrieve task progress and, once finished, its result in one call."""
+    view = await progress_service.get_task_view(task_id, include_original)
+    return FastJSONResponse(view)
+
+
+@router.delete("/{task_id}", status_code=status.HTTP_202_ACCEPTED)
+async def cancel_task(
     task_id: str,
-    progress_service: ProgressQueryService = Depends(get_progress_service),
-) -> dict[str, str | int]:
-    """Retrieve task progress status."""
-    return progress_service.get_progress_update(task_id)
+    task_service: AsyncTaskCommandService = Depends(get_task_service),
+) -> dict[str, str]:
+    """Cancel a queued or running task.
+
+    Running tasks stop at their next processing step and end in ``REVOKED``;
+    finished tasks cannot be cancelled and are answered with ``409``, unknown
+    ids with ``404``.
+    """
+    try:
+        cancelled = await task_service.cancel_task(task_id)
+    except TaskNotFoundError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
+        ) from exc
+    if not cancelled:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Task has already finished"
+        )
+    return {"task_id": task_id, "status": "Cancellation requested"}
+
 
+@router.get("/{task_id}/status", response_model=None)
+async def get_task_status(
+    task_id: str,
+    wait: float = Query(default=0.0, ge=0),
+    if_none_match: str | None = Header(default=None),
+    progress_service: AsyncProgressQueryService = Depends(get_progress_service),
+) -> Response:
+    """Retrieve task progress status.
+
+    The ``ETag`` changes with every stored progress write, and a matching
+    ``If-None-Match`` is answered with an empty ``304``. ``wait`` holds the
+    request for up to that many seconds until the status changes.
+    """
+    known_etags = _entity_tags(if_none_match)
+    if wait > 0:
+        known_etag = next(iter(known_etags)) if len(known_etags) == 1 else None
+        payload = await progress_service.wait_for_progress_update(
+            task_id, known_etag, wait
+        )
+    else:
+        payload = await progress_service.get_progress_update(task_id)
+    etag = progress_etag(payload)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag in known_etags:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return FastJSONResponse(payload, headers=headers)
 
-@router.get("/{task_id}/result")
-def get_task_result(
+
+@router.get("/{task_id}/result", response_model=None)
+async def get_task_result(
     task_id: str,
-    progress_service: ProgressQueryService = Depends(get_progress_service),
-) -> dict[str, str | int]:
-    """Retrieve task result details."""
-    return progress_service.get_task_output(task_id)
+    include_original: bool = False,
+    progress_service: AsyncProgressQueryService = Depends(get_progress_service),
+) -> Response:
+    """Retrieve task result details, optionally with the original input text."""
+    output = await progress_service.get_task_output(task_id, include_original)
+    return FastJSONResponse(output)
 
 
-# TODO: Introduce WebSocket endpoints that push task progress updates to clients,
-# enabling streaming updates per the PostTagger reimagined specification.
+@router.get("/{task_id}/profile", response_model=None)
+async def get_task_profile(
+    task_id: str,
+    format: Literal["summary", "raw"] = "summary",
+    progress_service: AsyncProgressQueryService = Depends(get_progress_service),
+) -> dict[str, Any] | Response:
+    """Retrieve the profile of a profiled task run.
+
+    ``format=raw`` downloads the ``pstats`` dump for ``python -m pstats``.
+    """
+    if format == "raw":
+        dump = await progress_service.get_task_profile_dump(task_id)
+        if dump is not None:
+            return Response(
+                content=dump,
+                media_type="application/octet-stream",
+                headers={
+                    "Content-Disposition": f'attachment; filename="{task_id}.pstats"'
+                },
+            )
+    else:
+        summary = await progress_service.get_task_profile(task_id)
+        if summary is not None:
+            return summary
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND, detail="No profile stored for this task"
+    )
+
+
+@router.websocket("/{task_id}/ws")
+async def stream_task_progress(
+    websocket: WebSocket,
+    task_id: str,
+    progress_service: AsyncProgressQueryService = Depends(get_progress_service),
+    stream_service: ProgressStreamService = Depends(get_progress_stream_service),
+) -> None:
+    """Push progress updates for a task until it reaches a terminal state.
+
+    When no event arrives for a heartbeat period the backend state is read
+    and sent again, which keeps the connection alive and recovers updates
+    published while the pub/sub listener was reconnecting.
+    """
+    await websocket.accept()
+    if not stream_service.enabled:
+        await websocket.close(code=1013, reason="Progress streaming is disabled")
+        return
+
+    try:
+        # Subscribe before reading the snapshot so no event can slip in between.
+        async with stream_service.subscribe(task_id) as updates:
+            payload = await progress_service.get_progress_update(task_id)
+            await websocket.send_text(dumps_json(payload).decode())
+            while not is_terminal_state(payload.get("state")):
+                try:
+                    payload = await asyncio.wait_for(updates.get(), _progress_heartbeat)
+                except asyncio.TimeoutError:
+                    payload = await progress_service.get_progress_update(task_id)
+                await websocket.send_text(dumps_json(payload).decode())
+    except WebSocketDisconnect:
+        return
+    await websocket.close()
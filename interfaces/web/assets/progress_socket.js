@@ -0,0 +1,90 @@
+// Opens one WebSocket per displayed task and mirrors pushed progress into the
+// "progress-stream" store, which the server-side callbacks render.
+//
+// A dropped connection is reopened with a growing delay. Once the retries are
+// used up, or when the API has streaming disabled, the page falls back to the
+// status polling interval. Shard events can arrive out of order, so progress
+// with a lower version than the last one shown is ignored.
+const TERMINAL_STATES = ["SUCCESS", "FAILURE", "REVOKED"];
+const MAX_RECONNECT_ATTEMPTS = 5;
+const RECONNECT_BASE_DELAY_MS = 500;
+// Close code the API uses when progress streaming is disabled.
+const STREAMING_DISABLED = 1013;
+
+function startPolling() {
+    window.dash_clientside.set_props("progress-interval", {disabled: false});
+}
+
+function openProgressSocket(stream) {
+    const socket = new WebSocket(
+        stream.wsBaseUrl + "/" + encodeURIComponent(stream.taskId) + "/ws"
+    );
+    socket.onopen = function () {
+        stream.attempts = 0;
+    };
+    socket.onmessage = function (event) {
+        const payload = JSON.parse(event.data);
+        const terminal = TERMINAL_STATES.indexOf(payload.state) !== -1;
+        if (!terminal && typeof payload.version === "number") {
+            if (payload.version < stream.version) {
+                return;
+            }
+            stream.version = payload.version;
+        }
+        stream.finished = terminal;
+        payload.task_id = stream.taskId;
+        window.dash_clientside.set_props("progress-stream", {data: payload});
+    };
+    socket.onerror = function () {
+        // Every error is followed by onclose, which decides what happens next.
+        socket.close();
+    };
+    socket.onclose = function (event) {
+        if (window._progressStream !== stream || stream.finished) {
+            return;
+        }
+        if (
+            event.code === STREAMING_DISABLED
+            || stream.attempts >= MAX_RECONNECT_ATTEMPTS
+        ) {
+            startPolling();
+            return;
+        }
+        const delay = RECONNECT_BASE_DELAY_MS * Math.pow(2, stream.attempts);
+        stream.attempts += 1;
+        stream.timer = setTimeout(function () {
+            stream.socket = openProgressSocket(stream);
+        }, delay);
+    };
+    return socket;
+}
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    progress: {
+        connect: function (taskDisplay, wsBaseUrl) {
+            const marker = "Task ID: ";
+            const previous = window._progressStream;
+            window._progressStream = null;
+            if (previous) {
+                clearTimeout(previous.timer);
+                previous.socket.close();
+            }
+            if (!taskDisplay || taskDisplay.indexOf(marker) === -1) {
+                return null;
+            }
+
+            const stream = {
+                taskId: taskDisplay.split(marker)[1],
+                wsBaseUrl: wsBaseUrl,
+                version: -1,
+                attempts: 0,
+                finished: false,
+                timer: null,
+                socket: null,
+            };
+            window._progressStream = stream;
+            stream.socket = openProgressSocket(stream);
+            return stream.taskId;
+        },
+    },
+});
@@ -3,17 +3,40 @@
 from __future__ import annotations
 
 import os
+from http import HTTPStatus
 from typing import Any
 
 import requests
-from dash import Dash, Input, Output, State, ctx, dcc, html
+from dash import (
+    ClientsideFunction,
+    Dash,
+    Input,
+    Output,
+    State,
+    ctx,
+    dcc,
+    html,
+    no_update,
+)
+from requests.adapters import HTTPAdapter
 
+from domain.progress import is_terminal_state
 from logging_config import configure_logging
 
 DASH_HOST = os.getenv("DASH_HOST", "0.0.0.0")
 DASH_PORT = int(os.getenv("DASH_PORT", "8050"))
 DASH_DEBUG = os.getenv("DASH_DEBUG", "0") in {"1", "true", "True"}
 API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000/api")
+# The browser opens the socket itself, so this must be reachable from the client.
+API_WS_URL = os.getenv(
+    "API_WS_URL",
+    API_BASE_URL.replace("https://", "wss://", 1).replace("http://", "ws://", 1),
+)
+DASH_PROGRESS_MODE = os.getenv("DASH_PROGRESS_MODE", "websocket").lower()
+DASH_POLL_INTERVAL_MS = int(os.getenv("DASH_POLL_INTERVAL_MS", "1000"))
+DASH_POLL_MAX_INTERVAL_MS = int(os.getenv("DASH_POLL_MAX_INTERVAL_MS", "8000"))
+DASH_HTTP_POOL_SIZE = int(os.getenv("DASH_HTTP_POOL_SIZE", "32"))
+PENDING_BACKOFF_FACTOR = 2
 
 
 class DashApplication:
@@ -23,6 +46,16 @@ class DashApplication:
         self.app: Dash = Dash(__name__)
         self.api_base_url = API_BASE_URL.rstrip("/")
         self.tasks_base_url = f"{self.api_base_url}/tasks"
+        self.tasks_ws_url = f"{API_WS_URL.rstrip('/')}/tasks"
+        self.use_websocket = DASH_PROGRESS_MODE != "polling"
+        # One keep-alive session shared by every callback instead of a
+        # connection per request.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=DASH_HTTP_POOL_SIZE, pool_maxsize=DASH_HTTP_POOL_SIZE
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
         self._setup_layout()
         self._setup_callbacks()
 
@@ -60,6 +93,16 @@ class DashApplication:
                                 "marginLeft": "10px",
                             },
                         ),
+                        html.Button(
+                            "Cancel Task",
+                            id="cancel-btn",
+                            n_clicks=0,
+                            style={
+                                "backgroundColor": "#e74c3c",
+                                "color": "white",
+                                "marginLeft": "10px",
+                            },
+                        ),
                     ]
                 ),
                 html.Div(
@@ -68,29 +111,53 @@ class DashApplication:
                 ),
                 html.Div(id="progress-container", style={"margin": "20px 0"}),
                 html.Div(id="processing-result", style={"marginTop": "20px"}),
-                # TODO: Replace polling interval with WebSocket-driven updates once backend streaming is available.
-                dcc.Interval(id="progress-interval", interval=1000, n_intervals=0),
+                # Progress is pushed over a WebSocket into this store; the interval
+                # only runs when polling is selected through DASH_PROGRESS_MODE,
+                # and only while a submitted task is unfinished.
+                dcc.Store(id="progress-ws-url", data=self.tasks_ws_url),
+                dcc.Store(id="progress-socket"),
+                dcc.Store(id="progress-stream"),
+                dcc.Interval(
+                    id="progress-interval",
+                    interval=DASH_POLL_INTERVAL_MS,
+                    n_intervals=0,
+                    disabled=True,
+                ),
             ]
         )
 
     def _post(self, path: str, payload: dict[str, Any]) -> dict[str, Any]:
-        response = requests.post(f"{self.tasks_base_url}{path}", json=payload, timeout=10)
+        response = self._session.post(
+            f"{self.tasks_base_url}{path}", json=payload, timeout=10
+        )
         response.raise_for_status()
         return response.json()
 
     def _get(self, path: str) -> dict[str, Any]:
-        response = requests.get(f"{self.tasks_base_url}{path}", timeout=10)
+        response = self._session.get(f"{self.tasks_base_url}{path}", timeout=10)
         if response.status_code == 404:
             return {"state": "NOT_FOUND", "status": "Task not found", "progress": 0}
         response.raise_for_status()
         return response.json()
 
+    def _delete(self, path: str) -> dict[str, Any]:
+        response = self._session.delete(f"{self.tasks_base_url}{path}", timeout=10)
+        if response.status_code in (HTTPStatus.CONFLICT, HTTPStatus.NOT_FOUND):
+            # Finished or unknown tasks cannot be cancelled; show the API's reason.
+            return {"status": response.json().get("detail", "Task cannot be cancelled")}
+        response.raise_for_status()
+        return response.json()
+
     def _setup_callbacks(self) -> None:
         """Wire Dash callbacks for task orchestration."""
 
         @self.app.callback(
             Output("task-id-display", "children"),
             Output("task-id-display", "style"),
+            Output("progress-interval", "disabled", allow_duplicate=True),
+            Output("progress-interval", "interval", allow_duplicate=True),
+            Output("progress-container", "children", allow_duplicate=True),
+            Output("processing-result", "children", allow_duplicate=True),
             Input("process-btn", "n_clicks"),
             Input("quick-btn", "n_clicks"),
             State("text-input", "value"),
@@ -100,104 +167,180 @@ class DashApplication:
             _process_clicks: int,
             _quick_clicks: int,
             text: str | None,
-        ) -> tuple[str, dict[str, str]]:
+        ) -> tuple[Any, ...]:
             """Handle task start requests."""
             if not ctx.triggered_id or not text:
-                return "Please enter text first!", {"color": "red"}
+                return "Please enter text first!", {"color": "red"}, *(no_update,) * 4
 
             button_id = ctx.triggered_id
             endpoint = "/process" if button_id == "process-btn" else "/quick-analysis"
 
             try:
                 response = self._post(endpoint, {"text": text})
-                task_id = response["task_id"]
-                color = "#3498db" if button_id == "process-btn" else "#2ecc71"
-                message = f"Task ID: {task_id}"
-                return message, {
-                    "color": color,
-                    "fontFamily": "monospace",
-                    "fontSize": "12px",
-                }
             except requests.HTTPError as exc:
                 detail = exc.response.json().get("detail", str(exc)) if exc.response else str(exc)
-                return f"Error: {detail}", {"color": "red"}
+                return f"Error: {detail}", {"color": "red"}, *(no_update,) * 4
             except requests.RequestException as exc:  # noqa: BLE001 - surface network errors
-                return f"Network error: {exc}", {"color": "red"}
+                return f"Network error: {exc}", {"color": "red"}, *(no_update,) * 4
+
+            color = "#3498db" if button_id == "process-btn" else "#2ecc71"
+            style = {
+                "color": color,
+                "fontFamily": "monospace",
+                "fontSize": "12px",
+            }
+            if "task_id" not in response:
+                # Small quick analyses are answered inline, with nothing to track.
+                return (
+                    "Quick analysis completed inline",
+                    style,
+                    True,
+                    DASH_POLL_INTERVAL_MS,
+                    self._render_progress(response),
+                    self._render_result(response),
+                )
+
+            message = f"Task ID: {response['task_id']}"
+            if self.use_websocket:
+                return message, style, no_update, no_update, "", ""
+            return message, style, False, DASH_POLL_INTERVAL_MS, "", ""
 
         @self.app.callback(
-            Output("progress-container", "children"),
-            Input("progress-interval", "n_intervals"),
+            Output("progress-container", "children", allow_duplicate=True),
+            Input("cancel-btn", "n_clicks"),
             State("task-id-display", "children"),
+            prevent_initial_call=True,
         )
-        def update_progress(
-            _n_intervals: int,
-            task_display: str | None,
-        ) -> html.Div | str:
-            """Update progress display."""
-            if not task_display or "Task ID:" not in task_display:
-                return ""
+        def cancel_task(_cancel_clicks: int, task_display: str | None) -> Any:
+            """Ask the API to cancel the tracked task.
 
-            task_id = task_display.split("Task ID: ")[1]
-            progress_data = self._get(f"/{task_id}/status")
-
-            if progress_data.get("state") == "PROGRESS":
-                return html.Div(
-                    [
-                        html.Div(
-                            f"Progress: {progress_data['progress']}% - {progress_data['status']}",
-                            style={"marginBottom": "10px"},
-                        ),
-                        html.Progress(
-                            value=progress_data["progress"],
-                            max=100,
-                            style={"width": "100%", "height": "20px"},
-                        ),
-                    ]
-                )
-
-            color = "#27ae60" if progress_data.get("state") == "SUCCESS" else "#f39c12"
+            The final ``REVOKED`` state reaches the page like any other update.
+            """
+            task_id = self._extract_task_id(task_display)
+            if not task_id:
+                return no_update
+            try:
+                response = self._delete(f"/{task_id}")
+            except requests.RequestException as exc:
+                return html.Div(f"Cancellation failed: {exc}", style={"color": "red"})
             return html.Div(
-                progress_data.get("status", "Awaiting status"),
-                style={"color": color, "fontWeight": "bold"},
+                response.get("status", "Cancellation requested"),
+                style={"color": "#e74c3c", "fontWeight": "bold"},
+            )
+
+        if self.use_websocket:
+            self.app.clientside_callback(
+                ClientsideFunction(namespace="progress", function_name="connect"),
+                Output("progress-socket", "data"),
+                Input("task-id-display", "children"),
+                State("progress-ws-url", "data"),
             )
 
         @self.app.callback(
+            Output("progress-container", "children"),
             Output("processing-result", "children"),
+            Output("progress-interval", "disabled"),
+            Output("progress-interval", "interval"),
             Input("progress-interval", "n_intervals"),
+            Input("progress-stream", "data"),
             State("task-id-display", "children"),
+            State("progress-interval", "interval"),
             prevent_initial_call=True,
         )
-        def display_results(
+        def refresh_task_view(
             _n_intervals: int,
+            pushed_progress: dict[str, Any] | None,
             task_display: str | None,
-        ) -> html.Div | str:
-            """Display task results once available."""
-            if not task_display or "Task ID:" not in task_display:
-                return ""
+            current_interval: int,
+        ) -> tuple[Any, ...]:
+            """Render progress and results from one pushed event or one poll."""
+            task_id = self._extract_task_id(task_display)
+            if not task_id:
+                return "", "", True, DASH_POLL_INTERVAL_MS
+
+            if ctx.triggered_id == "progress-stream":
+                if not pushed_progress or pushed_progress.get("task_id") != task_id:
+                    return no_update, no_update, no_update, no_update
+                if not is_terminal_state(pushed_progress.get("state")):
+                    progress = self._render_progress(pushed_progress)
+                    return progress, "", no_update, no_update
+                # Pushed events only carry progress, so fetch the view once at the end.
+                task_view = self._get(f"/{task_id}")
+                return (
+                    self._render_progress(task_view),
+                    self._render_result(task_view),
+                    no_update,
+                    no_update,
+                )
 
-            task_id = task_display.split("Task ID: ")[1]
-            result_payload = self._get(f"/{task_id}/result")
+            task_view = self._get(f"/{task_id}")
+            if task_view.get("terminal"):
+                next_interval, disabled = DASH_POLL_INTERVAL_MS, True
+            elif task_view.get("state") == "PENDING":
+                next_interval = min(
+                    current_interval * PENDING_BACKOFF_FACTOR, DASH_POLL_MAX_INTERVAL_MS
+                )
+                disabled = False
+            else:
+                next_interval, disabled = DASH_POLL_INTERVAL_MS, False
+            return (
+                self._render_progress(task_view),
+                self._render_result(task_view),
+                disabled,
+                next_interval,
+            )
 
-            if result_payload.get("state") != "SUCCESS":
-                return ""
+    @staticmethod
+    def _extract_task_id(task_display: str | None) -> str | None:
+        if not task_display or "Task ID:" not in task_display:
+            return None
+        return task_display.split("Task ID: ")[1]
 
-            result_data = result_payload.get("result", {})
+    @staticmethod
+    def _render_progress(progress_data: dict[str, Any]) -> html.Div:
+        if progress_data.get("state") == "PROGRESS":
             return html.Div(
                 [
-                    html.H3("🎉 Processing Complete!"),
-                    html.Pre(
-                        result_data.get("processed_text", "Analysis complete"),
-                        style={
-                            "background": "#f8f9fa",
-                            "padding": "10px",
-                            "borderRadius": "5px",
-                        },
+                    html.Div(
+                        f"Progress: {progress_data['progress']}% - {progress_data['status']}",
+                        style={"marginBottom": "10px"},
+                    ),
+                    html.Progress(
+                        value=progress_data["progress"],
+                        max=100,
+                        style={"width": "100%", "height": "20px"},
                     ),
-                    html.P(f"Word count: {result_data.get('word_count')}") if "word_count" in result_data else "",
-                    html.P(f"Character count: {result_data.get('char_count')}") if "char_count" in result_data else "",
                 ]
             )
 
+        color = "#27ae60" if progress_data.get("state") == "SUCCESS" else "#f39c12"
+        return html.Div(
+            progress_data.get("status", "Awaiting status"),
+            style={"color": color, "fontWeight": "bold"},
+        )
+
+    @staticmethod
+    def _render_result(result_payload: dict[str, Any]) -> html.Div | str:
+        if result_payload.get("state") != "SUCCESS":
+            return ""
+
+        result_data = result_payload.get("result", {})
+        return html.Div(
+            [
+                html.H3("🎉 Processing Complete!"),
+                html.Pre(
+                    result_data.get("processed_text", "Analysis complete"),
+                    style={
+                        "background": "#f8f9fa",
+                        "padding": "10px",
+                        "borderRadius": "5px",
+                    },
+                ),
+                html.P(f"Word count: {result_data.get('word_count')}") if "word_count" in result_data else "",
+                html.P(f"Character count: {result_data.get('char_count')}") if "char_count" in result_data else "",
+            ]
+        )
+
     def run(self, *, debug: bool = True) -> None:
         """Run the Dash development server."""
         self.app.run(host=DASH_HOST, port=DASH_PORT, debug=debug)
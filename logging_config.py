@@ -1,16 +1,221 @@
-"""Central logging configuration helpers."""
+"""Central logging configuration helpers.
+
+Records are handed to a queue by the thread that logs them and written by a
+background listener thread, so slow terminals, pipes or log collectors never
+block request handlers or task steps.
+"""
 
 from __future__ import annotations
 
+import atexit
+import copy
+import json
 import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+from infrastructure.env import bool_env, int_env
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Loggers that servers configure with handlers of their own before the app is
+# imported (``uvicorn api_main:app``); their handlers are moved behind a queue.
+SERVER_LOGGERS = ("uvicorn", "uvicorn.access")
+
+
+class LoggingConfig:
+    """Configuration class for the logging pipeline."""
+
+    def __init__(self) -> None:
+        self.level = _level_name(os.getenv("LOG_LEVEL", "INFO"), "INFO")
+        # Comma-separated ``logger=LEVEL`` overrides, e.g. ``celery=WARNING``.
+        self.logger_levels = _parse_levels(os.getenv("LOG_LEVELS", ""))
+        self.format = os.getenv("LOG_FORMAT", "text").lower()
+        self.queue_enabled = bool_env("LOG_QUEUE_ENABLED", True)
+        # Per-step debug messages are logged for one step in this many.
+        self.step_sample_every = max(1, int_env("LOG_STEP_SAMPLE_EVERY", 10))
+
+
+def _level_name(value: str, default: str) -> str:
+    name = value.strip().upper()
+    return name if isinstance(logging.getLevelName(name), int) else default
+
+
+def _parse_levels(value: str) -> dict[str, str]:
+    levels = {}
+    for item in value.split(","):
+        name, _, level = item.partition("=")
+        if name.strip() and level.strip():
+            levels[name.strip()] = _level_name(level, "NOTSET")
+    return levels
+
+
+class JsonFormatter(logging.Formatter):
+    """Render each record as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, Any] = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "process": record.process,
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc_info"] = record.exc_text
+        if record.stack_info:
+            payload["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(payload, default=str)
+
+
+class _RecordQueueHandler(QueueHandler):
+    """Queue records with their arguments and traceback already rendered.
+
+    Unlike :meth:`QueueHandler.prepare` the traceback is kept apart from the
+    message, so the listener's formatter still decides how to lay it out.
+    With ``render_args`` off the arguments are queued as they are, for server
+    formatters that read them (uvicorn's access log does).
+    """
+
+    _formatter = logging.Formatter()
+
+    def __init__(self, records: Any, *, render_args: bool = True) -> None:
+        super().__init__(records)
+        self.render_args = render_args
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        if self.render_args:
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info:
+            record.exc_text = self._formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class _QueuedLogger:
+    """The queue, handler and listener serving one logger's handlers."""
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        handlers: list[logging.Handler],
+        *,
+        render_args: bool = True,
+    ) -> None:
+        self.handlers = handlers
+        self.handler = _RecordQueueHandler(
+            queue.SimpleQueue(), render_args=render_args
+        )
+        self.listener = QueueListener(
+            self.handler.queue, *handlers, respect_handler_level=True
+        )
+        logger.handlers = [self.handler]
+
+    def start(self) -> None:
+        self.listener.start()
+
+    def stop(self) -> None:
+        self.listener.stop()
+
+    def restart_after_fork(self) -> None:
+        # Only the forking thread survives in the child, so the listener thread
+        # and any lock it held are gone; start over with a fresh queue.
+        self.handler.queue = queue.SimpleQueue()
+        self.listener = QueueListener(
+            self.handler.queue, *self.handlers, respect_handler_level=True
+        )
+        self.listener.start()
+
+
+class _LoggingState:
+    """What :func:`configure_logging` set up in this process."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.queued: list[_QueuedLogger] = []
+        self.configured = False
+
+
+_state = _LoggingState()
+
+
+def configure_logging(level: int | str | None = None) -> None:
+    """Configure root logging once for the application.
+
+    ``level`` overrides ``LOG_LEVEL``; calling again only applies the levels.
+    Nothing is changed when another component installed root handlers first.
+    """
+    config = LoggingConfig()
+    root = logging.getLogger()
+    with _state.lock:
+        if not _state.configured and root.handlers:
+            return
+        root.setLevel(level if level is not None else config.level)
+        for name, logger_level in config.logger_levels.items():
+            logging.getLogger(name).setLevel(logger_level)
+        if _state.configured:
+            return
+        _state.configured = True
+
+        handler = logging.StreamHandler()
+        if config.format == "json":
+            handler.setFormatter(JsonFormatter())
+        else:
+            handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+        if not config.queue_enabled:
+            root.addHandler(handler)
+            return
+
+        _state.queued.append(_QueuedLogger(root, [handler]))
+        for name in SERVER_LOGGERS:
+            logger = logging.getLogger(name)
+            if logger.handlers:
+                _state.queued.append(
+                    _QueuedLogger(logger, list(logger.handlers), render_args=False)
+                )
+        for queued in _state.queued:
+            queued.start()
+        atexit.register(_stop_listeners)
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=_restart_listeners)
+
+
+def _stop_listeners() -> None:
+    """Write out queued records; registered to run at interpreter exit."""
+    for queued in _state.queued:
+        queued.stop()
+
+
+def _restart_listeners() -> None:
+    for queued in _state.queued:
+        queued.restart_after_fork()
+
+
+class SampledDebugLog:
+    """Debug logging for hot loops that costs one check when DEBUG is off.
 
+    Whether DEBUG is enabled is read once, when the sampler is created, and
+    only one call in ``every`` (plus any call marked ``last``) is emitted.
+    Arguments are passed through unformatted, as with ``logger.debug``.
+    """
 
-def configure_logging() -> None:
-    """Configure root logging once for the application."""
-    if logging.getLogger().handlers:
-        return
+    def __init__(self, logger: logging.Logger, every: int) -> None:
+        self._logger = logger
+        self._every = max(1, every)
+        self._enabled = logger.isEnabledFor(logging.DEBUG)
+        self._calls = 0
 
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
+    def __call__(self, msg: str, *args: Any, last: bool = False) -> None:
+        if not self._enabled:
+            return
+        self._calls += 1
+        if last or self._calls % self._every == 1 or self._every == 1:
+            self._logger.debug(msg, *args, stacklevel=2)
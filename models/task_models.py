@@ -10,12 +10,26 @@ class TextProcessingResult(BaseModel):
 
     task_id: str
     processed_text: str
-    original_text: str
     word_count: int
     char_count: int
     steps_completed: int
     progress: int = 100
     error: str | None = None
+    # The input is stored once in the blob store and referenced by content hash;
+    # ``original_text`` is only filled in when a client explicitly asks for it.
+    original_text_ref: str | None = None
+    original_text: str | None = None
+    processed_text_encoding: str | None = None
+
+
+class TextShardResult(BaseModel):
+    """DTO carrying one shard's output back to the merging callback."""
+
+    shard_index: int
+    processed_text: str
+    word_count: int
+    char_count: int
+    steps_completed: int
 
 
 class ProgressUpdate(BaseModel):
@@ -25,3 +39,5 @@ class ProgressUpdate(BaseModel):
     total: int
     progress: int
     status: str
+    # Grows with every stored write of a task, so clients can detect changes.
+    version: int = 0
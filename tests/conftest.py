@@ -0,0 +1,150 @@
+"""Shared fixtures: Redis is fakeredis and Celery never leaves the process."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from pathlib import Path
+from types import SimpleNamespace
+
+import fakeredis
+import httpx
+import pytest
+from celery import Celery
+from celery.backends.redis import RedisBackend
+
+from api_main import create_app
+from infrastructure.celery.app import CeleryApplication, get_celery_application
+from infrastructure.celery.serialization import (
+    ORJSON_CONTENT_TYPE,
+    ORJSON_SERIALIZER,
+    register_serializers,
+)
+from infrastructure.redis.clients import redis_clients as process_redis_clients
+
+
+class FakeClock:
+    """Monotonic clock that only moves when a test sets ``now``."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeRedisClients:
+    """Stand-in for ``RedisClientFactory`` handing out one fakeredis client."""
+
+    def __init__(self, client: fakeredis.FakeRedis) -> None:
+        self._client = client
+
+    def client(self, url: str) -> fakeredis.FakeRedis:
+        return self._client
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def redis_client() -> fakeredis.FakeRedis:
+    return fakeredis.FakeRedis()
+
+
+@pytest.fixture
+def redis_clients(redis_client: fakeredis.FakeRedis) -> FakeRedisClients:
+    return FakeRedisClients(redis_client)
+
+
+@pytest.fixture
+def celery_app(redis_client: fakeredis.FakeRedis) -> Celery:
+    """Celery app with an in-memory broker and a Redis backend on fakeredis."""
+    register_serializers()
+    app = Celery("tests", broker="memory://", backend="redis://localhost:6379/0")
+    app.conf.update(
+        task_serializer=ORJSON_SERIALIZER,
+        result_serializer=ORJSON_SERIALIZER,
+        accept_content=[ORJSON_CONTENT_TYPE, "json"],
+        result_accept_content=[ORJSON_CONTENT_TYPE, "json"],
+    )
+    backend = app.backend
+    assert isinstance(backend, RedisBackend)
+    # ``client`` is a cached property; seeding it keeps every call in memory.
+    backend.__dict__["client"] = redis_client
+    return app
+
+
+@pytest.fixture
+def task(celery_app: Celery) -> SimpleNamespace:
+    """The parts of a bound Celery task the progress reporters use."""
+    return SimpleNamespace(
+        request=SimpleNamespace(id="task-1"), backend=celery_app.backend
+    )
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+def api_settings() -> dict[str, str]:
+    """Extra environment for the API under test; modules override this fixture."""
+    return {}
+
+
+@pytest.fixture
+def process_redis(monkeypatch: pytest.MonkeyPatch) -> fakeredis.FakeRedis:
+    """Point the process-wide Redis clients at one fakeredis server."""
+    server = fakeredis.FakeServer()
+    sync_client = fakeredis.FakeRedis(server=server)
+    async_client = fakeredis.FakeAsyncRedis(server=server)
+
+    async def aclose() -> None:
+        return None
+
+    monkeypatch.setattr(process_redis_clients, "client", lambda url: sync_client)
+    monkeypatch.setattr(
+        process_redis_clients, "async_client", lambda url, config: async_client
+    )
+    monkeypatch.setattr(process_redis_clients, "aclose", aclose)
+    return sync_client
+
+
+@pytest.fixture
+def api_celery_app(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    api_settings: dict[str, str],
+    process_redis: fakeredis.FakeRedis,
+) -> Celery:
+    """The process Celery app, rebuilt on an in-memory broker and fakeredis."""
+    environment = {
+        "CELERY_BROKER_URL": "memory://",
+        "CELERY_RESULT_BACKEND": "redis://localhost:6379/0",
+        "BLOB_STORE_PATH": str(tmp_path / "blobs"),
+        "STATUS_WAIT_POLL_INTERVAL": "0.01",
+        **api_settings,
+    }
+    for name, value in environment.items():
+        monkeypatch.setenv(name, value)
+
+    # Celery builds one backend per thread, so every one gets the fake client.
+    monkeypatch.setattr(
+        RedisBackend, "_create_client", lambda backend, **params: process_redis
+    )
+    monkeypatch.setattr(CeleryApplication, "_instance", None)
+    return get_celery_application()
+
+
+@pytest.fixture
+async def api_client(api_celery_app: Celery) -> AsyncIterator[httpx.AsyncClient]:
+    """HTTP client for a fresh API whose lifespan runs around the test."""
+    app = create_app()
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            yield client
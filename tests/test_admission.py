@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pytest
+
+from application.services.admission import TokenBucketLimiter
+
+
+def test_burst_is_admitted_then_rejected_with_wait(clock) -> None:
+    limiter = TokenBucketLimiter(rate=2.0, burst=3, max_clients=10, clock=clock)
+
+    assert [limiter.acquire("client") for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.acquire("client") == pytest.approx(0.5)
+
+
+def test_tokens_refill_at_rate_up_to_burst(clock) -> None:
+    limiter = TokenBucketLimiter(rate=2.0, burst=2, max_clients=10, clock=clock)
+    limiter.acquire("client")
+    limiter.acquire("client")
+
+    clock.now = 0.5
+    assert limiter.acquire("client") == 0.0
+    assert limiter.acquire("client") > 0
+
+    clock.now = 100.0
+    assert [limiter.acquire("client") for _ in range(2)] == [0.0, 0.0]
+    assert limiter.acquire("client") > 0
+
+
+def test_clients_have_separate_buckets(clock) -> None:
+    limiter = TokenBucketLimiter(rate=1.0, burst=1, max_clients=10, clock=clock)
+
+    assert limiter.acquire("a") == 0.0
+    assert limiter.acquire("a") > 0
+    assert limiter.acquire("b") == 0.0
+
+
+def test_evicted_client_starts_with_full_burst(clock) -> None:
+    limiter = TokenBucketLimiter(rate=1.0, burst=1, max_clients=1, clock=clock)
+    limiter.acquire("a")
+    limiter.acquire("b")
+
+    assert limiter.acquire("a") == 0.0
+
+
+def test_zero_rate_disables_limiting(clock) -> None:
+    limiter = TokenBucketLimiter(rate=0.0, burst=1, max_clients=10, clock=clock)
+
+    assert not limiter.enabled
+    assert all(limiter.acquire("client") == 0.0 for _ in range(100))
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+from celery import Celery
+
+from infrastructure.celery.progress import PROGRESS_STATE, store_progress
+from infrastructure.redis import ProgressEventPublisher
+from infrastructure.storage import SQLiteResultArchive
+
+pytestmark = pytest.mark.anyio
+
+
+def _report_progress(app: Celery, task_id: str, version: int) -> None:
+    progress = {"current": version, "total": 10, "version": version}
+    store_progress(app.backend, task_id, progress)
+    ProgressEventPublisher().publish(task_id, {"state": PROGRESS_STATE, **progress})
+
+
+async def test_cancel_unknown_task_is_not_found(api_client: httpx.AsyncClient) -> None:
+    response = await api_client.delete("/api/tasks/never-issued")
+
+    assert response.status_code == 404
+
+
+async def test_cancel_finished_task_conflicts(
+    api_client: httpx.AsyncClient, api_celery_app: Celery
+) -> None:
+    api_celery_app.backend.store_result("task-1", {"ok": True}, "SUCCESS")
+
+    response = await api_client.delete("/api/tasks/task-1")
+
+    assert response.status_code == 409
+
+
+async def test_cancel_submitted_task_is_accepted(
+    api_client: httpx.AsyncClient,
+) -> None:
+    submitted = await api_client.post("/api/tasks/process", json={"text": "hello"})
+    task_id = submitted.json()["task_id"]
+
+    response = await api_client.delete(f"/api/tasks/{task_id}")
+
+    assert response.status_code == 202
+
+
+async def test_identical_text_reuses_the_task(api_client: httpx.AsyncClient) -> None:
+    first = await api_client.post("/api/tasks/process", json={"text": "same"})
+    again = await api_client.post("/api/tasks/process", json={"text": "same"})
+    other = await api_client.post("/api/tasks/process", json={"text": "other"})
+
+    assert again.json()["task_id"] == first.json()["task_id"]
+    assert other.json()["task_id"] != first.json()["task_id"]
+
+
+async def test_idempotency_key_reuses_the_task(api_client: httpx.AsyncClient) -> None:
+    headers = {"Idempotency-Key": "order-1"}
+    first = await api_client.post(
+        "/api/tasks/process", json={"text": "first"}, headers=headers
+    )
+    again = await api_client.post(
+        "/api/tasks/process", json={"text": "edited"}, headers=headers
+    )
+
+    assert again.json()["task_id"] == first.json()["task_id"]
+
+
+async def test_failed_task_is_submitted_again(
+    api_client: httpx.AsyncClient, api_celery_app: Celery
+) -> None:
+    first = await api_client.post("/api/tasks/process", json={"text": "flaky"})
+    task_id = first.json()["task_id"]
+    api_celery_app.backend.mark_as_failure(task_id, RuntimeError("boom"))
+
+    again = await api_client.post("/api/tasks/process", json={"text": "flaky"})
+
+    assert again.json()["task_id"] != task_id
+
+
+async def test_small_quick_analysis_is_answered_inline(
+    api_client: httpx.AsyncClient,
+) -> None:
+    response = await api_client.post(
+        "/api/tasks/quick-analysis", params={"sync": "true"}, json={"text": "a b c"}
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["state"] == "SUCCESS"
+    assert body["result"]["word_count"] == 3
+
+
+async def test_quick_analysis_is_queued_when_not_sync(
+    api_client: httpx.AsyncClient,
+) -> None:
+    response = await api_client.post(
+        "/api/tasks/quick-analysis", params={"sync": "false"}, json={"text": "a b c"}
+    )
+
+    assert response.status_code == 202
+    assert "task_id" in response.json()
+
+
+async def test_blank_quick_analysis_is_a_bad_request(
+    api_client: httpx.AsyncClient,
+) -> None:
+    response = await api_client.post("/api/tasks/quick-analysis", json={"text": " "})
+
+    assert response.status_code == 400
+
+
+async def test_archived_result_is_read_back(
+    api_client: httpx.AsyncClient, api_celery_app: Celery
+) -> None:
+    backend = api_celery_app.backend
+    backend.store_result("task-1", {"word_count": 2}, "SUCCESS")
+    key = backend.get_key_for_task("task-1")
+    SQLiteResultArchive().put_many({"task-1": backend.client.get(key)})
+    backend.client.delete(key)
+
+    status_response = await api_client.get("/api/tasks/task-1/status")
+    result_response = await api_client.get("/api/tasks/task-1/result")
+
+    assert status_response.json()["state"] == "SUCCESS"
+    assert result_response.json()["result"] == {"word_count": 2}
+
+
+async def test_unchanged_status_is_not_modified(
+    api_client: httpx.AsyncClient, api_celery_app: Celery
+) -> None:
+    _report_progress(api_celery_app, "task-1", 1)
+    first = await api_client.get("/api/tasks/task-1/status")
+    etag = first.headers["ETag"]
+
+    unchanged = await api_client.get(
+        "/api/tasks/task-1/status", headers={"If-None-Match": etag}
+    )
+    _report_progress(api_celery_app, "task-1", 2)
+    changed = await api_client.get(
+        "/api/tasks/task-1/status", headers={"If-None-Match": etag}
+    )
+
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+async def test_status_wait_returns_on_the_next_change(
+    api_client: httpx.AsyncClient, api_celery_app: Celery
+) -> None:
+    _report_progress(api_celery_app, "task-1", 1)
+    etag = (await api_client.get("/api/tasks/task-1/status")).headers["ETag"]
+
+    waiting = asyncio.create_task(
+        api_client.get(
+            "/api/tasks/task-1/status",
+            params={"wait": 5},
+            headers={"If-None-Match": etag},
+        )
+    )
+    await asyncio.sleep(0.05)
+    _report_progress(api_celery_app, "task-1", 2)
+    response = await asyncio.wait_for(waiting, 2)
+
+    assert response.status_code == 200
+    assert response.json()["version"] == 2
+
+
+async def test_status_wait_times_out_unchanged(
+    api_client: httpx.AsyncClient, api_celery_app: Celery
+) -> None:
+    _report_progress(api_celery_app, "task-1", 1)
+    etag = (await api_client.get("/api/tasks/task-1/status")).headers["ETag"]
+
+    response = await api_client.get(
+        "/api/tasks/task-1/status",
+        params={"wait": 0.1},
+        headers={"If-None-Match": etag},
+    )
+
+    assert response.status_code == 304
+
+
+async def test_batch_submission_is_tracked_as_a_group(
+    api_client: httpx.AsyncClient, api_celery_app: Celery
+) -> None:
+    submitted = await api_client.post(
+        "/api/tasks/process:batch", json={"texts": ["one", "two"]}
+    )
+    body = submitted.json()
+    api_celery_app.backend.store_result(body["task_ids"][0], {}, "SUCCESS")
+
+    group = await api_client.get(f"/api/tasks/groups/{body['group_id']}/status")
+
+    assert submitted.status_code == 202
+    assert len(body["task_ids"]) == 2
+    assert group.json()["finished"] == 1
+    assert group.json()["state"] == "PROGRESS"
+
+
+async def test_batch_with_blank_texts_names_their_indexes(
+    api_client: httpx.AsyncClient,
+) -> None:
+    response = await api_client.post(
+        "/api/tasks/process:batch", json={"texts": ["one", "", " "]}
+    )
+
+    assert response.status_code == 400
+    assert "indexes: 1, 2" in response.json()["detail"]
+
+
+async def test_batch_lookups_answer_every_distinct_id(
+    api_client: httpx.AsyncClient, api_celery_app: Celery
+) -> None:
+    api_celery_app.backend.store_result("done", {"word_count": 1}, "SUCCESS")
+    _report_progress(api_celery_app, "running", 3)
+    task_ids = ["done", "running", "done", "unknown"]
+
+    statuses = await api_client.post(
+        "/api/tasks/status:batch", json={"task_ids": task_ids}
+    )
+    results = await api_client.post(
+        "/api/tasks/result:batch", json={"task_ids": task_ids}
+    )
+
+    tasks = statuses.json()["tasks"]
+    assert list(tasks) == ["done", "running", "unknown"]
+    assert [task["state"] for task in tasks.values()] == [
+        "SUCCESS",
+        "PROGRESS",
+        "PENDING",
+    ]
+    assert "result" not in tasks["done"]
+    assert results.json()["tasks"]["done"]["result"] == {"word_count": 1}
+
+
+async def test_empty_batch_lookup_is_a_bad_request(
+    api_client: httpx.AsyncClient,
+) -> None:
+    response = await api_client.post("/api/tasks/status:batch", json={"task_ids": []})
+
+    assert response.status_code == 400
+
+
+async def test_small_quick_batch_is_answered_inline(
+    api_client: httpx.AsyncClient,
+) -> None:
+    response = await api_client.post(
+        "/api/tasks/quick-analysis:batch", json={"texts": ["a b", " ", "c"]}
+    )
+
+    assert response.status_code == 200
+    result = response.json()["result"]
+    assert [item.get("word_count") for item in result["results"]] == [2, None, 1]
+    assert result["aggregates"]["error_count"] == 1
+
+
+async def test_quick_batch_is_queued_when_not_sync(
+    api_client: httpx.AsyncClient,
+) -> None:
+    response = await api_client.post(
+        "/api/tasks/quick-analysis:batch",
+        params={"sync": "false"},
+        json={"texts": ["a b"]},
+    )
+
+    assert response.status_code == 202
+    assert "task_id" in response.json()
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def api_settings() -> dict[str, str]:
+    return {"CLIENT_RATE_LIMIT": "0.001", "CLIENT_RATE_BURST": "1"}
+
+
+async def test_new_work_over_the_rate_limit_is_rejected(
+    api_client: httpx.AsyncClient,
+) -> None:
+    first = await api_client.post("/api/tasks/process", json={"text": "first"})
+    second = await api_client.post("/api/tasks/process", json={"text": "second"})
+
+    assert first.status_code == 202
+    assert second.status_code == 429
+    assert int(second.headers["Retry-After"]) >= 1
+
+
+async def test_resubmission_is_answered_without_a_token(
+    api_client: httpx.AsyncClient,
+) -> None:
+    first = await api_client.post("/api/tasks/process", json={"text": "same"})
+    again = await api_client.post("/api/tasks/process", json={"text": "same"})
+
+    assert again.status_code == 202
+    assert again.json() == first.json()
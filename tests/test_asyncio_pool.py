@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from celery import Celery
+from celery.app.trace import trace_task_ret
+from celery.exceptions import Ignore
+from celery.utils import uuid
+
+from infrastructure.celery.asyncio_pool import AsyncioTaskPool, AwaitableTask
+
+STEP_SECONDS = 0.2
+
+
+@pytest.fixture
+def app() -> Celery:
+    app = Celery("asyncio-pool-test", broker="memory://", backend="cache+memory://")
+
+    @app.task(bind=True, base=AwaitableTask, name="wait")
+    async def wait(self, seconds: float) -> list[str]:
+        before = self.request.id
+        await asyncio.sleep(seconds)
+        return [before, self.request.id]
+
+    @app.task(bind=True, base=AwaitableTask, name="fail")
+    async def fail(self) -> None:
+        await asyncio.sleep(0)
+        raise RuntimeError("step failed")
+
+    @app.task(bind=True, base=AwaitableTask, name="ignore")
+    async def ignore(self) -> None:
+        await asyncio.sleep(0)
+        raise Ignore()
+
+    @app.task(name="plain")
+    def plain(value: int) -> int:
+        return value * 2
+
+    return app
+
+
+@pytest.fixture
+def pool(app: Celery) -> Iterator[AsyncioTaskPool]:
+    pool = AsyncioTaskPool(limit=8, app=app, initargs=(app, None))
+    pool.start()
+    yield pool
+    pool.stop()
+
+
+def _apply(
+    pool: AsyncioTaskPool, name: str, args: tuple[Any, ...], outcomes: dict[str, Any]
+) -> str:
+    task_id = uuid()
+    pool.apply_async(
+        trace_task_ret,
+        args=(name, task_id, {"id": task_id}, (args, {}, None), None, None),
+        kwargs={"app": pool.app},
+        callback=lambda outcome: outcomes.__setitem__(task_id, outcome),
+    )
+    return task_id
+
+
+def test_awaiting_tasks_share_the_loop(app: Celery, pool: AsyncioTaskPool) -> None:
+    outcomes: dict[str, Any] = {}
+    started = time.monotonic()
+    task_ids = [_apply(pool, "wait", (STEP_SECONDS,), outcomes) for _ in range(8)]
+    pool.stop()
+
+    assert time.monotonic() - started < STEP_SECONDS * 3
+    for task_id in task_ids:
+        failed, _result, _runtime = outcomes[task_id]
+        assert not failed
+        result = app.AsyncResult(task_id)
+        assert result.state == "SUCCESS"
+        # Each task saw its own request before and after interleaving.
+        assert result.result == [task_id, task_id]
+
+
+def test_failures_and_ignores_are_traced(app: Celery, pool: AsyncioTaskPool) -> None:
+    outcomes: dict[str, Any] = {}
+    failed_id = _apply(pool, "fail", (), outcomes)
+    ignored_id = _apply(pool, "ignore", (), outcomes)
+    pool.stop()
+
+    failed, einfo, _runtime = outcomes[failed_id]
+    assert failed
+    assert isinstance(einfo.exception, RuntimeError)
+    assert app.AsyncResult(failed_id).state == "FAILURE"
+    failed, einfo, _runtime = outcomes[ignored_id]
+    assert failed
+    assert isinstance(einfo.exception.exc, Ignore)
+    assert app.AsyncResult(ignored_id).state == "PENDING"
+
+
+def test_plain_tasks_run_on_threads(app: Celery, pool: AsyncioTaskPool) -> None:
+    outcomes: dict[str, Any] = {}
+    task_id = _apply(pool, "plain", (21,), outcomes)
+    pool.stop()
+
+    assert outcomes[task_id][0] == 0
+    assert app.AsyncResult(task_id).result == 42
+
+
+def test_awaitable_task_runs_to_completion_outside_the_pool(app: Celery) -> None:
+    task_id = uuid()
+
+    result = app.tasks["wait"].apply(args=(0,), task_id=task_id)
+
+    assert result.get() == [task_id, task_id]
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import pytest
+
+from infrastructure.celery.cancellation import CancellationCheck, TaskCancelledError
+from infrastructure.redis import RedisConfig, TaskCancellationFlags
+
+
+@pytest.fixture
+def flags(redis_clients) -> TaskCancellationFlags:
+    config = RedisConfig()
+    config.cancellation_ttl = 60
+    return TaskCancellationFlags(config, redis_clients)
+
+
+def test_first_check_reads_the_flag(flags: TaskCancellationFlags, clock) -> None:
+    flags.request("task-1")
+    check = CancellationCheck(flags, "task-1", min_interval=10, clock=clock)
+
+    with pytest.raises(TaskCancelledError):
+        check.raise_if_requested()
+
+
+def test_flag_is_read_at_most_once_per_interval(
+    flags: TaskCancellationFlags, clock
+) -> None:
+    check = CancellationCheck(flags, "task-1", min_interval=10, clock=clock)
+    check.raise_if_requested()
+    flags.request("task-1")
+
+    clock.now = 9.9
+    check.raise_if_requested()
+
+    clock.now = 10.0
+    with pytest.raises(TaskCancelledError):
+        check.raise_if_requested()
+
+
+def test_other_tasks_are_not_cancelled(flags: TaskCancellationFlags, clock) -> None:
+    flags.request("task-2")
+    check = CancellationCheck(flags, "task-1", min_interval=0, clock=clock)
+
+    check.raise_if_requested()
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import numpy as np
+from celery import Celery
+from kombu.serialization import dumps, loads
+
+from infrastructure.celery.serialization import ORJSON_SERIALIZER
+from infrastructure.codec import dumps_json, loads_json
+
+
+def test_json_round_trip() -> None:
+    value = {"text": "ünïcode", "count": 3, "ratio": 0.5, "items": [1, None, True]}
+
+    assert loads_json(dumps_json(value)) == value
+    assert loads_json(dumps_json(value).decode()) == value
+
+
+def test_types_outside_json_are_encoded_like_kombu_json() -> None:
+    encoded = dumps_json(
+        {
+            "bytes": b"raw",
+            "decimal": Decimal("1.50"),
+            "set": {1},
+            "array": np.arange(3),
+            1: "non-string key",
+        }
+    )
+
+    assert loads_json(encoded) == {
+        "bytes": "raw",
+        "decimal": "1.50",
+        "set": [1],
+        "array": [0, 1, 2],
+        "1": "non-string key",
+    }
+
+
+def test_datetimes_are_encoded_as_iso_8601() -> None:
+    moment = datetime(2026, 1, 2, 3, 4, 5, 678_000, tzinfo=timezone.utc)
+
+    decoded = loads_json(dumps_json({"at": moment, "day": date(2026, 1, 2)}))
+
+    assert datetime.fromisoformat(decoded["at"]) == moment
+    assert date.fromisoformat(decoded["day"]) == date(2026, 1, 2)
+
+
+def test_kombu_serializer_round_trips_task_messages(celery_app: Celery) -> None:
+    body = (("some text",), {"settings": {"steps": 3}}, {"callbacks": None})
+
+    content_type, encoding, payload = dumps(body, serializer=ORJSON_SERIALIZER)
+
+    assert isinstance(payload, bytes)
+    assert loads(payload, content_type, encoding) == [
+        ["some text"],
+        {"settings": {"steps": 3}},
+        {"callbacks": None},
+    ]
+
+
+def test_stored_results_keep_their_completion_time(celery_app: Celery) -> None:
+    result = {"word_count": 2, "processed_text": "done"}
+    before = datetime.now(timezone.utc)
+
+    celery_app.backend.store_result("task-1", result, "SUCCESS")
+    stored = celery_app.AsyncResult("task-1")
+
+    assert stored.result == result
+    assert isinstance(stored.date_done, datetime)
+    assert stored.date_done >= before.replace(microsecond=0)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+from domain.text_processing import compute_progress
+from infrastructure.celery.progress import (
+    ProgressReporter,
+    ProgressThrottle,
+    ShardProgressReporter,
+    store_progress,
+)
+from models.task_models import ProgressUpdate
+
+
+class RecordingPublisher:
+    def __init__(self) -> None:
+        self.events: list[tuple[str, dict[str, Any]]] = []
+
+    def publish(self, task_id: str, payload: dict[str, Any]) -> None:
+        self.events.append((task_id, payload))
+
+
+def _update(current: int, total: int = 10) -> ProgressUpdate:
+    progress = compute_progress(current, total)
+    return ProgressUpdate(
+        current=current, total=total, progress=progress, status=f"{progress}%"
+    )
+
+
+def _stored(task: SimpleNamespace, task_id: str = "task-1") -> dict[str, Any]:
+    return task.backend.get_task_meta(task_id)
+
+
+def test_reporter_coalesces_updates_between_thresholds(
+    task: SimpleNamespace, clock
+) -> None:
+    publisher = RecordingPublisher()
+    throttle = ProgressThrottle(min_interval=10, min_delta=50, clock=clock)
+    reporter = ProgressReporter(task, throttle, publisher=publisher)
+
+    written = [reporter.report(_update(step)) for step in range(1, 10)]
+
+    # The first update, then the one 50 points further on.
+    assert written == [True, False, False, False, False, True, False, False, False]
+    assert _stored(task)["result"]["current"] == 6
+
+    reporter.flush()
+    assert _stored(task)["result"]["current"] == 9
+    assert [event["version"] for _, event in publisher.events] == [1, 6, 9]
+
+    clock.now = 10.0
+    assert reporter.report(_update(10))
+    assert _stored(task)["result"]["version"] == 10
+
+
+def test_flush_without_pending_update_writes_nothing(task: SimpleNamespace) -> None:
+    publisher = RecordingPublisher()
+    throttle = ProgressThrottle(min_interval=0, min_delta=0)
+    reporter = ProgressReporter(task, throttle, publisher=publisher)
+    reporter.report(_update(1))
+
+    reporter.flush()
+
+    assert len(publisher.events) == 1
+
+
+def _shard_reporter(
+    task: SimpleNamespace, total_steps: int, publisher: RecordingPublisher | None = None
+) -> ShardProgressReporter:
+    throttle = ProgressThrottle(min_interval=0, min_delta=0)
+    return ShardProgressReporter(
+        task, throttle, parent_id="parent", total_steps=total_steps, publisher=publisher
+    )
+
+
+def test_shards_advance_one_parent_counter(task: SimpleNamespace) -> None:
+    publisher = RecordingPublisher()
+    shards = [_shard_reporter(task, 6, publisher) for _ in range(2)]
+
+    for _ in range(3):
+        for shard in shards:
+            assert shard.advance("Processing")
+
+    stored = _stored(task, "parent")
+    assert stored["status"] == "PROGRESS"
+    assert stored["result"]["current"] == 6
+    assert stored["result"]["version"] == 6
+    assert stored["result"]["progress"] == 100
+    versions = [event["version"] for _, event in publisher.events]
+    assert versions == sorted(versions) == list(range(1, 7))
+
+
+def test_final_parent_state_is_never_replaced(task: SimpleNamespace) -> None:
+    task.backend.store_result("parent", {"done": True}, "SUCCESS")
+
+    assert not _shard_reporter(task, 10).advance("Processing")
+    assert _stored(task, "parent")["status"] == "SUCCESS"
+
+
+def test_stored_version_never_goes_backwards(task: SimpleNamespace) -> None:
+    backend = task.backend
+    newer = {**_update(5).model_dump(), "version": 5}
+    older = {**_update(3).model_dump(), "version": 3}
+
+    assert store_progress(backend, "task-1", newer)
+    assert not store_progress(backend, "task-1", older)
+    assert _stored(task)["result"]["version"] == 5
+
+
+def test_progress_never_replaces_a_final_state(task: SimpleNamespace) -> None:
+    backend = task.backend
+    backend.store_result("task-1", {"done": True}, "SUCCESS")
+
+    progress = {**_update(9).model_dump(), "version": 9}
+    assert not store_progress(backend, "task-1", progress)
+    assert _stored(task)["status"] == "SUCCESS"
+
+
+def test_shards_do_not_overwrite_newer_progress(task: SimpleNamespace) -> None:
+    store_progress(task.backend, "parent", {**_update(8).model_dump(), "version": 8})
+    before = _stored(task, "parent")
+
+    assert not _shard_reporter(task, 10).advance("Processing")
+    assert _stored(task, "parent") == before
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import asyncio
+
+import fakeredis
+import pytest
+
+from application.services import ProgressStreamService
+from infrastructure.redis import ProgressEventPublisher, progress_channel
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_only_watched_tasks_are_subscribed(
+    process_redis: fakeredis.FakeRedis,
+) -> None:
+    stream = ProgressStreamService()
+    try:
+        async with stream.subscribe("task-1") as updates:
+            assert process_redis.pubsub_channels() == [
+                progress_channel("task-1").encode()
+            ]
+            ProgressEventPublisher().publish("task-2", {"progress": 5})
+            ProgressEventPublisher().publish("task-1", {"progress": 10})
+
+            assert await asyncio.wait_for(updates.get(), 1) == {"progress": 10}
+
+        assert process_redis.pubsub_channels() == []
+    finally:
+        await stream.aclose()
+
+
+async def test_every_subscriber_of_a_task_gets_its_events(
+    process_redis: fakeredis.FakeRedis,
+) -> None:
+    stream = ProgressStreamService()
+    try:
+        async with stream.subscribe("task-1") as first:
+            async with stream.subscribe("task-1") as second:
+                ProgressEventPublisher().publish("task-1", {"progress": 10})
+
+                assert await asyncio.wait_for(first.get(), 1) == {"progress": 10}
+                assert await asyncio.wait_for(second.get(), 1) == {"progress": 10}
+
+            assert process_redis.pubsub_channels() == [
+                progress_channel("task-1").encode()
+            ]
+    finally:
+        await stream.aclose()
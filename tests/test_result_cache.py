@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from application.services.result_cache import (
+    ArchiveMissCache,
+    TerminalResultCache,
+    estimate_payload_size,
+)
+
+
+def _payload(task_id: str, text: str = "done") -> dict[str, str]:
+    return {"state": "SUCCESS", "task_id": task_id, "result": text}
+
+
+def test_cached_payload_is_served_until_ttl(clock) -> None:
+    cache = TerminalResultCache(max_bytes=10_000, ttl_seconds=10, clock=clock)
+    cache.put("a", _payload("a"))
+
+    found, missing = cache.get_many(["a", "b"])
+    assert found == {"a": _payload("a")}
+    assert missing == ["b"]
+
+    clock.now = 10.0
+    found, missing = cache.get_many(["a"])
+    assert found == {}
+    assert missing == ["a"]
+    assert cache.stats()["entries"] == 0
+
+
+def test_unfinished_payloads_are_not_cached() -> None:
+    cache = TerminalResultCache(max_bytes=10_000, ttl_seconds=10)
+    cache.put("a", {"state": "PROGRESS", "progress": 50})
+
+    assert cache.get_many(["a"]) == ({}, ["a"])
+
+
+def test_least_recently_used_entries_are_evicted_by_size() -> None:
+    entry_size = estimate_payload_size(_payload("a"))
+    cache = TerminalResultCache(max_bytes=entry_size * 2, ttl_seconds=10)
+    cache.put("a", _payload("a"))
+    cache.put("b", _payload("b"))
+    cache.get_many(["a"])
+    cache.put("c", _payload("c"))
+
+    found, missing = cache.get_many(["a", "b", "c"])
+    assert set(found) == {"a", "c"}
+    assert missing == ["b"]
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] <= stats["max_bytes"]
+
+
+def test_payload_larger_than_budget_is_skipped() -> None:
+    cache = TerminalResultCache(max_bytes=100, ttl_seconds=10)
+    cache.put("a", _payload("a", "x" * 1_000))
+
+    assert cache.stats()["entries"] == 0
+
+
+def test_archive_misses_expire(clock) -> None:
+    misses = ArchiveMissCache(ttl_seconds=5, clock=clock)
+    misses.add(["a"])
+
+    assert misses.unknown(["a", "b"]) == ["b"]
+    clock.now = 5.0
+    assert misses.unknown(["a", "b"]) == ["a", "b"]
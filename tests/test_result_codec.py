@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from infrastructure.storage.result_codec import (
+    PROCESSED_TEXT_ENCODING,
+    pack_result,
+    unpack_result,
+)
+
+
+def test_long_text_round_trips_compressed() -> None:
+    payload = {"task_id": "a", "processed_text": "Step 1: ünïcode " * 200}
+
+    packed = pack_result(payload, threshold=100)
+
+    assert packed["processed_text_encoding"] == PROCESSED_TEXT_ENCODING
+    assert len(packed["processed_text"]) < len(payload["processed_text"])
+    unpacked = unpack_result(packed)
+    assert unpacked["processed_text"] == payload["processed_text"]
+    assert unpacked["task_id"] == "a"
+
+
+def test_short_text_and_disabled_threshold_are_left_alone() -> None:
+    payload = {"processed_text": "short"}
+
+    assert pack_result(payload, threshold=100) is payload
+    assert pack_result({"processed_text": "x" * 500}, threshold=0) == {
+        "processed_text": "x" * 500
+    }
+
+
+def test_unpacked_payloads_pass_through() -> None:
+    payload = {"processed_text": "plain", "processed_text_encoding": None}
+
+    assert unpack_result(payload) is payload
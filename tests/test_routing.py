@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+
+from infrastructure.celery.routing import (
+    ARCHIVE_RESULTS_TASK,
+    MERGE_TEXT_SHARDS_TASK,
+    PROCESS_TEXT_SHARD_TASK,
+    PROCESS_TEXT_TASK,
+    QUICK_ANALYSIS_BATCH_TASK,
+    QUICK_ANALYSIS_TASK,
+    TaskRouter,
+)
+
+
+@pytest.fixture
+def router() -> TaskRouter:
+    return TaskRouter("interactive", "bulk", bulk_text_threshold=10)
+
+
+def _queue(router: TaskRouter, name: str, args=None, kwargs=None) -> str | None:
+    route = router(name, args, kwargs, {})
+    return route["queue"] if route else None
+
+
+@pytest.mark.parametrize(
+    "name", [PROCESS_TEXT_SHARD_TASK, MERGE_TEXT_SHARDS_TASK, ARCHIVE_RESULTS_TASK]
+)
+def test_bulk_tasks_go_to_bulk_queue(router: TaskRouter, name: str) -> None:
+    assert _queue(router, name, ("short",)) == "bulk"
+
+
+def test_quick_analysis_is_always_interactive(router: TaskRouter) -> None:
+    assert _queue(router, QUICK_ANALYSIS_TASK, ("x" * 1_000,)) == "interactive"
+
+
+def test_text_processing_is_routed_by_size(router: TaskRouter) -> None:
+    assert _queue(router, PROCESS_TEXT_TASK, ("x" * 10,)) == "interactive"
+    assert _queue(router, PROCESS_TEXT_TASK, ("x" * 11,)) == "bulk"
+    assert _queue(router, PROCESS_TEXT_TASK, kwargs={"text": "x" * 11}) == "bulk"
+
+
+def test_batches_are_routed_by_total_size(router: TaskRouter) -> None:
+    assert _queue(router, QUICK_ANALYSIS_BATCH_TASK, (["x" * 5] * 2,)) == "interactive"
+    assert _queue(router, QUICK_ANALYSIS_BATCH_TASK, (["x" * 5] * 3,)) == "bulk"
+    assert (
+        _queue(router, QUICK_ANALYSIS_BATCH_TASK, kwargs={"texts": ["x" * 11]})
+        == "bulk"
+    )
+
+
+def test_unknown_tasks_keep_default_routing(router: TaskRouter) -> None:
+    assert _queue(router, "other.task", ("x" * 100,)) is None
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from infrastructure.redis import RedisConfig, TaskSubmissionRegistry
+from infrastructure.redis.clients import RedisClientFactory
+
+
+def test_markers_are_skipped_without_a_redis_url() -> None:
+    config = RedisConfig()
+    config.url = "cache+memory://"
+    config.submitted_ttl = 60
+    registry = TaskSubmissionRegistry(config, RedisClientFactory())
+
+    registry.mark_submitted(["task-1"])
+
+    assert registry.was_submitted("task-1")
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from itertools import pairwise
+
+import pytest
+
+from domain.batch_analysis import analyze_quick_batch, analyze_text_batch
+from domain.text_processing import (
+    EMPTY_TEXT_ERROR,
+    TextStatistics,
+    analyze_text_quick,
+    iter_chunk_bounds,
+    plan_shards,
+)
+
+TEXTS = [
+    "",
+    " ",
+    "one",
+    "two words",
+    "  padded\ttabs\nand lines  ",
+    "1234 5678",
+    "ünïcödé wörds",
+    # Astral characters: an emoji and mathematical letters.
+    "emoji \U0001f642 and \U0001d518\U0001d52b\U0001d526",
+    "\u3000ideographic\u3000space",
+    "no-break\u00a0space",
+]
+
+
+def _statistics(
+    text: str, chunk_size: int, ends_inside_word: bool = False
+) -> TextStatistics:
+    statistics = TextStatistics(ends_inside_word=ends_inside_word)
+    for start, end in iter_chunk_bounds(text, chunk_size):
+        statistics.add(text[start:end])
+    return statistics
+
+
+@pytest.mark.parametrize("shard_size", [1, 16, 50, 10_000])
+def test_shards_cover_text_on_chunk_bounds(shard_size: int) -> None:
+    text = "alpha beta gamma delta " * 20 + "unterminatedword" * 5
+    chunk_size = 12
+
+    shards = plan_shards(text, chunk_size, shard_size)
+
+    assert [shard.index for shard in shards] == list(range(len(shards)))
+    assert shards[0].start == 0
+    assert shards[-1].end == len(text)
+    assert all(previous.end == shard.start for previous, shard in pairwise(shards))
+    assert sum(shard.chunk_count for shard in shards) == len(
+        list(iter_chunk_bounds(text, chunk_size))
+    )
+
+
+@pytest.mark.parametrize("chunk_size,shard_size", [(5, 7), (8, 8), (13, 40)])
+def test_merged_shard_counts_match_whole_text(chunk_size: int, shard_size: int) -> None:
+    # Long words force chunks, and so shards, to start in the middle of a word.
+    text = "supercalifragilistic words  and\tmore\nwords " * 6 + "tail"
+    whole = _statistics(text, chunk_size)
+
+    shard_statistics = [
+        _statistics(text[shard.start : shard.end], chunk_size, shard.continues_word)
+        for shard in plan_shards(text, chunk_size, shard_size)
+    ]
+
+    assert sum(stats.word_count for stats in shard_statistics) == whole.word_count
+    assert sum(stats.char_count for stats in shard_statistics) == whole.char_count
+    assert whole.word_count == len(text.split())
+
+
+def test_quick_batch_answers_blank_texts_per_item() -> None:
+    analysis = analyze_quick_batch(["a b", "", "  ", "c"])
+
+    assert analysis["results"] == [
+        analyze_text_quick("a b"),
+        {"error": EMPTY_TEXT_ERROR},
+        {"error": EMPTY_TEXT_ERROR},
+        analyze_text_quick("c"),
+    ]
+    assert analysis["aggregates"]["text_count"] == 2
+    assert analysis["aggregates"]["word_count"] == 3
+    assert analysis["aggregates"]["error_count"] == 2
+
+
+def test_batch_analysis_matches_per_text_analysis() -> None:
+    results, aggregates = analyze_text_batch(TEXTS)
+
+    assert results == [analyze_text_quick(text) for text in TEXTS]
+    assert aggregates == {
+        "text_count": len(TEXTS),
+        "word_count": sum(len(text.split()) for text in TEXTS),
+        "char_count": sum(len(text) for text in TEXTS),
+        "texts_with_letters": sum(
+            any(char.isalpha() for char in text) for text in TEXTS
+        ),
+    }
+
+
+def test_batch_classifies_every_ascii_character_like_str() -> None:
+    texts = [chr(code) + "x" for code in range(128)]
+
+    results, _ = analyze_text_batch(texts)
+
+    assert results == [analyze_text_quick(text) for text in texts]
+
+
+def test_mostly_non_ascii_batch_matches_per_text_analysis() -> None:
+    texts = ["中文 字符", "日本語\u3000テキスト", "123", "x"]
+
+    results, _ = analyze_text_batch(texts)
+
+    assert results == [analyze_text_quick(text) for text in texts]
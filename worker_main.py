@@ -0,0 +1,86 @@
+"""Celery worker entrypoint starting a pool for selected queues."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+
+# Connects the worker-side signal handlers before the worker starts.
+from infrastructure.celery import signals  # noqa: F401
+from infrastructure.celery.app import get_celery_application, get_celery_config
+from infrastructure.celery.asyncio_pool import ASYNCIO_POOL, ASYNCIO_POOL_NAME
+from logging_config import LoggingConfig
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Start a worker tuned with the prefetch and ack settings of its queues."""
+    config = get_celery_config()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--queues",
+        default=",".join(queue.name for queue in config.queues),
+        help="Comma-separated queues to consume (default: all)",
+    )
+    parser.add_argument("--concurrency", type=int, default=None)
+    parser.add_argument(
+        "--pool",
+        default=None,
+        help=f"Celery pool, or {ASYNCIO_POOL_NAME!r} to await steps on an event loop",
+    )
+    parser.add_argument("--loglevel", default=LoggingConfig().level)
+    parser.add_argument(
+        "--beat",
+        action="store_true",
+        help="Also run the periodic scheduler; enable it on exactly one worker",
+    )
+    args = parser.parse_args(argv)
+
+    names = [name.strip() for name in args.queues.split(",") if name.strip()]
+    try:
+        settings = [config.queue_settings(name) for name in names]
+    except ValueError as exc:
+        parser.error(str(exc))
+    if len(settings) > 1:
+        logger.warning(
+            "Consuming %s from one pool; interactive latency is only isolated "
+            "with a dedicated worker per queue",
+            ", ".join(names),
+        )
+
+    # A pool serving several queues uses the most conservative settings.
+    acks_late = any(queue.acks_late for queue in settings)
+    app = get_celery_application()
+    app.conf.update(
+        worker_prefetch_multiplier=min(
+            queue.prefetch_multiplier for queue in settings
+        ),
+        task_acks_late=acks_late,
+        task_reject_on_worker_lost=acks_late,
+    )
+
+    worker_argv = [
+        "worker",
+        f"--queues={','.join(names)}",
+        f"--hostname={'-'.join(names)}@%h",
+        f"--loglevel={args.loglevel}",
+    ]
+    pool, concurrency = args.pool, args.concurrency
+    if pool == ASYNCIO_POOL_NAME:
+        # Celery's --pool only takes its own pool names; a configured pool
+        # class is used when the option is left out.
+        app.conf.worker_pool = ASYNCIO_POOL
+        pool = None
+        concurrency = concurrency or config.asyncio_concurrency
+    if concurrency:
+        worker_argv.append(f"--concurrency={concurrency}")
+    if pool:
+        worker_argv.append(f"--pool={pool}")
+    if args.beat:
+        worker_argv.append("--beat")
+    app.worker_main(worker_argv)
+
+
+if __name__ == "__main__":
+    main()